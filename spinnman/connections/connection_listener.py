@@ -101,6 +101,15 @@ class ConnectionListener(Thread, Generic[T]):
         """
         self.__callbacks.append(callback)
 
+    def remove_callback(self, callback: Callable[[T], None]) -> None:
+        """
+        Remove a callback previously added with :py:meth:`add_callback`.
+
+        :param callback: The callback to remove; ignored if not present
+        """
+        if callback in self.__callbacks:
+            self.__callbacks.remove(callback)
+
     def close(self) -> None:
         """
         Closes the listener.
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Optional
+from typing import Iterable, Optional
 
 from spinnman.messages.spinnaker_boot import SpinnakerBootMessage
 from spinnman.constants import UDP_BOOT_CONNECTION_DEFAULT_PORT
@@ -57,6 +57,32 @@ class BootConnection(UDPConnection):
         # Sleep between messages to avoid flooding the machine
         time.sleep(_ANTI_FLOOD_DELAY)
 
+    def send_boot_messages(
+            self, boot_messages: Iterable[SpinnakerBootMessage],
+            packet_delay: float = _ANTI_FLOOD_DELAY) -> None:
+        """
+        Sends a stream of SpiNNaker boot messages using this connection.
+
+        The messages are paced to go out one every `packet_delay` seconds,
+        counting the time taken to send each one, so as to avoid flooding
+        the machine; there is no wait after the last message.
+
+        :param boot_messages: The messages to be sent
+        :param packet_delay: The time in seconds between messages
+        :raise SpinnmanIOException:
+            If there is an error sending the messages
+        """
+        send_time: Optional[float] = None
+        for boot_message in boot_messages:
+            if send_time is not None:
+                wait = send_time - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            else:
+                send_time = time.monotonic()
+            self.send(boot_message.bytestring)
+            send_time += packet_delay
+
     def receive_boot_message(
             self, timeout: Optional[float] = None) -> SpinnakerBootMessage:
         """
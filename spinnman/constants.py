@@ -48,6 +48,17 @@ ROUTER_DIAGNOSTIC_FILTER_SIZE: int = 4
 #: Number of router diagnostic filters
 NO_ROUTER_DIAGNOSTIC_FILTERS: int = 16
 
+#: Column of the control register in an array of router diagnostics;
+#: the diagnostic counters are in the columns given by
+#: :py:class:`ROUTER_REGISTER_REGISTERS`
+ROUTER_DIAGNOSTICS_CONTROL_COLUMN: int = 16
+
+#: Column of the error status in an array of router diagnostics
+ROUTER_DIAGNOSTICS_ERROR_COLUMN: int = 17
+
+#: Number of columns in an array of router diagnostics
+N_ROUTER_DIAGNOSTICS_COLUMNS: int = 18
+
 #: The size of the system variable structure in bytes
 SYSTEM_VARIABLE_BYTES: int = 256
 
@@ -102,7 +113,7 @@ BMP_POWER_ON_TIMEOUT: float = 10.0
 #: Timeout for other BMP commands to reply
 BMP_TIMEOUT: float = 0.5
 
-#: Time to sleep after powering on boards
+#: Longest time to wait for boards to be up after powering them on
 BMP_POST_POWER_ON_SLEEP_TIME: float = 5.0
 
 
@@ -18,14 +18,15 @@ import logging
 import struct
 from threading import Condition
 import time
-from typing import (BinaryIO, Generator, Iterable, List, Mapping, Optional,
-                    Sequence, Union)
+from typing import (BinaryIO, Dict, Generator, Iterable, List, Mapping,
+                    Optional, Sequence, Tuple, Union)
 
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod)
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.logger_utils import warn_once
 from spinn_utilities.require_subclass import require_subclass
+from spinn_utilities.typing.coords import XY
 
 from spinn_machine import CoreSubsets
 
@@ -36,14 +37,15 @@ from spinnman.constants import (
 from spinnman.exceptions import SpinnmanException
 from spinnman.extended import (
     BMPSetLed, DeAllocSDRAMProcess, ReadADC, SetLED, WriteMemoryFloodProcess)
+from spinnman.extended.write_memory_flood_process import check_flood_size
 from spinnman.model import (
-    ADCInfo, DiagnosticFilter, ExecutableTargets, HeapElement, IOBuffer)
+    ADCInfo, DiagnosticFilter, ExecutableTargets, HeapElement, IOBuffer,
+    RouterConfiguration)
 from spinnman.model.enums import CPUState
 from spinnman.messages.scp.enums import Signal
 from spinnman.messages.scp.impl import (
     ReadMemory, ApplicationRun)
 from spinnman.connections.udp_packet_connections import SCAMPConnection
-from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
 from spinnman.data import SpiNNManDataView
 from spinnman.messages.scp.enums.led_action import LEDAction
 from spinnman.messages.spinnaker_boot import SystemVariableDefinition
@@ -56,9 +58,11 @@ from spinnman.transceiver.base_transceiver import (
     BaseTransceiver, _EXECUTABLE_ADDRESS)
 from spinnman.transceiver.extendable_transceiver import ExtendableTransceiver
 
-_ONE_BYTE = struct.Struct("B")
 _ONE_WORD = struct.Struct("<I")
 
+#: The number of different nearest neighbour IDs there are to use
+_N_NEAREST_NEIGHBOUR_IDS = 127
+
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
@@ -247,9 +251,10 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
         """
         assert isinstance(self, Transceiver)
         # Execute each of the binaries and get them in to a "wait" state
-        for binary in executable_targets.binaries:
-            core_subsets = executable_targets.get_cores_for_binary(binary)
-            self.execute_flood(core_subsets, binary, app_id, wait=True)
+        self.execute_flood_multi(
+            [(executable_targets.get_cores_for_binary(binary), binary)
+             for binary in executable_targets.binaries],
+            app_id, wait=True)
 
         # Sleep to allow cores to get going
         time.sleep(0.5)
@@ -437,7 +442,8 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
     def _get_next_nearest_neighbour_id(self) -> int:
         assert isinstance(self, ExtendableTransceiver)
         with self._nearest_neighbour_lock:
-            next_nearest_neighbour_id = (self._nearest_neighbour_id + 1) % 127
+            next_nearest_neighbour_id = (
+                self._nearest_neighbour_id + 1) % _N_NEAREST_NEIGHBOUR_IDS
             self._nearest_neighbour_id: int = next_nearest_neighbour_id
         return next_nearest_neighbour_id
 
@@ -487,6 +493,8 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
         assert isinstance(self, Transceiver)
         assert isinstance(self, ExtendableTransceiver)
         process = WriteMemoryFloodProcess(self.get_scamp_connection_selector())
+        # Every chip is written, so nothing loaded can be relied on
+        self._forget_loaded_executables()
         # Ensure only one flood fill occurs at any one time
         with self._flood_write_lock:
             # Start the flood fill
@@ -512,6 +520,43 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
                 process.write_memory_from_bytearray(
                     nearest_neighbour_id, base_address, data, offset, n_bytes)
 
+    def write_memory_floods(
+            self, writes: Sequence[Tuple[int, bytes]]) -> None:
+        """
+        Write several blocks of data to the SDRAM of all chips, with the
+        flood fills of the blocks overlapping rather than one after another.
+
+        :param writes:
+            For each block of data, the address in SDRAM where it is to be
+            written, and the data itself
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If any block of data is too big for one flood fill
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        assert isinstance(self, Transceiver)
+        assert isinstance(self, ExtendableTransceiver)
+        # Check every write before any is started
+        for _, data in writes:
+            check_flood_size(data)
+        process = WriteMemoryFloodProcess(self.get_scamp_connection_selector())
+        # Every chip is written, so nothing loaded can be relied on
+        self._forget_loaded_executables()
+        # Ensure only one set of flood fills occurs at any one time
+        with self._flood_write_lock:
+            # Each flood in progress needs an ID of its own
+            for start in range(0, len(writes), _N_NEAREST_NEIGHBOUR_IDS):
+                process.write_memory_floods([
+                    (self._get_next_nearest_neighbour_id(), base_address,
+                     data)
+                    for base_address, data in writes[
+                        start:start + _N_NEAREST_NEIGHBOUR_IDS]])
+
     def set_leds(self, x: int, y: int, cpu: int,
                  led_states: Mapping[int, int]) -> None:
         """
@@ -675,39 +720,28 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
             logger.info(self._where_is_xy(x, y))
             raise
 
-    def __set_watch_dog_on_chip(
-            self, x: int, y: int, watch_dog: Union[int, bool]) -> None:
+    def get_heaps(self, xys: Optional[Iterable[XY]] = None,
+                  heap: SystemVariableDefinition =
+                  SystemVariableDefinition.sdram_heap_address
+                  ) -> Dict[XY, Sequence[HeapElement]]:
         """
-        Enable, disable or set the value of the watch dog timer on a
-        specific chip.
+        Get the contents of the given heap on several chips at once.
 
-        .. warning::
-            This method is currently deprecated and untested as there is no
-            known use. Same functionality provided by ybug and bmpc.
-            Retained in case needed for hardware debugging.
+        The heaps are walked together, so this takes about as long as
+        reading the longest heap rather than the sum of them all.
 
-        :param x: chip X coordinate to write new watchdog parameter to
-        :param y: chip Y coordinate to write new watchdog parameter to
-        :param watch_dog:
-            Either a Boolean indicating whether to enable (True) or
-            disable (False) the watchdog timer, or an int value to set the
-            timer count to
+        :param xys:
+            The coordinates of the chips to read, or `None` for all chips
+            in the machine
+        :param heap:
+            The SystemVariableDefinition which is the heap to read
+        :returns: List of HeapElements for each chip
         """
-        # build what we expect it to be
-        warn_once(logger, "The set_watch_dog_on_chip method is deprecated "
-                          "and untested due to no known use.")
         assert isinstance(self, Transceiver)
-        value_to_set: Union[int, bool, bytes] = watch_dog
-        watchdog = SystemVariableDefinition.software_watchdog_count
-        if isinstance(watch_dog, bool):
-            value_to_set = watchdog.default if watch_dog else 0
-
-        # build data holder
-        data = _ONE_BYTE.pack(value_to_set)
-
-        # write data
-        address = SYSTEM_VARIABLE_BASE_ADDRESS + watchdog.offset
-        self.write_memory(x=x, y=y, base_address=address, data=data)
+        if xys is None:
+            xys = SpiNNManDataView.get_machine().chip_coordinates
+        process = GetHeapProcess(self.get_scamp_connection_selector())
+        return process.get_heaps(xys, heap)
 
     def set_watch_dog(self, watch_dog: Union[int, bool]) -> None:
         """
@@ -725,5 +759,8 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
         """
         warn_once(logger, "The set_watch_dog method is deprecated and "
                           "untested due to no known use.")
+        assert isinstance(self, Transceiver)
+        configuration = RouterConfiguration()
         for x, y in SpiNNManDataView.get_machine().chip_coordinates:
-            self.__set_watch_dog_on_chip(x, y, watch_dog)
+            configuration.add_watch_dog(x, y, watch_dog)
+        self.configure_routers(configuration)
@@ -13,19 +13,49 @@
 # limitations under the License.
 
 import math
-from typing import BinaryIO, Optional
+from typing import BinaryIO, List, Optional, Sequence, Tuple
 from spinnman.messages.scp.impl import (
     FloodFillEnd, FloodFillStart, FloodFillData)
 from spinnman.processes import (
     AbstractMultiConnectionProcess, ConnectionSelector)
 from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+from spinnman.exceptions import SpinnmanInvalidParameterException
+
+#: The number of flood fill data packets to have in flight at first
+FLOOD_WINDOW_START = 3
+#: The most flood fill data packets to have in flight
+FLOOD_WINDOW_MAX = 16
+#: The most blocks of data in one flood fill; the block count and number
+#: each have 8 bits in the flood fill messages
+MAX_FLOOD_BLOCKS = 255
+#: The most bytes that one flood fill can write
+MAX_FLOOD_BYTES = MAX_FLOOD_BLOCKS * UDP_MESSAGE_MAX_SIZE
+
+
+def check_flood_size(data: bytes) -> None:
+    """
+    Check that data can be written by a single flood fill.
+
+    :param data: The data to be written
+    :raise SpinnmanInvalidParameterException:
+        If the data is longer than :py:data:`MAX_FLOOD_BYTES`
+    """
+    if len(data) > MAX_FLOOD_BYTES:
+        raise SpinnmanInvalidParameterException(
+            "len(data)", len(data),
+            f"A flood fill can write at most {MAX_FLOOD_BYTES} bytes")
 
 
 class WriteMemoryFloodProcess(AbstractMultiConnectionProcess):
     """
     A process for writing memory on multiple SpiNNaker chips at once.
+
+    Several flood fills, each with its own nearest neighbour ID, can be
+    driven at once.  The data packets of the flood fills are sent in
+    turn, in windows that grow while every packet is answered first time
+    and are halved when any packet has to be sent again.
     """
-    __slots__ = ()
+    __slots__ = ("_window", )
 
     def __init__(self, next_connection_selector: ConnectionSelector):
         """
@@ -33,26 +63,81 @@ class WriteMemoryFloodProcess(AbstractMultiConnectionProcess):
             How to choose the connection.
         """
         AbstractMultiConnectionProcess.__init__(
-            self, next_connection_selector, n_channels=3,
-            intermediate_channel_waits=2)
+            self, next_connection_selector, n_channels=FLOOD_WINDOW_MAX,
+            intermediate_channel_waits=FLOOD_WINDOW_MAX - 1)
+        self._window = FLOOD_WINDOW_START
+
+    @property
+    def window(self) -> int:
+        """
+        The number of flood fill data packets currently sent together.
+        """
+        return self._window
+
+    def __n_resent(self) -> int:
+        return sum(
+            pipeline.n_resent + pipeline.n_retry_code_resent
+            for pipeline in self._scp_request_pipelines.values())
+
+    def write_memory_floods(
+            self, floods: Sequence[Tuple[int, int, bytes]]) -> None:
+        """
+        Write data to the same address of all chips, for several blocks of
+        data at once.
+
+        :param floods:
+            For each block of data, the nearest neighbour ID to use for it,
+            which must differ from those of the others, the address to
+            write it to and the data itself
+        :raise SpinnmanInvalidParameterException:
+            If any block of data is longer than
+            :py:data:`MAX_FLOOD_BYTES`
+        """
+        for _, _, data in floods:
+            check_flood_size(data)
+        flood_blocks = [
+            int(math.ceil(len(data) / UDP_MESSAGE_MAX_SIZE))
+            for _, _, data in floods]
 
-    def _start_flood_fill(
-            self, n_bytes: int, nearest_neighbour_id: int) -> None:
-        n_blocks = int(math.ceil(math.ceil(n_bytes / 4.0) /
-                                 UDP_MESSAGE_MAX_SIZE))
         with self._collect_responses():
-            self._send_request(
-                FloodFillStart(nearest_neighbour_id, n_blocks))
+            for (nearest_neighbour_id, _, _), n_flood_blocks in zip(
+                    floods, flood_blocks):
+                self._send_request(FloodFillStart(
+                    nearest_neighbour_id, n_flood_blocks))
+
+        # Take a block from each flood in turn
+        packets: List[FloodFillData] = list()
+        n_blocks = max(flood_blocks, default=0)
+        for block_no in range(n_blocks):
+            data_offset = block_no * UDP_MESSAGE_MAX_SIZE
+            for nearest_neighbour_id, base_address, data in floods:
+                if data_offset < len(data):
+                    packets.append(FloodFillData(
+                        nearest_neighbour_id, block_no,
+                        base_address + data_offset, data, data_offset,
+                        min(len(data) - data_offset, UDP_MESSAGE_MAX_SIZE)))
+
+        sent = 0
+        while sent < len(packets):
+            n_resent = self.__n_resent()
+            with self._collect_responses():
+                for packet in packets[sent:sent + self._window]:
+                    self._send_request(packet)
+            sent += self._window
+            if self.__n_resent() > n_resent:
+                self._window = max(self._window // 2, 1)
+            else:
+                self._window = min(self._window + 1, FLOOD_WINDOW_MAX)
 
-    def _end_flood_fill(self, nearest_neighbour_id: int) -> None:
         with self._collect_responses():
-            self._send_request(FloodFillEnd(nearest_neighbour_id))
+            for nearest_neighbour_id, _, _ in floods:
+                self._send_request(FloodFillEnd(nearest_neighbour_id))
 
     def write_memory_from_bytearray(
             self, nearest_neighbour_id: int, base_address: int,
             data: bytes, offset: int, n_bytes: Optional[int] = None) -> None:
         """
-        Currently not used!
+        Write data to the same address of all chips.
 
         :param nearest_neighbour_id:
         :param base_address:
@@ -61,53 +146,21 @@ class WriteMemoryFloodProcess(AbstractMultiConnectionProcess):
         :param n_bytes:
         """
         if n_bytes is None:
-            n_bytes = len(data)
-        self._start_flood_fill(n_bytes, nearest_neighbour_id)
-
-        with self._collect_responses():
-            data_offset = offset
-            offset = base_address
-            block_no = 0
-            while n_bytes > 0:
-                bytes_to_send = min((int(n_bytes), UDP_MESSAGE_MAX_SIZE))
-
-                self._send_request(FloodFillData(
-                    nearest_neighbour_id, block_no, offset,
-                    data, data_offset, bytes_to_send))
-
-                block_no += 1
-                n_bytes -= bytes_to_send
-                offset += bytes_to_send
-                data_offset += bytes_to_send
-
-        self._end_flood_fill(nearest_neighbour_id)
+            n_bytes = len(data) - offset
+        self.write_memory_floods([(
+            nearest_neighbour_id, base_address,
+            bytes(data[offset:offset + n_bytes]))])
 
     def write_memory_from_reader(
             self, nearest_neighbour_id: int, base_address: int,
             reader: BinaryIO, n_bytes: int) -> None:
         """
-        Currently not used!
+        Write data read from a reader to the same address of all chips.
 
         :param nearest_neighbour_id:
         :param base_address:
         :param reader:
         :param n_bytes:
         """
-        self._start_flood_fill(n_bytes, nearest_neighbour_id)
-
-        with self._collect_responses():
-            offset = base_address
-            block_no = 0
-            while n_bytes > 0:
-                bytes_to_send = min((int(n_bytes), UDP_MESSAGE_MAX_SIZE))
-                data_array = reader.read(bytes_to_send)
-
-                self._send_request(FloodFillData(
-                    nearest_neighbour_id, block_no, offset,
-                    data_array, 0, len(data_array)))
-
-                block_no += 1
-                n_bytes -= bytes_to_send
-                offset += bytes_to_send
-
-        self._end_flood_fill(nearest_neighbour_id)
+        self.write_memory_floods([(
+            nearest_neighbour_id, base_address, reader.read(n_bytes))])
@@ -80,7 +80,7 @@ class BMPOKResponse(BMPResponse[None]):
     """
     A BMP response without payload to parse.
     """
-    @abstractmethod
+    @overrides(BMPResponse._parse_payload)
     def _parse_payload(self, data: bytes, offset: int) -> None:
         if len(data) != offset:
             logger.warning("response message with unexpected extra {} bytes",
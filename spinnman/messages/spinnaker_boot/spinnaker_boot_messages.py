@@ -13,10 +13,11 @@
 # limitations under the License.
 
 import array
+import functools
 import math
 import os
 import time
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from spinnman.data import SpiNNManDataView
 from spinnman.exceptions import SpinnmanIOException
@@ -33,13 +34,63 @@ _BOOT_DATA_FILE_NAME = "scamp.boot"
 _BOOT_STRUCT_REPLACE_OFFSET = 384 // 4
 _BOOT_STRUCT_REPLACE_LENGTH = 128 // 4
 _BOOT_DATA_OPERAND_1 = ((_BOOT_MESSAGE_DATA_BYTES // 4) - 1) << 8
+_BOOT_STRUCT_START = _BOOT_STRUCT_REPLACE_OFFSET * 4
+_BOOT_STRUCT_END = _BOOT_STRUCT_START + _BOOT_STRUCT_REPLACE_LENGTH * 4
+
+
+def _boot_data_message(block_id: int, data: bytes) -> SpinnakerBootMessage:
+    return SpinnakerBootMessage(
+        opcode=SpinnakerBootOpCode.FLOOD_FILL_BLOCK,
+        operand_1=_BOOT_DATA_OPERAND_1 | (block_id & 0xFF),
+        operand_2=0, operand_3=0, data=data)
+
+
+@functools.lru_cache(maxsize=None)
+def _boot_image() -> Tuple[bytes, Tuple[Optional[SpinnakerBootMessage], ...]]:
+    """
+    Read and byte swap the boot image, and build the data messages of the
+    blocks that do not hold the boot values; these are the same for every
+    boot, so this is only done once.
+
+    :return:
+        The byte swapped image, and the data message for each block,
+        or `None` for blocks that hold the boot values
+    """
+    # Find the data file and size
+    boot_data_file, boot_data_size = \
+        SpinnakerBootMessages._get_boot_image_file()
+
+    # Read the data
+    boot_data = array.array("I")
+    with open(boot_data_file, "rb") as f:
+        boot_data.fromfile(f, boot_data_size // 4)
+
+    # Byte swap the data
+    boot_data.byteswap()
+    image = boot_data.tobytes()
+
+    n_packets = int(math.ceil(
+        float(boot_data_size) / _BOOT_MESSAGE_DATA_BYTES))
+    messages: List[Optional[SpinnakerBootMessage]] = list()
+    for block_id in range(n_packets):
+        offset = block_id * _BOOT_MESSAGE_DATA_BYTES
+        end = min(offset + _BOOT_MESSAGE_DATA_BYTES, boot_data_size)
+        if offset < _BOOT_STRUCT_END and end > _BOOT_STRUCT_START:
+            messages.append(None)
+        else:
+            messages.append(_boot_data_message(block_id, image[offset:end]))
+    return image, tuple(messages)
 
 
 class SpinnakerBootMessages(object):
     """
     A set of boot messages to be sent to boot the board.
+
+    The boot image is only read once; after that, only the messages that
+    hold the boot values are made again.
     """
     __slots__ = (
+        "_block_messages",
         "_boot_data",
         "_n_bytes_to_read",
         "_no_data_packets")
@@ -80,29 +131,18 @@ class SpinnakerBootMessages(object):
 
         # Get the data as an array, to be used later
         spinnaker_boot_data = array.array("I", spinnaker_boot_value.bytestring)
-
-        # Find the data file and size
-        boot_data_file, boot_data_size = self._get_boot_image_file()
-
-        # Compute how many packets to send
-        n_words_to_read = boot_data_size // 4
-        self._no_data_packets = int(math.ceil(
-            float(boot_data_size) / _BOOT_MESSAGE_DATA_BYTES))
-
-        # Read the data
-        boot_data = array.array("I")
-        with open(boot_data_file, "rb") as f:
-            boot_data.fromfile(f, n_words_to_read)
-
-        # Replace the appropriate part with the custom boot options
-        offset = _BOOT_STRUCT_REPLACE_OFFSET
-        length = _BOOT_STRUCT_REPLACE_LENGTH
-        boot_data[offset:offset + length] = spinnaker_boot_data[0:length]
-
-        # Byte swap and store the data for later use
-        boot_data.byteswap()
-        self._boot_data = boot_data.tobytes()
-        self._n_bytes_to_read = n_words_to_read * 4
+        spinnaker_boot_data = spinnaker_boot_data[
+            0:_BOOT_STRUCT_REPLACE_LENGTH]
+        spinnaker_boot_data.byteswap()
+
+        # Replace the appropriate part of the (cached) image with the
+        # custom boot options
+        image, self._block_messages = _boot_image()
+        self._boot_data = (image[:_BOOT_STRUCT_START] +
+                           spinnaker_boot_data.tobytes() +
+                           image[_BOOT_STRUCT_END:])
+        self._n_bytes_to_read = len(image)
+        self._no_data_packets = len(self._block_messages)
 
     @staticmethod
     def _get_boot_image_file() -> Tuple[str, int]:
@@ -142,13 +182,13 @@ class SpinnakerBootMessages(object):
             opcode=SpinnakerBootOpCode.FLOOD_FILL_START,
             operand_1=0, operand_2=0, operand_3=self._no_data_packets - 1)
 
-        # Construct and yield the data packets
-        for block_id in range(0, self._no_data_packets):
-            operand_1 = _BOOT_DATA_OPERAND_1 | (block_id & 0xFF)
-            yield SpinnakerBootMessage(
-                opcode=SpinnakerBootOpCode.FLOOD_FILL_BLOCK,
-                operand_1=operand_1, operand_2=0, operand_3=0,
-                data=self._get_packet_data(block_id))
+        # Construct and yield the data packets; only those holding the boot
+        # values are different each time
+        for block_id, message in enumerate(self._block_messages):
+            if message is None:
+                message = _boot_data_message(
+                    block_id, self._get_packet_data(block_id))
+            yield message
 
         # Construct and yield the end packet
         yield SpinnakerBootMessage(
@@ -24,10 +24,18 @@ from .heap_element import HeapElement
 from .io_buffer import IOBuffer
 from .machine_dimensions import MachineDimensions
 from .p2p_table import P2PTable
+from .router_configuration import RouterConfiguration
 from .router_diagnostics import RouterDiagnostics
+from .routing_table_array import (
+    ROUTING_ENTRY_DTYPE, array_to_routes, decode_routing_table,
+    encode_routing_table, routes_to_array, routing_table_differences)
 from .version_info import VersionInfo
 
 __all__ = ["ADCInfo", "BMPConnectionData", "ChipInfo", "ChipSummaryInfo",
            "CPUInfo", "CPUInfos", "DiagnosticFilter",
            "ExecutableTargets", "HeapElement", "IOBuffer", "MachineDimensions",
-           "P2PTable", "RouterDiagnostics", "VersionInfo"]
+           "P2PTable", "RouterConfiguration", "RouterDiagnostics",
+           "VersionInfo",
+           "ROUTING_ENTRY_DTYPE", "array_to_routes", "decode_routing_table",
+           "encode_routing_table", "routes_to_array",
+           "routing_table_differences"]
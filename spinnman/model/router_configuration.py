@@ -0,0 +1,128 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Tuple, Union
+from spinn_machine import RoutingEntry
+from spinn_utilities.typing.coords import XY
+from spinnman.constants import NO_ROUTER_DIAGNOSTIC_FILTERS
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from .diagnostic_filter import DiagnosticFilter
+
+
+class RouterConfiguration(object):
+    """
+    A plan of changes to make to the routers of many chips, to be carried
+    out all together.
+    """
+    __slots__ = (
+        "_clears",
+        "_filters",
+        "_fixed_routes",
+        "_watch_dogs")
+
+    def __init__(self) -> None:
+        self._clears: List[XY] = list()
+        self._filters: List[Tuple[int, int, int, DiagnosticFilter]] = list()
+        self._fixed_routes: List[Tuple[int, int, RoutingEntry, int]] = list()
+        self._watch_dogs: List[Tuple[int, int, int]] = list()
+
+    def add_clear(self, x: int, y: int) -> None:
+        """
+        Remove all the multicast routes on a chip.
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        """
+        self._clears.append((x, y))
+
+    def add_filter(self, x: int, y: int, position: int,
+                   diagnostic_filter: DiagnosticFilter) -> None:
+        """
+        Set a router diagnostic filter on a chip.
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :param position: The position of the filter, between 0 and 15
+        :param diagnostic_filter: The filter to set
+        :raise SpinnmanInvalidParameterException:
+            If the position is out of range
+        """
+        if not 0 <= position < NO_ROUTER_DIAGNOSTIC_FILTERS:
+            raise SpinnmanInvalidParameterException(
+                "position", str(position),
+                "the range of the position of a router filter is 0 and 16.")
+        self._filters.append((x, y, position, diagnostic_filter))
+
+    def add_fixed_route(self, x: int, y: int, fixed_route: RoutingEntry,
+                        app_id: int = 0) -> None:
+        """
+        Load a fixed route on a chip.
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :param fixed_route: The fixed route entry
+        :param app_id: The ID of the application to associate the route with
+        """
+        self._fixed_routes.append((x, y, fixed_route, app_id))
+
+    def add_watch_dog(self, x: int, y: int,
+                      watch_dog: Union[int, bool]) -> None:
+        """
+        Enable, disable or set the value of the watch dog timer on a chip.
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :param watch_dog:
+            Either a Boolean indicating whether to enable (True) or
+            disable (False) the watch dog timer, or an int value to set the
+            timer count to
+        """
+        if isinstance(watch_dog, bool):
+            default = SystemVariableDefinition.software_watchdog_count.default
+            assert isinstance(default, int)
+            watch_dog = default if watch_dog else 0
+        self._watch_dogs.append((x, y, watch_dog))
+
+    @property
+    def clears(self) -> List[XY]:
+        """
+        The chips to remove the multicast routes of.
+        """
+        return self._clears
+
+    @property
+    def filters(self) -> List[Tuple[int, int, int, DiagnosticFilter]]:
+        """
+        The x, y, position and filter of each filter to set.
+        """
+        return self._filters
+
+    @property
+    def fixed_routes(self) -> List[Tuple[int, int, RoutingEntry, int]]:
+        """
+        The x, y, route and app_id of each fixed route to load.
+        """
+        return self._fixed_routes
+
+    @property
+    def watch_dogs(self) -> List[Tuple[int, int, int]]:
+        """
+        The x, y and count of each watch dog timer to set.
+        """
+        return self._watch_dogs
+
+    def __len__(self) -> int:
+        return (len(self._clears) + len(self._filters) +
+                len(self._fixed_routes) + len(self._watch_dogs))
@@ -0,0 +1,124 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Collection, List, Optional, Tuple
+import numpy
+from numpy.typing import NDArray
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+
+#: The fields of a multicast routing table held as a numpy structured array
+ROUTING_ENTRY_DTYPE = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"), ("route", "<u4"), ("app_id", "u1")])
+
+# The layout of an entry in a table in SDRAM, as read and written by SCAMP
+_SDRAM_ENTRY_DTYPE = numpy.dtype([
+    ("next", "<u2"), ("app_id", "u1"), ("free", "u1"), ("route", "<u4"),
+    ("key", "<u4"), ("mask", "<u4")])
+
+#: The number of bytes of each entry in a table in SDRAM
+SDRAM_ENTRY_SIZE = _SDRAM_ENTRY_DTYPE.itemsize
+
+#: Routes at or above this are unused entries or the end of a table
+INVALID_ROUTE = 0xFF000000
+
+
+def routes_to_array(
+        routes: Collection[MulticastRoutingEntry], app_id: int = 0
+        ) -> NDArray:
+    """
+    Convert multicast routing entries to a structured array.
+
+    :param routes: The entries to convert
+    :param app_id: The application ID to give to all the entries
+    :returns: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    """
+    table = numpy.zeros(len(routes), dtype=ROUTING_ENTRY_DTYPE)
+    table["key"] = [route.key for route in routes]
+    table["mask"] = [route.mask for route in routes]
+    table["route"] = [route.spinnaker_route for route in routes]
+    table["app_id"] = app_id
+    return table
+
+
+def array_to_routes(table: NDArray) -> List[MulticastRoutingEntry]:
+    """
+    Convert a structured array to multicast routing entries.
+
+    :param table: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    :returns: The entries of the table, in order
+    """
+    return [
+        MulticastRoutingEntry(key, mask, RoutingEntry(spinnaker_route=route))
+        for key, mask, route in zip(
+            table["key"].tolist(), table["mask"].tolist(),
+            table["route"].tolist())]
+
+
+def encode_routing_table(table: NDArray) -> bytes:
+    """
+    Convert a structured array to the format loaded by SCAMP, including the
+    entry that marks the end of the table.
+
+    :param table: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    :returns: The bytes to write to SDRAM
+    """
+    sdram = numpy.zeros(len(table) + 1, dtype=_SDRAM_ENTRY_DTYPE)
+    entries = sdram[:-1]
+    entries["next"] = numpy.arange(len(table))
+    entries["route"] = table["route"]
+    entries["key"] = table["key"]
+    entries["mask"] = table["mask"]
+    sdram[-1:].view("<u4")[:] = 0xFFFFFFFF
+    return sdram.tobytes()
+
+
+def decode_routing_table(
+        data: bytes, app_id: Optional[int] = None) -> NDArray:
+    """
+    Convert a routing table read from SDRAM to a structured array, leaving
+    out unused entries.
+
+    :param data: The bytes read; a whole number of entries
+    :param app_id: If not `None`, only the entries with this app ID are kept
+    :returns: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    """
+    sdram = numpy.frombuffer(data, dtype=_SDRAM_ENTRY_DTYPE)
+    used = sdram["route"] < INVALID_ROUTE
+    if app_id is not None:
+        used &= sdram["app_id"] == app_id
+    sdram = sdram[used]
+    table = numpy.zeros(len(sdram), dtype=ROUTING_ENTRY_DTYPE)
+    for field in ROUTING_ENTRY_DTYPE.names or ():
+        table[field] = sdram[field]
+    return table
+
+
+def routing_table_differences(
+        expected: NDArray, actual: NDArray) -> Tuple[NDArray, NDArray]:
+    """
+    Compare two routing tables entry by entry, ignoring the app_id.
+
+    :param expected: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    :param actual: An array with :py:data:`ROUTING_ENTRY_DTYPE`
+    :returns:
+        The entries of the expected table that do not match and the
+        entries of the actual table that do not match; both empty if the
+        tables are the same
+    """
+    n = min(len(expected), len(actual))
+    same = numpy.ones(n, dtype=bool)
+    for field in ("key", "mask", "route"):
+        same &= expected[field][:n] == actual[field][:n]
+    return (numpy.concatenate((expected[:n][~same], expected[n:])),
+            numpy.concatenate((actual[:n][~same], actual[n:])))
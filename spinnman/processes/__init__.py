@@ -17,6 +17,7 @@ from .abstract_multi_connection_process_connection_selector import (
     ConnectionSelector)
 from .application_copy_run_process import ApplicationCopyRunProcess
 from .application_run_process import ApplicationRunProcess
+from .configure_routers_process import ConfigureRoutersProcess
 
 from .fixed_connection_selector import FixedConnectionSelector
 from .get_heap_process import GetHeapProcess
@@ -35,14 +36,19 @@ from .read_fixed_route_routing_entry_process import (
     ReadFixedRouteRoutingEntryProcess)
 from .load_fixed_route_routing_entry_process import (
     LoadFixedRouteRoutingEntryProcess)
+from .read_fpga_registers_process import ReadFPGARegistersProcess
 from .read_iobuf_process import ReadIOBufProcess
 from .read_memory_process import ReadMemoryProcess
 from .read_router_diagnostics_process import ReadRouterDiagnosticsProcess
+from .read_system_variables_process import ReadSystemVariablesProcess
+from .read_user_process import ReadUserProcess
 from .round_robin_connection_selector import RoundRobinConnectionSelector
 from .send_single_command_process import SendSingleCommandProcess
 from .write_memory_process import WriteMemoryProcess
 from .set_memory_process import SetMemoryProcess
+from .set_tags_process import SetTagsProcess
 from .clear_routes_process import ClearRoutesProcess
+from .tail_iobuf_process import TailIOBufProcess
 
 # Old name
 AbstractMultiConnectionProcessConnectionSelector = ConnectionSelector
@@ -60,7 +66,10 @@ __all__ = ["AbstractMultiConnectionProcessConnectionSelector",
            "GetNCoresInStateProcess", "GetTagsProcess",
            "GetVersionProcess", "LoadFixedRouteRoutingEntryProcess",
            "LoadMultiCastRoutesProcess", "MallocSDRAMProcess",
-           "ReadFixedRouteRoutingEntryProcess", "ReadIOBufProcess",
+           "ReadFixedRouteRoutingEntryProcess", "ReadFPGARegistersProcess",
+           "ReadIOBufProcess",
            "ReadMemoryProcess", "ReadRouterDiagnosticsProcess",
+           "ReadSystemVariablesProcess", "ReadUserProcess",
            "SendSingleCommandProcess", "WriteMemoryProcess",
-           "SetMemoryProcess", "ClearRoutesProcess"]
+           "SetMemoryProcess", "ClearRoutesProcess", "TailIOBufProcess",
+           "ConfigureRoutersProcess", "SetTagsProcess"]
@@ -13,71 +13,242 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import cast, Iterable, List, Mapping, Tuple
-from spinn_machine import Chip, CoreSubsets, Link, Machine
+import functools
+from typing import (
+    Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple)
+from spinn_utilities.typing.coords import XY
+from spinn_machine import Chip, CoreSubsets, Machine
 from spinnman.data import SpiNNManDataView
-from spinnman.messages.scp.impl import AppCopyRun
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+from spinnman.messages.scp.impl import AppCopyRun, ApplicationRun, WriteMemory
 from spinnman.processes import ConnectionSelector
+from spinnman.utilities.utility_functions import get_data_checksum
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 
 APP_COPY_RUN_TIMEOUT = 6.0
 
+#: The address that binaries are copied from and to on each chip
+_EXECUTABLE_ADDRESS = 0x67800000
 
-def _on_same_board(chip_1: Chip, chip_2: Chip) -> bool:
-    return (chip_1.nearest_ethernet_x == chip_2.nearest_ethernet_x and
-            chip_1.nearest_ethernet_y == chip_2.nearest_ethernet_y)
+#: The number of neighbours copying from each chip at the same time
+APP_COPY_RUN_FAN_OUT = 1
 
+#: The number of copies from each board to other boards at the same time
+APP_COPY_RUN_OFF_BOARD_FAN_OUT = 1
 
-def _get_next_chips(
-        chips_done: Mapping[Tuple[int, int], List[Tuple[int, int]]],
-        parent_chips: Mapping[Tuple[int, int], List[Chip]],
-        machine: Machine) -> Iterable[Chip]:
+#: How many chips can be moved to other sources to make room for a chip
+_MAX_REASSIGN_DEPTH = 8
+
+
+def _board(chip: Chip) -> XY:
+    return (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+
+
+class _RoundAssigner(object):
     """
-    Get the chips that are adjacent to the last set of chips, which
-    haven't yet been loaded.  Also returned are the links for each chip,
-    which gives the link which should be read from to get the data.
-
-    :param chips_done:
-        The coordinates of chips that have already been done by Ethernet
-    :param parent_chips:
-        A dictionary of chip coordinates to chips that use that chip as a
-        parent
-    :return: A list of next chips to use
+    Assigns the chips that could be copied to in a round to the chips they
+    copy from, within the limits on copies from each chip and board.
+
+    Chips are assigned in order of priority; a chip assigned earlier can
+    be moved to another source on its board to make room for a later one.
     """
-    next_chips: List[Chip] = list()
-    for eth_chip in chips_done:
-        off_board_copy_done = False
-        for c_x, c_y in chips_done[eth_chip]:
-            chip_xy = machine[c_x, c_y]
-            for chip in parent_chips[c_x, c_y]:
-                on_same_board = _on_same_board(chip, chip_xy)
-                eth = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
-                if (eth not in chips_done or
-                        chip not in chips_done[eth]):
-                    if on_same_board or not off_board_copy_done:
-                        next_chips.append(chip)
-                        if not on_same_board:
-                            off_board_copy_done = True
-                        # Only do one copy from each chip at a time
-                        break
-
-    return next_chips
-
-
-def _compute_parent_chips(
-        machine: Machine) -> Mapping[Tuple[int, int], List[Chip]]:
+    __slots__ = (
+        "_assigned", "_fan_out", "_frontier", "_machine", "_off_board",
+        "_off_board_fan_out", "_users")
+
+    def __init__(self, machine: Machine,
+                 frontier: Dict[XY, List[Tuple[int, Chip]]],
+                 fan_out: int, off_board_fan_out: int):
+        """
+        :param machine: The machine being copied over
+        :param frontier:
+            The chips that could be copied to, with the links they could
+            copy over and the chips on the other end
+        :param fan_out: The number of copies from each chip
+        :param off_board_fan_out:
+            The number of copies from each board to other boards
+        """
+        self._machine = machine
+        self._frontier = frontier
+        self._fan_out = fan_out
+        self._off_board_fan_out = off_board_fan_out
+        self._assigned: Dict[XY, Tuple[int, Chip]] = dict()
+        self._users: Dict[XY, List[XY]] = defaultdict(list)
+        self._off_board: Dict[XY, int] = defaultdict(int)
+
+    @property
+    def assigned(self) -> Dict[XY, Tuple[int, Chip]]:
+        """
+        The link to copy over and the chip to copy from of each chip that
+        has been assigned.
+        """
+        return self._assigned
+
+    def assign(self, chip_xy: XY) -> None:
+        """
+        Assign a chip to a chip to copy from, if there is one free.
+
+        :param chip_xy: The chip to assign
+        """
+        self.__assign(chip_xy, set(), True, _MAX_REASSIGN_DEPTH)
+
+    def __assign(self, chip_xy: XY, seen: Set[XY], allow_off_board: bool,
+                 depth: int) -> bool:
+        board = _board(self._machine[chip_xy])
+        # Prefer sources on the same board, then those least used
+        for link_id, source in sorted(
+                self._frontier[chip_xy], key=lambda link: (
+                    _board(link[1]) != board,
+                    len(self._users[link[1].x, link[1].y]), link[0])):
+            source_xy = (source.x, source.y)
+            off_board = _board(source) != board
+            if source_xy in seen or (off_board and not allow_off_board):
+                continue
+            seen.add(source_xy)
+            users = self._users[source_xy]
+            if off_board:
+                if (len(users) < self._fan_out and
+                        self._off_board[_board(source)] <
+                        self._off_board_fan_out):
+                    self._off_board[_board(source)] += 1
+                    self.__use(chip_xy, link_id, source)
+                    return True
+                continue
+            if len(users) < self._fan_out:
+                self.__use(chip_xy, link_id, source)
+                return True
+            if depth > 0:
+                for other_xy in list(users):
+                    if self.__assign(other_xy, seen, False, depth - 1):
+                        self.__release(other_xy, source)
+                        self.__use(chip_xy, link_id, source)
+                        return True
+        return False
+
+    def __use(self, chip_xy: XY, link_id: int, source: Chip) -> None:
+        self._assigned[chip_xy] = (link_id, source)
+        self._users[source.x, source.y].append(chip_xy)
+
+    def __release(self, chip_xy: XY, source: Chip) -> None:
+        # The chip has already been assigned to another source on its board
+        self._users[source.x, source.y].remove(chip_xy)
+        if _board(source) != _board(self._machine[chip_xy]):
+            self._off_board[_board(source)] -= 1
+
+
+def plan_copy_rounds(
+        machine: Machine, fan_out: int = APP_COPY_RUN_FAN_OUT,
+        off_board_fan_out: int = APP_COPY_RUN_OFF_BOARD_FAN_OUT,
+        seeds: Optional[Iterable[XY]] = None
+        ) -> List[List[Tuple[Chip, int]]]:
     """
-    Compute a dictionary of chip coordinates to list of chips who use that chip
-    as a parent in the tree.
+    Plan the rounds of copying a binary from the chips it has been written
+    to, to every chip of a machine that can be reached over its links.
 
-    :param machine: The machine to compute the map for
+    In each round, up to `fan_out` neighbours can copy from each chip that
+    already has the binary, and up to `off_board_fan_out` chips on other
+    boards can copy from each board.  The chips leading to the furthest
+    parts of the machine are copied to first, so that the number of rounds
+    is kept close to the distance to the furthest chip.
+
+    :param machine: The machine to plan the copies over
+    :param fan_out: The number of copies from each chip in each round
+    :param off_board_fan_out:
+        The number of copies from each board to other boards in each round
+    :param seeds:
+        The chips the binary has been written to; by default the boot chip
+    :return:
+        For each round, the chips to copy to, each with the link to copy
+        over
     """
-    chip_links: Mapping[Tuple[int, int], List[Chip]] = defaultdict(list)
+    if seeds is None:
+        seeds = [(machine.boot_chip.x, machine.boot_chip.y)]
+    seed_xys = list(dict.fromkeys(seeds))
+
+    # The chips that can copy from each chip, with the link they copy over
+    readers: Dict[XY, List[Tuple[Chip, int]]] = defaultdict(list)
     for chip in machine.chips:
-        if chip.parent_link is not None:
-            link = cast(Link, chip.router.get_link(chip.parent_link))
-            chip_links[link.destination_x, link.destination_y].append(chip)
-    return chip_links
+        for link in chip.router.links:
+            readers[link.destination_x, link.destination_y].append(
+                (chip, link.source_link_id))
+
+    # The distance of each chip from the nearest seed
+    distance: Dict[XY, int] = dict.fromkeys(seed_xys, 0)
+    order: List[XY] = list(seed_xys)
+    for xy in order:
+        for chip, _ in readers[xy]:
+            if (chip.x, chip.y) not in distance:
+                distance[chip.x, chip.y] = distance[xy] + 1
+                order.append((chip.x, chip.y))
+
+    # How far the shortest paths through each chip go beyond it
+    height: Dict[XY, int] = dict.fromkeys(order, 0)
+    for xy in reversed(order):
+        for chip, _ in readers[xy]:
+            if distance[chip.x, chip.y] == distance[xy] + 1:
+                height[xy] = max(height[xy], height[chip.x, chip.y] + 1)
+
+    # The chips that could be copied to next, with the links they could
+    # copy over and the chips on the other end
+    frontier: Dict[XY, List[Tuple[int, Chip]]] = defaultdict(list)
+    done: Set[XY] = set(seed_xys)
+    for seed_xy in seed_xys:
+        for chip, link_id in readers[seed_xy]:
+            if (chip.x, chip.y) not in done:
+                frontier[chip.x, chip.y].append((link_id, machine[seed_xy]))
+
+    rounds: List[List[Tuple[Chip, int]]] = list()
+    while frontier:
+        assigner = _RoundAssigner(
+            machine, frontier, fan_out, off_board_fan_out)
+        for chip_xy in sorted(frontier, key=lambda xy: (
+                -height[xy], len(frontier[xy]), xy)):
+            assigner.assign(chip_xy)
+
+        next_round: List[Tuple[Chip, int]] = list()
+        for chip_xy, (link_id, _) in assigner.assigned.items():
+            next_round.append((machine[chip_xy], link_id))
+            del frontier[chip_xy]
+            done.add(chip_xy)
+        for chip, _ in next_round:
+            for reader, link_id in readers[chip.x, chip.y]:
+                if (reader.x, reader.y) not in done:
+                    frontier[reader.x, reader.y].append((link_id, chip))
+        rounds.append(next_round)
+    return rounds
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_copy_rounds(
+        machine: Machine, fan_out: int, off_board_fan_out: int,
+        seeds: Tuple[XY, ...]) -> List[List[Tuple[Chip, int]]]:
+    return plan_copy_rounds(machine, fan_out, off_board_fan_out, seeds)
+
+
+def _pipeline_lag(
+        rounds: List[List[Tuple[Chip, int]]], seeds: Iterable[XY]) -> int:
+    """
+    Work out how many rounds apart binaries copied over the same plan must
+    start, so that no chip is given the next binary while a neighbour may
+    still be copying the last one from it, and the cores of each chip
+    have at least a round to load a binary before it is replaced.
+
+    :param rounds: The planned copy rounds
+    :param seeds: The chips the binaries are written to
+    :return: The number of rounds between the starts of binaries
+    """
+    # The round each chip gets a binary in, where writing seeds is round 0
+    received: Dict[XY, int] = dict.fromkeys(seeds, 0)
+    last_copied_from: Dict[XY, int] = dict()
+    for index, copy_round in enumerate(rounds):
+        for chip, link_id in copy_round:
+            received[chip.x, chip.y] = index + 1
+            link = chip.router.get_link(link_id)
+            assert link is not None
+            last_copied_from[link.destination_x, link.destination_y] = (
+                index + 1)
+    return max([2] + [
+        last - received[xy] + 1 for xy, last in last_copied_from.items()])
 
 
 class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
@@ -91,24 +262,34 @@ class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
     copied and started.
 
     .. note::
-        The binary must have been loaded to the boot chip before this is
-        called!
+        The binary must have been loaded to the boot chip, or to each of
+        the seed chips given, before this is called!
     """
-    __slots__ = ()
+    __slots__ = ("_fan_out", "_off_board_fan_out")
 
     def __init__(self, next_connection_selector: ConnectionSelector,
-                 timeout: float = APP_COPY_RUN_TIMEOUT):
+                 timeout: float = APP_COPY_RUN_TIMEOUT,
+                 fan_out: int = APP_COPY_RUN_FAN_OUT,
+                 off_board_fan_out: int = APP_COPY_RUN_OFF_BOARD_FAN_OUT):
         """
         :param next_connection_selector:
            Method to find the next connection to use
         :param timeout:
            How long to wait for a response before raising an Exception
+        :param fan_out:
+           The number of neighbours each chip is copied to at the same time
+        :param off_board_fan_out:
+           The number of other boards each board is copied to at the same
+           time
         """
         AbstractMultiConnectionProcess.__init__(
             self, next_connection_selector, timeout=timeout)
+        self._fan_out = fan_out
+        self._off_board_fan_out = off_board_fan_out
 
     def run(self, size: int, app_id: int, core_subsets: CoreSubsets,
-            checksum: int, wait: bool) -> None:
+            checksum: int, wait: bool,
+            seeds: Optional[Iterable[XY]] = None) -> None:
         """
         Run the process.
 
@@ -118,24 +299,96 @@ class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
         :param checksum: The checksum of the data to test against
         :param wait:
             Whether to put the binary in "wait" mode or run it straight away
+        :param seeds:
+            The chips the binary has been loaded to; by default the boot chip
         """
         machine = SpiNNManDataView.get_machine()
-        boot_chip = machine.boot_chip
-        chips_done: Mapping[Tuple[int, int], List[Tuple[int, int]]] = \
-            defaultdict(list)
-        chips_done[boot_chip].append((boot_chip))
-        parent_chips = _compute_parent_chips(machine)
-        next_chips = _get_next_chips(chips_done, parent_chips, machine)
-
-        while next_chips:
-            # Do all the chips at the current level
-            for chip in next_chips:
+        if seeds is None:
+            seeds = [(machine.boot_chip.x, machine.boot_chip.y)]
+        for copy_round in _cached_copy_rounds(
+                machine, self._fan_out, self._off_board_fan_out,
+                tuple(sorted(set(seeds)))):
+            # Do all the chips in the current round
+            for chip, link_id in copy_round:
                 subset = core_subsets.get_core_subset_for_chip(chip.x, chip.y)
                 self._send_request(AppCopyRun(
-                    chip.x, chip.y, cast(int, chip.parent_link), size, app_id,
+                    chip.x, chip.y, link_id, size, app_id,
                     subset.processor_ids, checksum, wait))
-                eth = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
-                chips_done[eth].append(chip)
             self._finish()
             self.check_for_error()
-            next_chips = _get_next_chips(chips_done, parent_chips, machine)
+
+    def run_pipelined(
+            self,
+            binaries: Sequence[Tuple[bytes, CoreSubsets, Collection[XY]]],
+            app_id: int, wait: bool,
+            seeds: Optional[Iterable[XY]] = None) -> List[int]:
+        """
+        Load many binaries, each by writing it to the seed chips, starting
+        it on the cores of those chips and copying it over the machine.
+
+        There is only one place on each chip that a binary is copied from,
+        so the binaries cannot be copied at the same time; instead, each
+        chip is given the next binary as soon as its neighbours have
+        finished copying the last one from it.  The next binary is thus
+        written and starts spreading while the last is still being copied
+        over the rest of the machine.
+
+        :param binaries:
+            For each binary, its data, the cores to run it on, and the seed
+            chips it has to be written to, which may leave out those known
+            to have it already
+        :param app_id: The application id to assign to the running binaries
+        :param wait:
+            Whether to put the binaries in "wait" mode or run them straight
+            away
+        :param seeds: The chips to load the binaries to; by default the
+            boot chip
+        :return: The checksum of each binary
+        """
+        machine = SpiNNManDataView.get_machine()
+        if seeds is None:
+            seeds = [(machine.boot_chip.x, machine.boot_chip.y)]
+        seed_xys = tuple(sorted(set(seeds)))
+        rounds = _cached_copy_rounds(
+            machine, self._fan_out, self._off_board_fan_out, seed_xys)
+        lag = _pipeline_lag(rounds, seed_xys)
+        checksums = [get_data_checksum(data) for data, _, _ in binaries]
+
+        # Binary i is written in step i * lag, and copied round by round in
+        # the steps after that
+        n_steps = (len(binaries) - 1) * lag + len(rounds) + 2
+        for step in range(n_steps):
+            with self._collect_responses():
+                for index, (data, core_subsets, to_write) in enumerate(
+                        binaries):
+                    stage = step - index * lag
+                    if stage == 0:
+                        self.__write_binary(data, to_write)
+                    elif stage == 1:
+                        for x, y in seed_xys:
+                            if core_subsets.is_chip(x, y):
+                                subset = core_subsets.get_core_subset_for_chip(
+                                    x, y)
+                                self._send_request(ApplicationRun(
+                                    app_id, x, y, subset.processor_ids, wait))
+                    if 1 <= stage <= len(rounds):
+                        self.__copy_round(
+                            rounds[stage - 1], len(data), app_id,
+                            core_subsets, checksums[index], wait)
+        return checksums
+
+    def __write_binary(self, data: bytes, xys: Collection[XY]) -> None:
+        for offset in range(0, len(data), UDP_MESSAGE_MAX_SIZE):
+            data_array = data[offset:offset + UDP_MESSAGE_MAX_SIZE]
+            for x, y in xys:
+                self._send_request(WriteMemory(
+                    (x, y, 0), _EXECUTABLE_ADDRESS + offset, data_array))
+
+    def __copy_round(
+            self, copy_round: List[Tuple[Chip, int]], size: int, app_id: int,
+            core_subsets: CoreSubsets, checksum: int, wait: bool) -> None:
+        for chip, link_id in copy_round:
+            subset = core_subsets.get_core_subset_for_chip(chip.x, chip.y)
+            self._send_request(AppCopyRun(
+                chip.x, chip.y, link_id, size, app_id,
+                subset.processor_ids, checksum, wait))
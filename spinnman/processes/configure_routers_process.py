@@ -0,0 +1,83 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import struct
+from spinn_utilities.log import FormatAdapter
+from spinn_machine import Router
+from spinnman.constants import (
+    ROUTER_REGISTER_BASE_ADDRESS, ROUTER_FILTER_CONTROLS_OFFSET,
+    ROUTER_DEFAULT_FILTERS_MAX_POSITION, ROUTER_DIAGNOSTIC_FILTER_SIZE,
+    SYSTEM_VARIABLE_BASE_ADDRESS)
+from spinnman.messages.scp.impl import (
+    FixedRouteInit, RouterClear, WriteMemory)
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.model import RouterConfiguration
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_ONE_BYTE = struct.Struct("B")
+_ONE_WORD = struct.Struct("<I")
+_WATCH_DOG_ADDRESS = (
+    SYSTEM_VARIABLE_BASE_ADDRESS +
+    SystemVariableDefinition.software_watchdog_count.offset)
+
+
+class ConfigureRoutersProcess(AbstractMultiConnectionProcess):
+    """
+    A process for making a planned set of changes to the routers of many
+    chips, with all the changes sent together.
+    """
+    __slots__ = ()
+
+    def configure(self, configuration: RouterConfiguration) -> None:
+        """
+        Make the changes in a configuration.
+
+        Routes are cleared before anything else is done; the other changes
+        are then made in no particular order.
+
+        :param configuration: The changes to make
+        """
+        with self._collect_responses():
+            for x, y in configuration.clears:
+                self._send_request(RouterClear(x, y))
+
+        if any(position <= ROUTER_DEFAULT_FILTERS_MAX_POSITION
+               for _, _, position, _ in configuration.filters):
+            logger.warning(
+                "You are planning to change a filter which is set by default. "
+                "By doing this, other runs occurring on this machine will be "
+                "forced to use this new configuration until the machine is "
+                "reset. Please also note that these changes will make the "
+                "the reports from ybug not correct. This has been executed "
+                "and is trusted that the end user knows what they are doing.")
+
+        with self._collect_responses():
+            for x, y, position, diagnostic_filter in configuration.filters:
+                self._send_request(WriteMemory(
+                    (x, y, 0),
+                    ROUTER_REGISTER_BASE_ADDRESS +
+                    ROUTER_FILTER_CONTROLS_OFFSET +
+                    position * ROUTER_DIAGNOSTIC_FILTER_SIZE,
+                    _ONE_WORD.pack(diagnostic_filter.filter_word)))
+            for x, y, fixed_route, app_id in configuration.fixed_routes:
+                route_entry = \
+                    Router.convert_routing_table_entry_to_spinnaker_route(
+                        fixed_route)
+                self._send_request(FixedRouteInit(x, y, route_entry, app_id))
+            for x, y, watch_dog in configuration.watch_dogs:
+                self._send_request(WriteMemory(
+                    (x, y, 0), _WATCH_DOG_ADDRESS, _ONE_BYTE.pack(watch_dog)))
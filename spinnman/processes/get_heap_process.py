@@ -14,10 +14,11 @@
 
 import functools
 import struct
-from typing import Callable, List, Sequence
-from spinn_utilities.typing.coords import XY, XYP
+from typing import Dict, Iterable, List, Optional, Sequence
+from spinn_utilities.typing.coords import XY
 from spinnman.processes import AbstractMultiConnectionProcess
-from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.constants import (
+    SYSTEM_VARIABLE_BASE_ADDRESS, UDP_MESSAGE_MAX_SIZE)
 from spinnman.model import HeapElement
 from spinnman.messages.spinnaker_boot import SystemVariableDefinition
 from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
@@ -27,19 +28,55 @@ from .abstract_multi_connection_process_connection_selector import (
 
 HEAP_ADDRESS = SystemVariableDefinition.sdram_heap_address
 _ADDRESS = struct.Struct("<I")
-_HEAP_POINTER = struct.Struct("<4xI")
+_HEAP_POINTERS = struct.Struct("<4xII")
 _ELEMENT_HEADER = struct.Struct("<II")
 
 
+class _HeapWalk(object):
+    """
+    The progress of walking the heap of one chip.
+    """
+    __slots__ = (
+        "blocks",
+        "last_address",
+        "next_address",
+        "span",
+        "span_address")
+
+    def __init__(self) -> None:
+        self.blocks: List[HeapElement] = list()
+        # The address of the final block, beyond which nothing is read
+        self.last_address = 0
+        # The address of the next block header to read, or 0 if done
+        self.next_address = 0
+        # The memory most recently read, which may hold several headers
+        self.span_address = 0
+        self.span = b""
+
+    def cached_header(self, address: int) -> Optional[bytes]:
+        """
+        The header at the given address if it has already been read.
+
+        :param address: The address of the header
+        :returns: The header bytes, or `None` if not read yet
+        """
+        offset = address - self.span_address
+        if offset < 0 or offset + _ELEMENT_HEADER.size > len(self.span):
+            return None
+        return self.span[offset:offset + _ELEMENT_HEADER.size]
+
+
 class GetHeapProcess(AbstractMultiConnectionProcess[Response]):
     """
     Gets Heap information using the provided connector.
 
+    The heaps of several chips are walked together, with one round of
+    requests advancing every chip. Each read fetches as much of the heap
+    after a block header as fits in a packet, so chains of small blocks
+    need fewer rounds.
     """
     __slots__ = (
-        "_blocks",
-        "_heap_address",
-        "_next_block_address")
+        "_walks", )
 
     def __init__(self, connection_selector: ConnectionSelector):
         """
@@ -47,31 +84,89 @@ class GetHeapProcess(AbstractMultiConnectionProcess[Response]):
         """
         super().__init__(connection_selector)
 
-        self._heap_address = 0
-        self._next_block_address = 0
-        self._blocks: List[HeapElement] = list()
-
-    def _read_heap_address_response(self, response: Response) -> None:
-        self._heap_address = _ADDRESS.unpack_from(
-            response.data, response.offset)[0]
+        self._walks: Dict[XY, _HeapWalk] = dict()
 
-    def _read_heap_pointer(self, response: Response) -> None:
-        self._next_block_address = _HEAP_POINTER.unpack_from(
+    def _read_heap_address_response(
+            self, walk: _HeapWalk, response: Response) -> None:
+        walk.next_address = _ADDRESS.unpack_from(
             response.data, response.offset)[0]
 
-    def _read_next_block(self, block_address: int, response: Response) -> None:
-        self._next_block_address, free = _ELEMENT_HEADER.unpack_from(
+    def _read_heap_pointers(
+            self, walk: _HeapWalk, response: Response) -> None:
+        walk.next_address, walk.last_address = _HEAP_POINTERS.unpack_from(
             response.data, response.offset)
-        if self._next_block_address != 0:
-            self._blocks.append(HeapElement(
-                block_address, self._next_block_address, free))
 
-    def __read_address(
-            self, core_coords: XYP, address: int, size: int,
-            callback: Callable[[Response], None]) -> None:
+    def _read_span(self, walk: _HeapWalk, address: int,
+                   response: Response) -> None:
+        walk.span_address = address
+        walk.span = bytes(response.data[
+            response.offset:response.offset + response.length])
+        self.__advance(walk)
+
+    def __advance(self, walk: _HeapWalk) -> None:
+        """
+        Follow the chain through any headers that have already been read.
+        """
+        while walk.next_address != 0:
+            header = walk.cached_header(walk.next_address)
+            if header is None:
+                return
+            block_address = walk.next_address
+            walk.next_address, free = _ELEMENT_HEADER.unpack(header)
+            if walk.next_address != 0:
+                walk.blocks.append(HeapElement(
+                    block_address, walk.next_address, free))
+
+    def __request_span(self, xy: XY, walk: _HeapWalk) -> None:
+        address = walk.next_address
+        size = UDP_MESSAGE_MAX_SIZE
+        if walk.last_address >= address:
+            # Don't read past the end of the heap
+            size = min(size, walk.last_address + _ELEMENT_HEADER.size -
+                       address)
+        x, y = xy
+        self._send_request(
+            ReadMemory((x, y, 0), address, size),
+            functools.partial(self._read_span, walk, address))
+
+    def get_heaps(self, chip_coords: Iterable[XY],
+                  pointer: SystemVariableDefinition = HEAP_ADDRESS
+                  ) -> Dict[XY, Sequence[HeapElement]]:
+        """
+        :param chip_coords: The x, y coordinates of the chips to read
+        :param pointer:
+        :returns: List of HeapElements for each chip
+        """
+        self._walks = {xy: _HeapWalk() for xy in chip_coords}
+
+        with self._collect_responses():
+            for (x, y), walk in self._walks.items():
+                self._send_request(
+                    ReadMemory(
+                        (x, y, 0),
+                        SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
+                        pointer.data_type.value),
+                    functools.partial(
+                        self._read_heap_address_response, walk))
+
         with self._collect_responses():
-            self._send_request(
-                ReadMemory(core_coords, address, size), callback)
+            for (x, y), walk in self._walks.items():
+                self._send_request(
+                    ReadMemory((x, y, 0), walk.next_address,
+                               _HEAP_POINTERS.size),
+                    functools.partial(self._read_heap_pointers, walk))
+
+        # Advance all the chips one span at a time until all are done
+        walking = [(xy, walk) for xy, walk in self._walks.items()
+                   if walk.next_address != 0]
+        while walking:
+            with self._collect_responses():
+                for xy, walk in walking:
+                    self.__request_span(xy, walk)
+            walking = [(xy, walk) for xy, walk in walking
+                       if walk.next_address != 0]
+
+        return {xy: walk.blocks for xy, walk in self._walks.items()}
 
     def get_heap(self, chip_coords: XY,
                  pointer: SystemVariableDefinition = HEAP_ADDRESS
@@ -81,19 +176,4 @@ class GetHeapProcess(AbstractMultiConnectionProcess[Response]):
         :param pointer:
         :returns: List of HeapElements
         """
-        x, y = chip_coords
-        core_coords = (x, y, 0)
-        self.__read_address(
-            core_coords, SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
-            pointer.data_type.value, self._read_heap_address_response)
-
-        self.__read_address(
-            core_coords, self._heap_address, 8, self._read_heap_pointer)
-
-        while self._next_block_address != 0:
-            self.__read_address(
-                core_coords, self._next_block_address, 8,
-                functools.partial(
-                    self._read_next_block, self._next_block_address))
-
-        return self._blocks
+        return self.get_heaps([chip_coords], pointer)[chip_coords]
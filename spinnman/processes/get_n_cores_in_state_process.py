@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Iterable, Tuple
+from collections import defaultdict
+from functools import partial
+from typing import Dict, Iterable, Tuple
 
+from spinn_utilities.typing.coords import XY
 from spinnman.model.enums import CPUState
 from spinnman.messages.scp.impl import CountState
 from spinnman.messages.scp.impl.count_state_response import CountStateResponse
@@ -31,7 +34,9 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
     Gets the state of a core over the provided connection.
     """
     __slots__ = [
-        "_n_cores"]
+        "_n_cores",
+        "_state_counts",
+        "_xy_counts"]
 
     def __init__(self, connection_selector: ConnectionSelector):
         """
@@ -40,10 +45,20 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
         super().__init__(connection_selector, timeout=GET_CORE_COUNT_TIMEOUT,
                          non_fail_retry_codes={SCPResult.RC_P2P_NOREPLY})
         self._n_cores = 0
+        self._xy_counts: Dict[XY, int] = defaultdict(int)
+        self._state_counts: Dict[CPUState, int] = defaultdict(int)
 
     def __handle_response(self, response: CountStateResponse) -> None:
         self._n_cores += response.count
 
+    def __handle_state_response(
+            self, state: CPUState, response: CountStateResponse) -> None:
+        self._state_counts[state] += response.count
+
+    def __handle_xy_response(
+            self, xy: XY, response: CountStateResponse) -> None:
+        self._xy_counts[xy] += response.count
+
     def get_n_cores_in_state(self, xys: Iterable[Tuple[int, int]],
                              app_id: int, state: CPUState) -> int:
         """
@@ -59,3 +74,57 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
         self.check_for_error()
 
         return self._n_cores
+
+    def get_n_cores_in_states_by_chip(
+            self, xys: Iterable[XY], app_id: int,
+            states: Iterable[CPUState]) -> Dict[XY, int]:
+        """
+        Count the cores in any of the states separately for each chip asked.
+
+        All the requests (one per chip and state) are sent in a single
+        pipelined round.
+
+        :param xys: The chips to send the count requests to
+        :param app_id:
+        :param states:
+        :returns: The count returned by each of the listed Chips
+        """
+        states = list(states)
+        for xy in xys:
+            self._xy_counts[xy] = 0
+            c_x, c_y = xy
+            for state in states:
+                self._send_request(
+                    CountState(c_x, c_y, app_id, state),
+                    partial(self.__handle_xy_response, xy))
+        self._finish()
+        self.check_for_error()
+
+        return dict(self._xy_counts)
+
+    def get_n_cores_in_states(
+            self, xys: Iterable[XY], app_id: int,
+            states: Iterable[CPUState]) -> Dict[CPUState, int]:
+        """
+        Count the cores in each of the states separately.
+
+        All the requests (one per chip and state) are sent in a single
+        pipelined round.
+
+        :param xys: The chips to send the count requests to
+        :param app_id:
+        :param states:
+        :returns: The number of the listed Chips and IP in each state
+        """
+        states = list(states)
+        for state in states:
+            self._state_counts[state] = 0
+        for c_x, c_y in xys:
+            for state in states:
+                self._send_request(
+                    CountState(c_x, c_y, app_id, state),
+                    partial(self.__handle_state_response, state))
+        self._finish()
+        self.check_for_error()
+
+        return dict(self._state_counts)
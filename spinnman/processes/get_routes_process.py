@@ -12,13 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
 from functools import partial
-from typing import List, Optional
+import struct
+from typing import Dict, List, Mapping, Optional
 
-from spinn_machine import MulticastRoutingEntry, RoutingEntry
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from spinn_machine import MulticastRoutingEntry
 from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
-from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.constants import (
+    SYSTEM_VARIABLE_BASE_ADDRESS, UDP_MESSAGE_MAX_SIZE)
+from spinnman.model.routing_table_array import (
+    INVALID_ROUTE, SDRAM_ENTRY_SIZE, array_to_routes, decode_routing_table)
 
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 from .abstract_multi_connection_process_connection_selector import (
@@ -33,7 +40,12 @@ _ENTRIES_PER_READ = 16
 # 64 reads of 16 entries are required for 1024 entries
 _N_READS = 64
 
-_ROUTE_ENTRY_PATTERN = struct.Struct("<2xBxIII")
+# The number of further reads made in each round for a chip whose table
+# has not ended yet
+_READS_PER_ROUND = 4
+
+_TABLE_ADDRESS = SystemVariableDefinition.router_table_copy_address
+_ONE_WORD = struct.Struct("<I")
 
 
 class GetMultiCastRoutesProcess(AbstractMultiConnectionProcess[Response]):
@@ -42,7 +54,9 @@ class GetMultiCastRoutesProcess(AbstractMultiConnectionProcess[Response]):
     """
     __slots__ = (
         "_app_id",
-        "_entries")
+        "_base_addresses",
+        "_chip_data",
+        "_data")
 
     def __init__(self, connection_selector: ConnectionSelector,
                  app_id: Optional[int] = None):
@@ -51,35 +65,117 @@ class GetMultiCastRoutesProcess(AbstractMultiConnectionProcess[Response]):
         :param app_id:
         """
         super().__init__(connection_selector)
-        self._entries: List[Optional[MulticastRoutingEntry]] = \
-            [None] * _N_ENTRIES
+        self._data = bytearray(_N_ENTRIES * SDRAM_ENTRY_SIZE)
         self._app_id = app_id
+        self._base_addresses: Dict[XY, int] = dict()
+        self._chip_data: Dict[XY, bytearray] = dict()
 
-    def _add_routing_entry(
-            self, route_no: int, offset: int, app_id: int, route: int,
-            key: int, mask: int) -> None:
-        if route >= 0xFF000000:
-            return
-        if self._app_id is not None and self._app_id != app_id:
-            return
+    def __handle_response(self, offset: int, response: Response) -> None:
+        start = offset * SDRAM_ENTRY_SIZE
+        self._data[start:start + response.length] = response.data[
+            response.offset:response.offset + response.length]
 
-        self._entries[route_no + offset] = MulticastRoutingEntry(
-            key, mask, RoutingEntry(spinnaker_route=route))
+    def __handle_base_address_response(
+            self, xy: XY, response: Response) -> None:
+        self._base_addresses[xy] = _ONE_WORD.unpack_from(
+            response.data, response.offset)[0]
 
-    def __handle_response(self, offset: int, response: Response) -> None:
-        for route_no in range(_ENTRIES_PER_READ):
-            entry = _ROUTE_ENTRY_PATTERN.unpack_from(
-                response.data,
-                response.offset + route_no * _ROUTE_ENTRY_PATTERN.size)
-            self._add_routing_entry(route_no, offset, *entry)
+    def __handle_chip_response(
+            self, xy: XY, read: int, response: Response) -> None:
+        start = read * UDP_MESSAGE_MAX_SIZE
+        self._chip_data[xy][start:start + response.length] = response.data[
+            response.offset:response.offset + response.length]
 
-    def get_routes(self, x: int, y: int,
-                   base_address: int) -> List[MulticastRoutingEntry]:
+    def __table_ended(
+            self, data: bytearray, n_reads: int, min_entries: int) -> bool:
+        """
+        Whether the part of a table read so far has reached its end.
+
+        The end is taken to be an unused last entry in the final read,
+        once at least the given number of entries of the application being
+        read have been seen.
+        """
+        if n_reads >= _N_READS:
+            return True
+        n_bytes = n_reads * UDP_MESSAGE_MAX_SIZE
+        routes = numpy.frombuffer(data, dtype="<u4", count=n_bytes // 4)[
+            1::SDRAM_ENTRY_SIZE // 4]
+        if routes[-1] < INVALID_ROUTE:
+            return False
+        return len(decode_routing_table(
+            bytes(data[:n_bytes]), self._app_id)) >= min_entries
+
+    def get_routes_arrays(
+            self, min_entries: Mapping[XY, int],
+            full_read: bool = True) -> Dict[XY, NDArray]:
+        """
+        Read the tables of several chips together.
+
+        By default the whole of each table is read. Otherwise each table is
+        read in rounds from the start and reading stops once it reaches an
+        unused entry at the end of a read, after at least the given number
+        of entries have been seen. This only suits tables that have been
+        loaded in one go, where the entries are next to each other; any
+        entries after a gap are missed.
+
+        :param min_entries:
+            The chips to read, and the number of entries expected on each
+        :param full_read:
+            Whether to read the whole of each table rather than stopping at
+            its apparent end
+        :returns: The Routes read from each chip, as an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        """
+        with self._collect_responses():
+            for (x, y) in min_entries:
+                self._send_request(
+                    ReadMemory((x, y, 0), SYSTEM_VARIABLE_BASE_ADDRESS +
+                               _TABLE_ADDRESS.offset, 4),
+                    partial(self.__handle_base_address_response, (x, y)))
+
+        # Start with enough reads for the expected entries and the end
+        n_reads: Dict[XY, int] = dict()
+        to_read = {
+            xy: (_N_READS if full_read
+                 else min(_N_READS, n // _ENTRIES_PER_READ + 1))
+            for xy, n in min_entries.items()}
+        for xy in min_entries:
+            self._chip_data[xy] = bytearray(_N_ENTRIES * SDRAM_ENTRY_SIZE)
+            n_reads[xy] = 0
+        while to_read:
+            with self._collect_responses():
+                for (x, y), n_to_read in to_read.items():
+                    base_address = self._base_addresses[x, y]
+                    for read in range(n_reads[x, y],
+                                      n_reads[x, y] + n_to_read):
+                        self._send_request(
+                            ReadMemory(
+                                (x, y, 0),
+                                base_address + read * UDP_MESSAGE_MAX_SIZE,
+                                UDP_MESSAGE_MAX_SIZE),
+                            partial(self.__handle_chip_response, (x, y),
+                                    read))
+            for xy, n_to_read in to_read.items():
+                n_reads[xy] += n_to_read
+            to_read = {
+                xy: min(_READS_PER_ROUND, _N_READS - n_reads[xy])
+                for xy in to_read
+                if not self.__table_ended(
+                    self._chip_data[xy], n_reads[xy], min_entries[xy])}
+
+        return {
+            xy: decode_routing_table(
+                bytes(data[:n_reads[xy] * UDP_MESSAGE_MAX_SIZE]),
+                self._app_id)
+            for xy, data in self._chip_data.items()}
+
+    def get_routes_array(self, x: int, y: int, base_address: int) -> NDArray:
         """
         :param x:
         :param y:
         :param base_address:
-        :returns: The Routes read from the scamp chip
+        :returns: The Routes read from the scamp chip, as an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
         """
         # Create the read requests
         offset = 0
@@ -93,4 +189,14 @@ class GetMultiCastRoutesProcess(AbstractMultiConnectionProcess[Response]):
                     partial(self.__handle_response, offset))
                 offset += _ENTRIES_PER_READ
 
-        return [entry for entry in self._entries if entry is not None]
+        return decode_routing_table(bytes(self._data), self._app_id)
+
+    def get_routes(self, x: int, y: int,
+                   base_address: int) -> List[MulticastRoutingEntry]:
+        """
+        :param x:
+        :param y:
+        :param base_address:
+        :returns: The Routes read from the scamp chip
+        """
+        return array_to_routes(self.get_routes_array(x, y, base_address))
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from functools import partial
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from spinn_machine.tags import AbstractTag, ReverseIPTag, IPTag
 
@@ -30,7 +30,7 @@ from .abstract_multi_connection_process_connection_selector import (
 
 class GetTagsProcess(AbstractMultiConnectionProcess):
     """
-    Gets information about the tags over the provided connection.
+    Gets information about the tags over the provided connections.
     """
     __slots__ = (
         "_tags",
@@ -41,26 +41,29 @@ class GetTagsProcess(AbstractMultiConnectionProcess):
         :param connection_selector:
         """
         super().__init__(connection_selector)
-        self._tag_info: Optional[IPTagGetInfoResponse] = None
-        self._tags: List[Optional[AbstractTag]] = []
+        self._tag_info: Dict[SCAMPConnection, IPTagGetInfoResponse] = dict()
+        self._tags: Dict[SCAMPConnection, List[Optional[AbstractTag]]] = \
+            dict()
 
     def __handle_tag_info_response(
-            self, response: IPTagGetInfoResponse) -> None:
-        self._tag_info = response
+            self, connection: SCAMPConnection,
+            response: IPTagGetInfoResponse) -> None:
+        self._tag_info[connection] = response
 
-    def __handle_get_tag_response(self, tag: int, board_address: str,
-                                  response: IPTagGetResponse) -> None:
+    def __handle_get_tag_response(
+            self, connection: SCAMPConnection, tag: int, board_address: str,
+            response: IPTagGetResponse) -> None:
         if response.in_use:
             ip = response.ip_address
             host = f"{ip[0]}.{ip[1]}.{ip[2]}.{ip[3]}"
             if response.is_reverse:
-                self._tags[tag] = ReverseIPTag(
+                self._tags[connection][tag] = ReverseIPTag(
                     board_address, tag,
                     response.rx_port, response.spin_chip_x,
                     response.spin_chip_y, response.spin_cpu,
                     response.spin_port)
             else:
-                self._tags[tag] = IPTag(
+                self._tags[connection][tag] = IPTag(
                     board_address, response.sdp_header.source_chip_x,
                     response.sdp_header.source_chip_y, tag, host,
                     response.port, response.strip_sdp)
@@ -70,25 +73,41 @@ class GetTagsProcess(AbstractMultiConnectionProcess):
         :param connection:
         :returns: The tags read from the connection.
         """
+        return self.get_tags_multi([connection])
+
+    def get_tags_multi(
+            self, connections: Iterable[SCAMPConnection]
+            ) -> List[AbstractTag]:
+        """
+        Read the tags of several boards together.
+
+        :param connections: The connections to the boards to read
+        :returns: The tags read from the connections, board by board.
+        """
+        connections = list(connections)
+
         # Get the tag information, without which we cannot continue
         with self._collect_responses():
-            self._send_request(IPTagGetInfo(
-                connection.chip_x, connection.chip_y),
-                self.__handle_tag_info_response)
-        assert self._tag_info is not None
+            for connection in connections:
+                self._send_request(
+                    IPTagGetInfo(connection.chip_x, connection.chip_y),
+                    partial(self.__handle_tag_info_response, connection))
 
         # Get the tags themselves
-        n_tags = self._tag_info.pool_size + self._tag_info.fixed_size
-        self._tags = [None] * n_tags
         with self._collect_responses():
-            board_address = connection.remote_ip_address
-            assert board_address is not None
-            for tag in range(n_tags):
-                self._send_request(IPTagGet(
-                    connection.chip_x, connection.chip_y, tag),
-                    partial(
-                        self.__handle_get_tag_response, tag,
-                        board_address))
+            for connection in connections:
+                tag_info = self._tag_info[connection]
+                n_tags = tag_info.pool_size + tag_info.fixed_size
+                self._tags[connection] = [None] * n_tags
+                board_address = connection.remote_ip_address
+                assert board_address is not None
+                for tag in range(n_tags):
+                    self._send_request(IPTagGet(
+                        connection.chip_x, connection.chip_y, tag),
+                        partial(
+                            self.__handle_get_tag_response, connection, tag,
+                            board_address))
 
         # Return the tags
-        return [tag for tag in self._tags if tag is not None]
+        return [tag for connection in connections
+                for tag in self._tags[connection] if tag is not None]
@@ -12,45 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
-from typing import Collection
+import functools
+from typing import Collection, Dict, Mapping, Union
 
-from spinn_machine import Router
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
 from spinn_machine.multicast_routing_entry import MulticastRoutingEntry
 
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE
 from spinnman.exceptions import SpinnmanInvalidParameterException
-from spinnman.messages.scp.impl import RouterInit, RouterAlloc
+from spinnman.messages.scp.impl import RouterInit, RouterAlloc, WriteMemory
 from spinnman.messages.scp.impl.router_alloc import RouterAllocResponse
+from spinnman.model.routing_table_array import (
+    encode_routing_table, routes_to_array)
 
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 from .abstract_multi_connection_process_connection_selector import (
     ConnectionSelector)
-from .write_memory_process import WriteMemoryProcess
 
-_ROUTE_PATTERN = struct.Struct("<H2xIII")
-_END_PATTERN = struct.Struct("<IIII")
 _TABLE_ADDRESS = 0x67800000
 
 
 class LoadMultiCastRoutesProcess(AbstractMultiConnectionProcess):
     """
-    A process for loading the multicast routing table on a SpiNNaker chip.
+    A process for loading the multicast routing tables on SpiNNaker chips.
+
+    Each step of the load is done for all the chips at once, so the time
+    taken depends on the largest table rather than the number of chips.
     """
-    __slots__ = ("_base_address", )
+    __slots__ = ("_base_addresses", )
 
     def __init__(self, connection_selector: ConnectionSelector):
         """
         :param connection_selector:
         """
         super().__init__(connection_selector)
-        self._base_address = 0
+        self._base_addresses: Dict[XY, int] = dict()
 
     def __handle_router_alloc_response(
-            self, response: RouterAllocResponse) -> None:
-        self._base_address = response.base_address
+            self, xy: XY, response: RouterAllocResponse) -> None:
+        self._base_addresses[xy] = response.base_address
 
     def load_routes(
-            self, x: int, y: int, routes: Collection[MulticastRoutingEntry],
+            self, x: int, y: int,
+            routes: Union[Collection[MulticastRoutingEntry], NDArray],
             app_id: int) -> None:
         """
         Converts the routing entries to Machine format
@@ -59,41 +65,59 @@ class LoadMultiCastRoutesProcess(AbstractMultiConnectionProcess):
         :param x:
         :param y:
         :param routes:
+            The entries, or an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :param app_id:
+        """
+        self.load_routes_multi({(x, y): routes}, app_id)
+
+    def load_routes_multi(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> None:
+        """
+        Converts the routing entries to Machine format
+        and loads then onto each of the Chips.
+
+        :param routes:
+            The routes to load for each chip, as entries or as an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`;
+            the app_id field of an array is ignored
         :param app_id:
         """
-        # Create the routing data - 16 bytes per entry plus one for the end
-        # entry
-        routing_data = bytearray(16 * (len(routes) + 1))
-        n_entries = 0
-        for route in routes:
-            route_entry = \
-                Router.convert_routing_table_entry_to_spinnaker_route(route)
-
-            _ROUTE_PATTERN.pack_into(
-                routing_data, n_entries * 16, n_entries,
-                route_entry, route.key, route.mask)
-            n_entries += 1
-
-        # Add an entry to mark the end
-        _END_PATTERN.pack_into(
-            routing_data, n_entries * 16,
-            0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF)
-
-        # Upload the data
-        process = WriteMemoryProcess(self._conn_selector)
-        process.write_memory_from_bytearray(
-            (x, y, 0), _TABLE_ADDRESS, routing_data, 0, len(routing_data))
-
-        # Allocate space in the router table
+        # Upload the data of all the chips
+        n_entries: Dict[XY, int] = dict()
+        with self._collect_responses():
+            for (x, y), chip_routes in routes.items():
+                if not isinstance(chip_routes, numpy.ndarray):
+                    chip_routes = routes_to_array(chip_routes)
+                n_entries[x, y] = len(chip_routes)
+                routing_data = encode_routing_table(chip_routes)
+                for offset in range(
+                        0, len(routing_data), UDP_MESSAGE_MAX_SIZE):
+                    self._send_request(WriteMemory(
+                        (x, y, 0), _TABLE_ADDRESS + offset,
+                        routing_data[offset:offset + UDP_MESSAGE_MAX_SIZE]))
+
+        # Allocate space in the router tables
+        self._base_addresses = dict()
         with self._collect_responses():
-            self._send_request(RouterAlloc(x, y, app_id, n_entries),
-                               self.__handle_router_alloc_response)
-        if self._base_address == 0:
+            for (x, y), n in n_entries.items():
+                self._send_request(
+                    RouterAlloc(x, y, app_id, n),
+                    functools.partial(
+                        self.__handle_router_alloc_response, (x, y)))
+        failed = sorted(
+            xy for xy, address in self._base_addresses.items()
+            if address == 0)
+        if failed:
             raise SpinnmanInvalidParameterException(
-                "Allocation base address", str(self._base_address),
-                "Not enough space to allocate the entries")
+                "Allocation base address", "0",
+                f"Not enough space to allocate the entries on {failed}")
 
         # Load the entries
         with self._collect_responses():
-            self._send_request(RouterInit(
-                x, y, n_entries, _TABLE_ADDRESS, self._base_address, app_id))
+            for (x, y), n in n_entries.items():
+                self._send_request(RouterInit(
+                    x, y, n, _TABLE_ADDRESS, self._base_addresses[x, y],
+                    app_id))
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from types import TracebackType
+from typing import Dict, Iterable, Tuple
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
+from spinnman.messages.scp.impl.read_fpga_register import (
+    ReadFPGARegister, _SCPReadFPGARegisterResponse as Response)
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .abstract_multi_connection_process_connection_selector import (
+    ConnectionSelector)
+
+
+class ReadFPGARegistersProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for reading a register of many FPGAs on many boards
+    together, through a BMP.
+    """
+    __slots__ = ("_values", )
+
+    def __init__(self, connection_selector: ConnectionSelector,
+                 n_retries: int = 3, timeout: float = 1.0):
+        """
+        :param connection_selector:
+        :param n_retries:
+            The number of retries of a message to use. Passed to
+            :py:class:`SCPRequestPipeLine`
+        :param timeout:
+            The timeout, in seconds. Passed to
+            :py:class:`SCPRequestPipeLine`
+        """
+        super().__init__(
+            connection_selector, n_retries=n_retries, timeout=timeout)
+        self._values: Dict[Tuple[int, int], int] = dict()
+
+    def __handle_response(
+            self, board: int, fpga_num: int, response: Response) -> None:
+        self._values[board, fpga_num] = response.fpga_register
+
+    @staticmethod
+    def __handle_error(
+            request: AbstractSCPRequest[Response], exception: Exception,
+            tb: TracebackType, connection: SCAMPConnection) -> None:
+        # pylint: disable=unused-argument
+        pass
+
+    def read_fpga_registers(
+            self, boards: Iterable[int], fpga_nums: Iterable[int],
+            register: int, allow_failures: bool = False
+            ) -> Dict[Tuple[int, int], int]:
+        """
+        Read a register of each of the given FPGAs of each of the given
+        boards.
+
+        :param boards: The boards to read the FPGAs of
+        :param fpga_nums: The FPGAs (0, 1 or 2) to read on each board
+        :param register: The address of the register to read
+        :param allow_failures:
+            Whether FPGAs that cannot be read are left out of the result
+            instead of causing an exception
+        :returns: The value read, by board and then FPGA number
+        :raise SpinnmanIOException:
+            If there is an error communicating with the BMP
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        fpga_list = list(fpga_nums)
+        with self._collect_responses():
+            for board in boards:
+                for fpga_num in fpga_list:
+                    self._send_request(
+                        ReadFPGARegister(fpga_num, register, board),
+                        functools.partial(
+                            self.__handle_response, board, fpga_num),
+                        self.__handle_error if allow_failures else None)
+        return self._values
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 import functools
 import struct
 from collections import defaultdict
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 from spinn_utilities.typing.coords import XYP
 from spinn_machine import CoreSubsets
 from spinnman.model import IOBuffer
@@ -68,6 +69,7 @@ class _NextRegion:
 
 
 _ENCODING = "ascii"
+_N_WRITERS = 4
 _ONE_WORD = struct.Struct("<I")
 _FIRST_IOBUF = struct.Struct("<I8xI")
 
@@ -78,10 +80,12 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
     SpiNNaker core.
     """
     __slots__ = (
+        "_completed",
         "_extra_reads",
         "_iobuf",
         "_iobuf_address",
         "_iobuf_view",
+        "_n_pending",
         "_next_reads")
 
     def __init__(self, connection_selector: ConnectionSelector) -> None:
@@ -107,10 +111,23 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         # read = list of (x, y, p, n, next_address, first_read_size)
         self._next_reads: List[_NextRegion] = list()
 
+        # A dictionary of (x, y, p) -> number of reads still to be done
+        self._n_pending: Dict[XYP, int] = defaultdict(int)
+
+        # The cores whose reads have all been done but not yet returned
+        self._completed: List[XYP] = list()
+
+    def __read_done(self, xyp: XYP) -> None:
+        self._n_pending[xyp] -= 1
+        if self._n_pending[xyp] == 0:
+            del self._n_pending[xyp]
+            self._completed.append(xyp)
+
     def _request_iobuf_address(
             self, iobuf_size: int, x: int, y: int, p: int) -> None:
         scamp_coords = (x, y, 0)
         base_address = get_vcpu_address(p) + CPU_IOBUF_ADDRESS_OFFSET
+        self._n_pending[x, y, p] += 1
         self._send_request(
             ReadMemory(scamp_coords, base_address, 4),
             functools.partial(self.__handle_iobuf_address_response,
@@ -122,8 +139,10 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         iobuf_address, = _ONE_WORD.unpack_from(response.data, response.offset)
         if iobuf_address != 0:
             first_read_size = min((iobuf_size + 16, UDP_MESSAGE_MAX_SIZE))
+            self._n_pending[xyp] += 1
             self._next_reads.append(_NextRegion(
                 scamp_coords, xyp, 0, iobuf_address, first_read_size))
+        self.__read_done(xyp)
 
     def _request_iobuf_region_tail(self, tail: _RegionTail) -> None:
         self._send_request(
@@ -137,6 +156,7 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         base = tail.offset
         view[base:base + response.length] = response.data[
             response.offset:response.offset + response.length]
+        self.__read_done(tail.core_coords)
 
     def _request_iobuf_region(self, region: _NextRegion) -> None:
         self._send_request(
@@ -174,6 +194,7 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         while bytes_to_read > 0:
             # Read the next bit of memory making up the buffer
             next_bytes_to_read = min((bytes_to_read, UDP_MESSAGE_MAX_SIZE))
+            self._n_pending[region.core_coords] += 1
             self._extra_reads.append(region.tail(
                 base_address, next_bytes_to_read, read_offset))
             base_address += next_bytes_to_read
@@ -182,15 +203,31 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
 
         # If there is another IOBuf buffer, read this next
         if next_address != 0:
+            self._n_pending[region.core_coords] += 1
             self._next_reads.append(region.next_at(next_address))
+        self.__read_done(region.core_coords)
 
-    def read_iobuf(
+    def __take_iobuf(self, xyp: XYP) -> bytes:
+        """
+        Remove the buffers of a completed core and join them.
+
+        :param xyp:
+        :returns: The IOBUF bytes of the core
+        """
+        blocks = self._iobuf.pop(xyp, {})
+        self._iobuf_view.pop(xyp, None)
+        return b"".join(blocks[n] for n in sorted(blocks))
+
+    def _read_completed(
             self, iobuf_size: int,
-            core_subsets: CoreSubsets) -> Iterable[IOBuffer]:
+            core_subsets: CoreSubsets) -> Iterator[Tuple[XYP, bytes]]:
         """
+        Read the IOBUF of the cores, returning each core's bytes as soon as
+        all of its blocks have been read.
+
         :param iobuf_size:
         :param core_subsets:
-        :returns: IOBuffer for each core in order
+        :returns: (x, y, p) and IOBUF bytes for each core
         """
         # Get the iobuf address for each core
         with self._collect_responses():
@@ -200,7 +237,12 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
                     self._request_iobuf_address(iobuf_size, x, y, p)
 
         # Run rounds of the process until reading is complete
-        while self._extra_reads or self._next_reads:
+        while True:
+            while self._completed:
+                xyp = self._completed.pop()
+                yield xyp, self.__take_iobuf(xyp)
+            if not self._extra_reads and not self._next_reads:
+                break
             with self._collect_responses():
                 # Process the extra iobuf reads needed
                 while self._extra_reads:
@@ -210,10 +252,48 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
                 while self._next_reads:
                     self._request_iobuf_region(self._next_reads.pop())
 
-        for core_subset in core_subsets:
-            x, y = core_subset.x, core_subset.y
-            for p in core_subset.processor_ids:
-                iobuf = ""
-                for item in self._iobuf[x, y, p].values():
-                    iobuf += item.decode(_ENCODING)
-                yield IOBuffer(x, y, p, iobuf)
+    def read_iobuf(
+            self, iobuf_size: int,
+            core_subsets: CoreSubsets) -> Iterable[IOBuffer]:
+        """
+        :param iobuf_size:
+        :param core_subsets:
+        :returns:
+            IOBuffer for each core, in the order in which their reading
+            completes
+        """
+        for (x, y, p), iobuf in self._read_completed(
+                iobuf_size, core_subsets):
+            yield IOBuffer(x, y, p, iobuf.decode(_ENCODING))
+
+    def write_iobuf(
+            self, iobuf_size: int, core_subsets: CoreSubsets,
+            filename: Callable[[int, int, int], str],
+            n_writers: int = _N_WRITERS) -> List[str]:
+        """
+        Read the IOBUF of the cores and write each to its own file as soon
+        as it has been read, while the reading of other cores continues.
+
+        :param iobuf_size:
+        :param core_subsets:
+        :param filename: Gets the name of the file to write for x, y, p
+        :param n_writers: The number of threads writing files
+        :returns: The names of the files written
+        """
+        filenames: List[str] = list()
+        futures: List[Future[None]] = list()
+        with ThreadPoolExecutor(max_workers=n_writers) as writers:
+            for (x, y, p), iobuf in self._read_completed(
+                    iobuf_size, core_subsets):
+                name = filename(x, y, p)
+                filenames.append(name)
+                futures.append(writers.submit(_write_file, name, iobuf))
+        for future in futures:
+            # Raise any exception from the writing
+            future.result()
+        return filenames
+
+
+def _write_file(filename: str, data: bytes) -> None:
+    with open(filename, "wb") as f:
+        f.write(data)
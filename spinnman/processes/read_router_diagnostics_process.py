@@ -12,7 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 import struct
+from typing import Iterable, Optional, Tuple
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from spinnman.constants import (
+    N_ROUTER_DIAGNOSTICS_COLUMNS, ROUTER_DIAGNOSTICS_CONTROL_COLUMN,
+    ROUTER_DIAGNOSTICS_ERROR_COLUMN)
 from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
 from spinnman.model import RouterDiagnostics
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
@@ -30,6 +38,7 @@ class ReadRouterDiagnosticsProcess(
     """
     __slots__ = (
         "_control_register",
+        "_diagnostics",
         "_error_status",
         "_register_values")
 
@@ -41,6 +50,7 @@ class ReadRouterDiagnosticsProcess(
         self._control_register = 0
         self._error_status = 0
         self._register_values = [0] * _N_REGISTERS
+        self._diagnostics: Optional[NDArray] = None
 
     def __handle_control_register_response(self, response: Response) -> None:
         self._control_register = _ONE_WORD.unpack_from(
@@ -72,3 +82,64 @@ class ReadRouterDiagnosticsProcess(
 
         return RouterDiagnostics(self._control_register, self._error_status,
                                  self._register_values)
+
+    def __handle_row_response(
+            self, row: int, column: int, response: Response) -> None:
+        assert self._diagnostics is not None
+        n_words = response.length // 4
+        self._diagnostics[row, column:column + n_words] = numpy.frombuffer(
+            response.data, dtype="<u4", count=n_words,
+            offset=response.offset)
+
+    def get_router_diagnostics_all(
+            self, xys: Iterable[XY]
+            ) -> Tuple[NDArray, NDArray, NDArray]:
+        """
+        Read the router diagnostics of several chips together.
+
+        :param xys: The coordinates of the chips to read
+        :returns:
+            The x and y coordinates of the chips, and an array with a row
+            for each chip. The row has the 16 counters, indexed by
+            :py:class:`~spinnman.constants.ROUTER_REGISTER_REGISTERS`,
+            then the control register and the error status.
+        """
+        chips = list(xys)
+        xs = numpy.array([x for x, _ in chips], dtype=numpy.uint8)
+        ys = numpy.array([y for _, y in chips], dtype=numpy.uint8)
+        self._diagnostics = numpy.zeros(
+            (len(chips), N_ROUTER_DIAGNOSTICS_COLUMNS), dtype=numpy.uint32)
+        with self._collect_responses():
+            for row, (x, y) in enumerate(chips):
+                coords = x, y, 0
+                self._send_request(
+                    ReadMemory(coords, 0xe1000000, 4),
+                    partial(self.__handle_row_response, row,
+                            ROUTER_DIAGNOSTICS_CONTROL_COLUMN))
+                self._send_request(
+                    ReadMemory(coords, 0xe1000014, 4),
+                    partial(self.__handle_row_response, row,
+                            ROUTER_DIAGNOSTICS_ERROR_COLUMN))
+                self._send_request(
+                    ReadMemory(coords, 0xe1000300, _N_REGISTERS * 4),
+                    partial(self.__handle_row_response, row, 0))
+        return xs, ys, self._diagnostics
+
+    def get_router_counters_all(self, xys: Iterable[XY]) -> NDArray:
+        """
+        Read only the diagnostic counters of several chips together.
+
+        :param xys: The coordinates of the chips to read
+        :returns:
+            An array with a row for each chip of the 16 counters, indexed by
+            :py:class:`~spinnman.constants.ROUTER_REGISTER_REGISTERS`
+        """
+        chips = list(xys)
+        self._diagnostics = numpy.zeros(
+            (len(chips), _N_REGISTERS), dtype=numpy.uint32)
+        with self._collect_responses():
+            for row, (x, y) in enumerate(chips):
+                self._send_request(
+                    ReadMemory((x, y, 0), 0xe1000300, _N_REGISTERS * 4),
+                    partial(self.__handle_row_response, row, 0))
+        return self._diagnostics
@@ -0,0 +1,137 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from types import TracebackType
+from typing import Dict, Iterable, List, Tuple, cast
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.typing.coords import XY
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.constants import (
+    SYSTEM_VARIABLE_BASE_ADDRESS, UDP_MESSAGE_MAX_SIZE)
+from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+
+
+def _variable_size(variable: SystemVariableDefinition) -> int:
+    if variable.data_type.is_byte_array:
+        return cast(int, variable.array_size)
+    return variable.data_type.value
+
+
+def _covering_spans(
+        variables: Iterable[SystemVariableDefinition]
+        ) -> List[Tuple[int, int]]:
+    """
+    Work out the spans of the system variable block to read to get the
+    given variables, using as few reads as possible.
+
+    :param variables: The variables to be read
+    :returns: The offset and size of each span to read
+    """
+    spans: List[Tuple[int, int]] = list()
+    for start, end in sorted(
+            (variable.offset, variable.offset + _variable_size(variable))
+            for variable in variables):
+        if spans and end - spans[-1][0] <= UDP_MESSAGE_MAX_SIZE:
+            span_start, span_size = spans[-1]
+            spans[-1] = (
+                span_start, max(span_start + span_size, end) - span_start)
+        else:
+            spans.append((start, end - start))
+    return spans
+
+
+class ReadSystemVariablesProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for reading system variables of many chips together.
+    """
+    __slots__ = ()
+
+    def __handle_response(
+            self, raw: NDArray[numpy.uint8], index: int, offset: int,
+            response: Response) -> None:
+        raw[index, offset:offset + response.length] = numpy.frombuffer(
+            response.data, numpy.uint8, response.length, response.offset)
+
+    @staticmethod
+    def __handle_error(
+            read: NDArray[numpy.bool_], index: int,
+            request: AbstractSCPRequest[Response], exception: Exception,
+            tb: TracebackType, connection: SCAMPConnection) -> None:
+        # pylint: disable=unused-argument
+        read[index] = False
+
+    def read_system_variables(
+            self, xys: Iterable[XY],
+            variables: Iterable[SystemVariableDefinition],
+            allow_failures: bool = False
+            ) -> Tuple[NDArray[numpy.bool_],
+                       Dict[SystemVariableDefinition, NDArray]]:
+        """
+        Read system variables of many chips.
+
+        :param xys: The chips to read the variables of
+        :param variables: The variables to read
+        :param allow_failures:
+            Whether chips that cannot be read are marked as such in the
+            result instead of causing an exception
+        :returns:
+            Whether each chip was read, and a column of values, in the same
+            order as the chips, for each variable.  Byte array variables
+            have a row of bytes for each chip.
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        chips = list(xys)
+        variable_list = list(variables)
+        spans = _covering_spans(variable_list)
+        base = spans[0][0] if spans else 0
+        size = (spans[-1][0] + spans[-1][1] - base) if spans else 0
+        raw = numpy.zeros((len(chips), size), dtype=numpy.uint8)
+        read = numpy.ones(len(chips), dtype=numpy.bool_)
+
+        with self._collect_responses():
+            for index, (x, y) in enumerate(chips):
+                for offset, span_size in spans:
+                    self._send_request(
+                        ReadMemory(
+                            (x, y, 0), SYSTEM_VARIABLE_BASE_ADDRESS + offset,
+                            span_size),
+                        functools.partial(
+                            self.__handle_response, raw, index,
+                            offset - base),
+                        functools.partial(self.__handle_error, read, index)
+                        if allow_failures else None)
+
+        columns: Dict[SystemVariableDefinition, NDArray] = dict()
+        for variable in variable_list:
+            start = variable.offset - base
+            data = numpy.ascontiguousarray(
+                raw[:, start:start + _variable_size(variable)])
+            if variable.data_type.is_byte_array:
+                columns[variable] = data
+            else:
+                columns[variable] = data.view(
+                    variable.data_type.struct_code).reshape(len(chips))
+        return read, columns
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import struct
+from typing import Collection, Dict, List, Sequence
+from spinn_utilities.typing.coords import XYP
+from spinn_machine import CoreSubsets
+from spinnman.constants import (
+    CPU_MAX_USER, CPU_USER_OFFSET, CPU_USER_START_ADDRESS,
+    UDP_MESSAGE_MAX_SIZE)
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.model.enums import UserRegister
+from spinnman.utilities.utility_functions import get_vcpu_address
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .abstract_multi_connection_process_connection_selector import (
+    ConnectionSelector)
+
+
+class ReadUserProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for reading the user registers of many cores.
+
+    The registers of each core are read together, and the registers of
+    cores on the same chip are read together where they fit in a single
+    packet.
+    """
+    __slots__ = ("_values", )
+
+    def __init__(self, connection_selector: ConnectionSelector):
+        """
+        :param connection_selector:
+        """
+        super().__init__(connection_selector)
+        self._values: Dict[XYP, Dict[UserRegister, int]] = dict()
+
+    def __handle_response(
+            self, x: int, y: int, processors: Sequence[int],
+            users: Sequence[UserRegister], base_address: int,
+            response: Response) -> None:
+        for p in processors:
+            values = self._values.setdefault((x, y, p), dict())
+            for user in users:
+                offset = (get_vcpu_address(p) + CPU_USER_START_ADDRESS +
+                          CPU_USER_OFFSET * user - base_address)
+                values[user], = struct.unpack_from(
+                    "<I", response.data, response.offset + offset)
+
+    def __read(self, x: int, y: int, processors: List[int],
+               users: Sequence[UserRegister], start: int, end: int) -> None:
+        base_address = get_vcpu_address(processors[0]) + start
+        size = get_vcpu_address(processors[-1]) + end - base_address
+        self._send_request(
+            ReadMemory((x, y, 0), base_address, size),
+            functools.partial(
+                self.__handle_response, x, y, processors, users,
+                base_address))
+
+    def read_users(
+            self, core_subsets: CoreSubsets, users: Collection[UserRegister]
+            ) -> Dict[XYP, Dict[UserRegister, int]]:
+        """
+        Read user registers of many cores.
+
+        :param core_subsets: The cores to read the registers of
+        :param users: The registers to read on every core
+        :returns: The values read, by core and then by register
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If x, y, p does not identify a valid processor
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        user_list = sorted(set(users))
+        if not user_list:
+            return dict()
+        if user_list[0] < 0 or user_list[-1] > CPU_MAX_USER:
+            raise ValueError(f"Incorrect user numbers {users}")
+
+        # The span of the registers within the block of each core
+        start = CPU_USER_START_ADDRESS + CPU_USER_OFFSET * user_list[0]
+        end = CPU_USER_START_ADDRESS + CPU_USER_OFFSET * (user_list[-1] + 1)
+
+        with self._collect_responses():
+            for core_subset in core_subsets:
+                x, y = core_subset.x, core_subset.y
+                processors: List[int] = list()
+                for p in sorted(core_subset.processor_ids):
+                    # Read cores together while the span fits in a packet
+                    if processors and (
+                            get_vcpu_address(p) + end -
+                            get_vcpu_address(processors[0]) - start >
+                            UDP_MESSAGE_MAX_SIZE):
+                        self.__read(x, y, processors, user_list, start, end)
+                        processors = list()
+                    processors.append(p)
+                if processors:
+                    self.__read(x, y, processors, user_list, start, end)
+        return self._values
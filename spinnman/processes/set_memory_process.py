@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import struct
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from spinn_utilities.progress_bar import ProgressBar
 
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE
 from spinnman.processes.abstract_multi_connection_process import (
     AbstractMultiConnectionProcess)
 from spinnman.messages.scp.impl.check_ok_response import CheckOKResponse
@@ -26,6 +27,8 @@ _ONE_WORD = struct.Struct("<I")
 
 class SetMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
     """ A Process to set a single word of memory on a set of cores
+
+    Words that are next to each other on the same chip are written together.
     """
 
     def set_values(
@@ -44,10 +47,33 @@ class SetMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
         :raise SpinnmanUnexpectedResponseCodeException:
             If a response indicates an error during the exchange
         """
-        progress = ProgressBar(len(values), description)
-        for x, y, addr, value in progress.over(values):
-            data_to_write = _ONE_WORD.pack(value)
-            self._send_request(WriteMemory((x, y, 0), addr, data_to_write))
+        # Put the words in order so that runs of consecutive words on a
+        # chip can be written with a single packet; a later value for the
+        # same word replaces an earlier one
+        words: Dict[Tuple[int, int, int], int] = dict()
+        for x, y, addr, value in values:
+            words[x, y, addr] = value
+        progress = ProgressBar(len(words), description)
+        run: List[int] = list()
+        run_x = run_y = run_address = 0
+        for (x, y, addr), value in sorted(words.items()):
+            if run and (
+                    (x, y) != (run_x, run_y) or
+                    addr != run_address + len(run) * _ONE_WORD.size or
+                    (len(run) + 1) * _ONE_WORD.size > UDP_MESSAGE_MAX_SIZE):
+                self.__write_run(run_x, run_y, run_address, run, progress)
+                run = list()
+            if not run:
+                run_x, run_y, run_address = x, y, addr
+            run.append(value)
+        if run:
+            self.__write_run(run_x, run_y, run_address, run, progress)
         self._finish()
         self.check_for_error()
         progress.end()
+
+    def __write_run(self, x: int, y: int, address: int, run: List[int],
+                    progress: ProgressBar) -> None:
+        self._send_request(WriteMemory(
+            (x, y, 0), address, struct.pack(f"<{len(run)}I", *run)))
+        progress.update(len(run))
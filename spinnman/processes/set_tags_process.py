@@ -0,0 +1,72 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Iterable, Tuple
+from spinn_machine.tags import IPTag, ReverseIPTag
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.scp.impl import (
+    CheckOKResponse, IPTagClear, IPTagSet, ReverseIPTagSet)
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+
+
+class SetTagsProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
+    """
+    A process for setting and clearing the tags of many boards together.
+    """
+    __slots__ = ()
+
+    def set_tags(
+            self, ip_tags: Iterable[Tuple[SCAMPConnection, bytes, IPTag]],
+            reverse_ip_tags: Iterable[Tuple[SCAMPConnection, ReverseIPTag]],
+            use_sender: bool = False) -> None:
+        """
+        Set IP tags and reverse IP tags, all in one round.
+
+        :param ip_tags:
+            The connection to the board to set each tag on, the IP
+            address the tag sends to and the tag
+        :param reverse_ip_tags:
+            The connection to the board to set each tag on and the tag
+        :param use_sender:
+            Whether the IP tags use the sender host and port instead of
+            the given host and port
+        """
+        with self._collect_responses():
+            for connection, ip_address, ip_tag in ip_tags:
+                assert ip_tag.port is not None
+                self._send_request(IPTagSet(
+                    connection.chip_x, connection.chip_y,
+                    bytearray(ip_address), ip_tag.port, ip_tag.tag,
+                    strip=ip_tag.strip_sdp, use_sender=use_sender))
+            for connection, reverse_ip_tag in reverse_ip_tags:
+                assert reverse_ip_tag.port is not None
+                self._send_request(ReverseIPTagSet(
+                    connection.chip_x, connection.chip_y,
+                    reverse_ip_tag.destination_x,
+                    reverse_ip_tag.destination_y,
+                    reverse_ip_tag.destination_p,
+                    reverse_ip_tag.port, reverse_ip_tag.tag,
+                    reverse_ip_tag.sdp_port))
+
+    def clear_tags(self, tags: Iterable[Tuple[SCAMPConnection, int]]) -> None:
+        """
+        Clear tags, all in one round.
+
+        :param tags: The connection to the board to clear each tag on and
+            the tag ID
+        """
+        with self._collect_responses():
+            for connection, tag in tags:
+                self._send_request(IPTagClear(
+                    connection.chip_x, connection.chip_y, tag))
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+import functools
+import struct
+from collections import defaultdict
+from typing import Dict, Iterable, List, MutableMapping
+from spinn_utilities.typing.coords import XYP
+from spinn_machine import CoreSubsets
+from spinnman.model import IOBuffer
+from spinnman.utilities.utility_functions import get_vcpu_address
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE, CPU_IOBUF_ADDRESS_OFFSET
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .abstract_multi_connection_process_connection_selector import (
+    ConnectionSelector)
+
+_ENCODING = "ascii"
+_ONE_WORD = struct.Struct("<I")
+_IOBUF_HEADER = struct.Struct("<I8xI")
+
+
+@dataclass(frozen=True)
+class IOBufTail:
+    """
+    How much of the IOBUF of a core has already been read.
+    """
+    #: The address of the first IOBUF block of the core
+    first_address: int
+    #: The address of the last IOBUF block seen
+    block_address: int
+    #: The number of bytes of the last block already read
+    n_read: int
+
+
+@dataclass(frozen=True)
+class _BlockRead:
+    core_coords: XYP
+    n: int
+    block_address: int
+    n_read: int
+
+
+@dataclass(frozen=True)
+class _DataRead:
+    core_coords: XYP
+    n: int
+    address: int
+    size: int
+    offset: int
+
+
+class TailIOBufProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for reading only the IOBUF text written by SpiNNaker cores
+    since it was last read.
+
+    The positions reached are kept in a mapping which is updated in place,
+    so passing the same mapping to repeated calls only transfers new text.
+    """
+    __slots__ = (
+        "_block_reads",
+        "_data_reads",
+        "_iobuf",
+        "_iobuf_size",
+        "_tails")
+
+    def __init__(self, connection_selector: ConnectionSelector,
+                 tails: MutableMapping[XYP, IOBufTail]) -> None:
+        """
+        :param connection_selector:
+        :param tails:
+            The positions already read for each core; updated by the read
+        """
+        super().__init__(connection_selector)
+        self._tails = tails
+        self._iobuf_size = 0
+
+        # A dictionary of (x, y, p) -> n -> bytearray of new text
+        self._iobuf: Dict[XYP, Dict[int, bytearray]] = defaultdict(dict)
+
+        # Block headers to read in the next round
+        self._block_reads: List[_BlockRead] = list()
+
+        # Block data to read in the next round
+        self._data_reads: List[_DataRead] = list()
+
+    def __handle_iobuf_address_response(
+            self, xyp: XYP, response: Response) -> None:
+        first_address, = _ONE_WORD.unpack_from(response.data, response.offset)
+        tail = self._tails.get(xyp)
+        if first_address == 0:
+            self._tails.pop(xyp, None)
+            return
+        if tail is None or tail.first_address != first_address:
+            # New (or restarted) core so start from the beginning
+            tail = IOBufTail(first_address, first_address, 0)
+            self._tails[xyp] = tail
+        self._block_reads.append(
+            _BlockRead(xyp, 0, tail.block_address, tail.n_read))
+
+    def __handle_block_response(
+            self, block: _BlockRead, response: Response) -> None:
+        next_address, n_bytes = _IOBUF_HEADER.unpack_from(
+            response.data, response.offset)
+        xyp = block.core_coords
+        first_address = self._tails[xyp].first_address
+        self._tails[xyp] = IOBufTail(
+            first_address, block.block_address, n_bytes)
+
+        n_new = max(n_bytes - block.n_read, 0)
+        if n_new > 0:
+            data = bytearray(n_new)
+            self._iobuf[xyp][block.n] = data
+
+            # Use any data that came with the header
+            packet_bytes = min(
+                response.length - _IOBUF_HEADER.size, n_new)
+            if packet_bytes > 0:
+                offset = response.offset + _IOBUF_HEADER.size
+                data[0:packet_bytes] = response.data[
+                    offset:offset + packet_bytes]
+
+            # Read the rest
+            address = (block.block_address + _IOBUF_HEADER.size +
+                       block.n_read + packet_bytes)
+            read_offset = packet_bytes
+            while read_offset < n_new:
+                size = min(n_new - read_offset, UDP_MESSAGE_MAX_SIZE)
+                self._data_reads.append(_DataRead(
+                    xyp, block.n, address, size, read_offset))
+                address += size
+                read_offset += size
+
+        # A following block means this one is full; move on to that
+        if next_address != 0:
+            self._block_reads.append(
+                _BlockRead(xyp, block.n + 1, next_address, 0))
+
+    def __handle_data_response(
+            self, read: _DataRead, response: Response) -> None:
+        data = self._iobuf[read.core_coords][read.n]
+        data[read.offset:read.offset + response.length] = response.data[
+            response.offset:response.offset + response.length]
+
+    def __request_block(self, block: _BlockRead) -> None:
+        if block.n_read == 0:
+            # Nothing read yet so get the header and the start of the data
+            size = min(self._iobuf_size + _IOBUF_HEADER.size,
+                       UDP_MESSAGE_MAX_SIZE)
+        else:
+            size = _IOBUF_HEADER.size
+        self._send_request(
+            ReadMemory((block.core_coords[0], block.core_coords[1], 0),
+                       block.block_address, size),
+            functools.partial(self.__handle_block_response, block))
+
+    def __request_data(self, read: _DataRead) -> None:
+        self._send_request(
+            ReadMemory((read.core_coords[0], read.core_coords[1], 0),
+                       read.address, read.size),
+            functools.partial(self.__handle_data_response, read))
+
+    def read_new_iobuf(
+            self, iobuf_size: int,
+            core_subsets: CoreSubsets) -> Iterable[IOBuffer]:
+        """
+        :param iobuf_size:
+        :param core_subsets:
+        :returns:
+            IOBuffer with the text written since the last read,
+            for each core that has written anything, in order
+        """
+        self._iobuf_size = iobuf_size
+
+        # Check where the IOBUF starts, in case the core has been reloaded
+        with self._collect_responses():
+            for core_subset in core_subsets:
+                x, y = core_subset.x, core_subset.y
+                for p in core_subset.processor_ids:
+                    self._send_request(
+                        ReadMemory((x, y, 0), get_vcpu_address(p) +
+                                   CPU_IOBUF_ADDRESS_OFFSET, 4),
+                        functools.partial(
+                            self.__handle_iobuf_address_response, (x, y, p)))
+
+        # Run rounds of the process until reading is complete
+        while self._block_reads or self._data_reads:
+            with self._collect_responses():
+                while self._data_reads:
+                    self.__request_data(self._data_reads.pop())
+                while self._block_reads:
+                    self.__request_block(self._block_reads.pop())
+
+        for core_subset in core_subsets:
+            x, y = core_subset.x, core_subset.y
+            for p in core_subset.processor_ids:
+                blocks = self._iobuf.get((x, y, p))
+                if blocks:
+                    text = b"".join(blocks[n] for n in sorted(blocks))
+                    yield IOBuffer(x, y, p, text.decode(_ENCODING))
@@ -13,14 +13,15 @@
 # limitations under the License.
 
 import functools
-from typing import BinaryIO, Callable
+from typing import BinaryIO, Callable, Collection
 import numpy
 from numpy import uint8, uint32
-from spinn_utilities.typing.coords import XYP
+from spinn_utilities.typing.coords import XY, XYP
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.scp.impl import WriteLink, WriteMemory
 from spinnman.messages.scp.impl import CheckOKResponse
 from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+from spinnman.utilities.utility_functions import get_data_checksum
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 
 _UNSIGNED_WORD = 0xFFFFFFFF
@@ -51,6 +52,30 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
             base_address, data, offset, n_bytes,
             functools.partial(WriteMemory, coordinates), get_sum)
 
+    def write_memory_to_chips(
+            self, xys: Collection[XY], base_address: int, data: bytes,
+            get_sum: bool = False) -> int:
+        """
+        Writes the same data onto many SpiNNaker chips.  The writes to the
+        chips are interleaved so that chips reached over different
+        connections are written at the same time.
+
+        :param xys: The X,Y coordinates of the chips to write to.
+        :param base_address: the address in SDRAM to start writing
+        :param data: the data to write
+        :param get_sum: whether to return a checksum or 0
+        :return: the data checksum or 0 if get_sum is False
+        """
+        with self._collect_responses():
+            for offset in range(0, len(data), UDP_MESSAGE_MAX_SIZE):
+                data_array = data[offset:offset + UDP_MESSAGE_MAX_SIZE]
+                for x, y in xys:
+                    self._send_request(WriteMemory(
+                        (x, y, 0), base_address + offset, data_array))
+        if not get_sum:
+            return 0
+        return get_data_checksum(data)
+
     def write_link_memory_from_bytearray(
             self, coordinates: XYP, link: int, base_address: int, data: bytes,
             offset: int, n_bytes: int, get_sum: bool = False) -> int:
@@ -120,6 +145,7 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
             get_sum: bool) -> int:
         offset = 0
         n_bytes_to_write = int(n_bytes)
+        start = data_offset
         with self._collect_responses():
             while n_bytes_to_write > 0:
                 bytes_to_send = min(n_bytes_to_write, UDP_MESSAGE_MAX_SIZE)
@@ -133,9 +159,7 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
                 data_offset += bytes_to_send
         if not get_sum:
             return 0
-        np_data = numpy.array(data, dtype=uint8)
-        np_sum = int(numpy.sum(np_data.view(uint32), dtype=uint32))
-        return np_sum & _UNSIGNED_WORD
+        return get_data_checksum(data, start, int(n_bytes))
 
     def _write_memory_from_reader(
             self, base_address: int, reader: BinaryIO, n_bytes: int,
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from collections import defaultdict
+import hashlib
 import io
 import os
 import random
@@ -20,60 +21,57 @@ import struct
 from contextlib import contextmanager, suppress
 import logging
 import socket
-from threading import Condition
+from threading import Condition, Event
 import time
 from typing import (
-    BinaryIO, Collection, Dict, FrozenSet, Iterable, Iterator, List, Optional,
-    Sequence, Set, Tuple, TypeVar, Union, cast)
+    BinaryIO, Callable, Collection, Dict, FrozenSet, Iterable, Iterator, List,
+    Mapping, Optional, Sequence, Set, Tuple, TypeVar, Union, cast)
+import numpy
+from numpy.typing import NDArray
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod)
-from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_float, get_config_int)
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
 from spinn_utilities.progress_bar import ProgressBar
-from spinn_utilities.typing.coords import XY
+from spinn_utilities.typing.coords import XY, XYP
 from spinn_machine import (
-    CoreSubsets, Machine, MulticastRoutingEntry, RoutingEntry)
+    CoreSubset, CoreSubsets, Machine, MulticastRoutingEntry, RoutingEntry)
 from spinn_machine.tags import AbstractTag, IPTag, ReverseIPTag
+from spinnman.connections import ConnectionListener
 from spinnman.connections.abstract_classes import Connection
 from spinnman.connections.udp_packet_connections import SDPConnection
 from spinnman.constants import (
-    BMP_POST_POWER_ON_SLEEP_TIME, BMP_POWER_ON_TIMEOUT, BMP_TIMEOUT,
     CPU_MAX_USER, CPU_USER_OFFSET, CPU_USER_START_ADDRESS,
     IPTAG_TIME_OUT_WAIT_TIMES, SCP_SCAMP_PORT, SYSTEM_VARIABLE_BASE_ADDRESS,
     UDP_BOOT_CONNECTION_DEFAULT_PORT, NO_ROUTER_DIAGNOSTIC_FILTERS,
     ROUTER_REGISTER_BASE_ADDRESS, ROUTER_DEFAULT_FILTERS_MAX_POSITION,
     ROUTER_FILTER_CONTROLS_OFFSET, ROUTER_DIAGNOSTIC_FILTER_SIZE, N_RETRIES,
-    BOOT_RETRIES, POWER_CYCLE_WAIT_TIME_IN_SECONDS, ROUTER_REGISTER_REGISTERS)
+    BOOT_RETRIES, ROUTER_REGISTER_REGISTERS, SCP_TIMEOUT)
 from spinnman.data import SpiNNManDataView
 from spinnman.exceptions import (
     SpinnmanBootException,
     SpinnmanInvalidParameterException, SpinnmanException, SpinnmanIOException,
     SpinnmanTimeoutException, SpinnmanGenericProcessException,
-    SpinnmanUnexpectedResponseCodeException,
     SpiNNManCoresNotInStateException)
 from spinnman.model import (
     CPUInfo, CPUInfos, DiagnosticFilter, ChipSummaryInfo,
-    IOBuffer, MachineDimensions, RouterDiagnostics, VersionInfo)
+    IOBuffer, MachineDimensions, RouterConfiguration, RouterDiagnostics,
+    VersionInfo, routes_to_array, routing_table_differences)
 from spinnman.model.enums import (
     CPUState, SDP_PORTS, SDP_RUNNING_MESSAGE_CODES, UserRegister,
     DiagnosticFilterDefaultRoutingStatus, DiagnosticFilterPacketType,
     DiagnosticFilterSource)
 from spinnman.messages.scp.abstract_messages import AbstractSCPResponse
 from spinnman.messages.scp.enums import Signal
-from spinnman.messages.scp.impl.get_chip_info import GetChipInfo
-from spinnman.messages.scp.impl.get_chip_info_response import (
-    GetChipInfoResponse)
 from spinnman.messages.sdp import SDPFlag, SDPHeader, SDPMessage
 from spinnman.messages.spinnaker_boot import (
     SystemVariableDefinition, SpinnakerBootMessages)
-from spinnman.messages.scp.enums import PowerCommand
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.scp.impl import (
-    BMPGetVersion, SetPower, ReadFPGARegister,
-    WriteFPGARegister, IPTagSetTTO, ReverseIPTagSet,
-    WriteMemory, SendSignal, AppStop,
-    IPTagSet, IPTagClear, RouterClear, DoSync)
+    BMPGetVersion, ReadFPGARegister,
+    WriteFPGARegister, WriteMemory, SendSignal, AppStop, RouterClear, DoSync)
 from spinnman.processes import ConnectionSelector
 from spinnman.connections.udp_packet_connections import (
     BMPConnection, BootConnection, SCAMPConnection)
@@ -87,9 +85,17 @@ from spinnman.processes import (
     LoadMultiCastRoutesProcess, GetTagsProcess, GetMultiCastRoutesProcess,
     SendSingleCommandProcess, ReadRouterDiagnosticsProcess,
     MostDirectConnectionSelector, ApplicationCopyRunProcess,
-    GetNCoresInStateProcess, SetMemoryProcess, ClearRoutesProcess)
+    GetNCoresInStateProcess, SetMemoryProcess, ClearRoutesProcess,
+    TailIOBufProcess, ConfigureRoutersProcess, SetTagsProcess,
+    ReadUserProcess, ReadSystemVariablesProcess)
+from spinnman.processes.tail_iobuf_process import IOBufTail
 from spinnman.transceiver.transceiver import Transceiver
 from spinnman.transceiver.extendable_transceiver import ExtendableTransceiver
+from spinnman.transceiver.bmp_power_manager import BMPPowerManager
+from spinnman.transceiver.board_bring_up import (
+    BoardBringUp, BoardBringUpTimeline, check_connection, check_connections,
+    wait_for_scamp)
+from spinnman.transceiver.sdp_fan_out import fan_out_sdp_messages
 from spinnman.utilities.utility_functions import get_vcpu_address
 
 #: Type of a response.
@@ -105,11 +111,9 @@ _SCAMP_VERSION = (4, 0, 0)
 _BMP_NAME = "BC&MP"
 _BMP_MAJOR_VERSIONS = [1, 2]
 
-_CONNECTION_CHECK_RETRIES = 3
 INITIAL_FIND_SCAMP_RETRIES_COUNT = 3
 
 _TWO_BYTES = struct.Struct("<BB")
-_FOUR_BYTES = struct.Struct("<BBBB")
 _ONE_WORD = struct.Struct("<I")
 _ONE_LONG = struct.Struct("<Q")
 _EXECUTABLE_ADDRESS = 0x67800000
@@ -133,6 +137,27 @@ _POWER_CYCLE_FAILURE_WARNING = (
     "reset_machine_on_startup = False in the [Machine] section of the "
     "relevant configuration (cfg) file to avoid this warning in future.")
 
+#: The shortest wait between state polls, as a fraction of the longest
+_MIN_POLL_FRACTION = 0.1
+
+
+def _poll_interval(
+        time_between_polls: float, n_ready: int, n_target: int) -> float:
+    """
+    Get how long to wait before polling the core states again; the wait
+    shrinks in proportion to the number of cores still to reach the target,
+    down to a floor of :py:data:`_MIN_POLL_FRACTION` of the longest wait.
+
+    :param time_between_polls: The longest time to wait
+    :param n_ready: The number of cores in the target states
+    :param n_target: The number of cores expected in the target states
+    :return: The time to wait in seconds
+    """
+    if n_target <= 0:
+        return time_between_polls
+    fraction = max(n_target - n_ready, 0) / n_target
+    return time_between_polls * max(fraction, _MIN_POLL_FRACTION)
+
 
 class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     """
@@ -144,12 +169,17 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         "_bmp_selector",
         "_bmp_connection",
         "_boot_send_connection",
+        "_bring_up_timeline",
         "_chip_execute_lock_condition",
         "_chip_execute_locks",
+        "_executable_cache",
         "_height",
         "_iobuf_size",
+        "_iobuf_tails",
         "_machine_off",
         "_n_chip_execute_locks",
+        "_power_manager",
+        "_route_shadows",
         "_scamp_connection_selector",
         "_scamp_connections",
         "_udp_scamp_connections",
@@ -182,6 +212,16 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         self._height: Optional[int] = None
         self._iobuf_size: Optional[int] = None
 
+        # The IOBUF positions already read by get_new_iobuf
+        self._iobuf_tails: Dict[XYP, IOBufTail] = dict()
+
+        # The multicast routes known to be loaded on each chip, by app_id
+        self._route_shadows: Dict[XY, Dict[int, NDArray]] = dict()
+
+        # The hash, size and checksum of the executable known to be at the
+        # executable address of each chip it was written to
+        self._executable_cache: Dict[XY, Tuple[bytes, int, int]] = dict()
+
         # A set of the original connections - used to determine what can
         # be closed
         if connections is None:
@@ -194,6 +234,9 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         # or otherwise bad things can happen!
         self._boot_send_connection: Optional[BootConnection] = None
 
+        # When each board was brought up by ensure_board_is_ready
+        self._bring_up_timeline: List[BoardBringUpTimeline] = list()
+
         # A dict of IP address -> SCAMP connection
         # These are those that can be used for setting up IP Tags
         self._udp_scamp_connections: Dict[str, SCAMPConnection] = dict()
@@ -204,6 +247,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
 
         # The BMP connections
         self._bmp_connection: Optional[BMPConnection] = None
+        self._power_manager: Optional[BMPPowerManager] = None
 
         # A lock against single chip executions (entry is (x, y))
         # The condition should be acquired before the locks are
@@ -242,6 +286,14 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     def scamp_connection_selector(self) -> MostDirectConnectionSelector:
         return self._scamp_connection_selector
 
+    @property
+    def bring_up_timeline(self) -> Sequence[BoardBringUpTimeline]:
+        """
+        When each step of bringing up each board finished, the last time
+        that the boards were made ready.
+        """
+        return self._bring_up_timeline
+
     def _where_is_xy(self, x: int, y: int) -> Optional[str]:
         """
         Attempts to get where_is_x_y info from the machine
@@ -278,6 +330,8 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                         "Only one BMP connection supported")
                 self._bmp_connection = conn
                 self._bmp_selector = FixedConnectionSelector(conn)
+                self._power_manager = BMPPowerManager(
+                    self._bmp_selector, conn.boards)
             # Otherwise, check if it can send and receive SCP (talk to SCAMP)
             elif isinstance(conn, SCAMPConnection):
                 self._scamp_connections.append(conn)
@@ -333,24 +387,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         :param connection: the connection selector to use
         :return: True if a valid response is received, False otherwise
         """
-        chip_x, chip_y = connection.chip_x, connection.chip_y
-        connection_selector = FixedConnectionSelector(connection)
-        for _ in range(_CONNECTION_CHECK_RETRIES):
-            try:
-                sender: SendSingleCommandProcess[GetChipInfoResponse] = \
-                    SendSingleCommandProcess(connection_selector)
-                chip_info = sender.execute(
-                    GetChipInfo(chip_x, chip_y)).chip_info
-                if not chip_info.is_ethernet_available:
-                    time.sleep(0.1)
-                else:
-                    return chip_info
-            except (SpinnmanGenericProcessException, SpinnmanTimeoutException,
-                    SpinnmanUnexpectedResponseCodeException):
-                pass
-            except SpinnmanIOException:
-                break
-        return None
+        return check_connection(connection)
 
     @overrides(Transceiver.send_sdp_message)
     def send_sdp_message(self, message: SDPMessage,
@@ -363,11 +400,13 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         connection_to_use.send_sdp_message(message)
 
     def _check_and_add_scamp_connections(
-            self, x: int, y: int, ip_address: str) -> None:
+            self, connections: Dict[XY, str]) -> None:
         """
-        :param x: X coordinate of target chip
-        :param y: Y coordinate of target chip
-        :param ip_address: IP address of target chip
+        Open connections to boards, check that they work and add those that
+        do; the connections are checked at the same time.
+
+        :param connections:
+            The IP address of each target Ethernet chip, by coordinates
 
         :raise SpinnmanIOException:
             If there is an error communicating with the board
@@ -378,47 +417,54 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         :raise SpinnmanUnexpectedResponseCodeException:
             If a response indicates an error during the exchange
         """
-        conn = SCAMPConnection(remote_host=ip_address, chip_x=x, chip_y=y)
-
-        # check if it works
-        chip_info = self._check_connection(conn)
-        if chip_info is not None and chip_info.ethernet_ip_address is not None:
-            self._all_connections.add(conn)
-            self._udp_scamp_connections[chip_info.ethernet_ip_address] = conn
-            self._scamp_connections.append(conn)
-        else:
-            logger.warning(
-                "Additional Ethernet connection on {} at chip {}, {} "
-                "cannot be contacted", ip_address, x, y)
+        conns = [
+            SCAMPConnection(remote_host=ip_address, chip_x=x, chip_y=y)
+            for (x, y), ip_address in connections.items()]
+
+        # check if they work
+        for conn, chip_info in zip(conns, check_connections(conns)):
+            if (chip_info is not None and
+                    chip_info.ethernet_ip_address is not None):
+                self._all_connections.add(conn)
+                self._udp_scamp_connections[chip_info.ethernet_ip_address] = \
+                    conn
+                self._scamp_connections.append(conn)
+            else:
+                logger.warning(
+                    "Additional Ethernet connection on {} at chip {}, {} "
+                    "cannot be contacted", conn.remote_ip_address,
+                    conn.chip_x, conn.chip_y)
+                conn.close()
 
     @overrides(Transceiver.discover_scamp_connections)
     def discover_scamp_connections(self) -> None:
         # Get the machine dimensions
         dims = self._get_machine_dimensions()
 
-        # Find all the new connections via the machine Ethernet-connected chips
+        # Find all the new connections via the machine Ethernet-connected
+        # chips, reading the addresses of all of them together; a chip that
+        # cannot be read is not an Ethernet chip of this machine
         version = SpiNNManDataView.get_machine_version()
-        for x, y in version.get_potential_ethernet_chips(
-                dims.width, dims.height):
-            ip_addr_item = SystemVariableDefinition.ethernet_ip_address
-            try:
-                # TODO avoid here_is_x,y if read_memory fails
-                data = self.read_memory(
-                    x, y,
-                    SYSTEM_VARIABLE_BASE_ADDRESS + ip_addr_item.offset, 4)
-            except SpinnmanGenericProcessException:
+        xys = list(version.get_potential_ethernet_chips(
+            dims.width, dims.height))
+        ip_addr_item = SystemVariableDefinition.ethernet_ip_address
+        process = ReadSystemVariablesProcess(self._scamp_connection_selector)
+        read, columns = process.read_system_variables(
+            xys, [ip_addr_item], allow_failures=True)
+        connections: Dict[XY, str] = dict()
+        for (x, y), chip_read, ip in zip(xys, read, columns[ip_addr_item]):
+            if not chip_read:
                 continue
-            ip = _FOUR_BYTES.unpack_from(data)
             ip_address = f"{ip[0]}.{ip[1]}.{ip[2]}.{ip[3]}"
             logger.info(ip_address)
-            self._check_and_add_scamp_connections(x, y, ip_address)
+            connections[x, y] = ip_address
+        self._check_and_add_scamp_connections(connections)
         self._scamp_connection_selector = MostDirectConnectionSelector(
             self._scamp_connections)
 
     @overrides(Transceiver.add_scamp_connections)
     def add_scamp_connections(self, connections: Dict[XY, str]) -> None:
-        for ((x, y), ip_address) in connections.items():
-            self._check_and_add_scamp_connections(x, y, ip_address)
+        self._check_and_add_scamp_connections(connections)
         self._scamp_connection_selector = MostDirectConnectionSelector(
             self._scamp_connections)
 
@@ -478,7 +524,8 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             self, chip_x: int = AbstractSCPRequest.DEFAULT_DEST_X_COORD,
             chip_y: int = AbstractSCPRequest.DEFAULT_DEST_Y_COORD,
             connection_selector: Optional[ConnectionSelector] = None,
-            n_retries: int = N_RETRIES) -> VersionInfo:
+            n_retries: int = N_RETRIES,
+            timeout: float = SCP_TIMEOUT) -> VersionInfo:
         """
         Get the version of SCAMP which is running on the board.
 
@@ -488,6 +535,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             the connection to send the SCAMP version
             or `None` (if `None` then a random SCAMP connection is used).
         :param n_retries:
+        :param timeout: The time in seconds to wait for each reply
         :return: The version identifier
         :raise SpinnmanIOException:
             If there is an error communicating with the board
@@ -499,7 +547,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         """
         if connection_selector is None:
             connection_selector = self._scamp_connection_selector
-        process = GetVersionProcess(connection_selector, n_retries)
+        process = GetVersionProcess(connection_selector, n_retries, timeout)
         return process.get_version(x=chip_x, y=chip_y, p=0)
 
     @property
@@ -534,11 +582,16 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         if SystemVariableDefinition.led_0 not in extra_boot_values:
             extra_boot_values[SystemVariableDefinition.led_0] = \
                 self.boot_led_0_value
+        self._iobuf_tails.clear()
+        self._route_shadows.clear()
+        self._executable_cache.clear()
         boot_messages = SpinnakerBootMessages(
             extra_boot_values=extra_boot_values)
-        for boot_message in boot_messages.messages:
-            self._boot_send_connection.send_boot_message(boot_message)
-        time.sleep(2.0)
+        self._boot_send_connection.send_boot_messages(
+            boot_messages.messages,
+            get_config_float("Machine", "boot_packet_delay"))
+        # Wait for SCAMP to start
+        wait_for_scamp(self._scamp_connection_selector, sleep_first=True)
 
     def _call(self, req: AbstractSCPRequest[_AbstractSCPResponse]
               ) -> _AbstractSCPResponse:
@@ -586,9 +639,6 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             # start by powering up each BMP connection
             logger.info("Attempting to power on machine")
             self._power_on_machine()
-
-            # Sleep a bit to let things get going
-            time.sleep(2.0)
             logger.info("Attempting to boot machine")
 
             # retry to get a SCAMP version, this time trying multiple times
@@ -611,16 +661,16 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         logger.info("Machine communication successful")
 
         # Change the default SCP timeout on the machine, keeping the old one to
-        # revert at close
-        for scamp_connection in self._scamp_connections:
-            self._call(IPTagSetTTO(
-                scamp_connection.chip_x, scamp_connection.chip_y,
-                IPTAG_TIME_OUT_WAIT_TIMES.TIMEOUT_2560_ms))
-
-            chip_info = self._check_connection(scamp_connection)
+        # revert at close, and check the connections; all the boards are
+        # done at the same time
+        self._bring_up_timeline = BoardBringUp(
+            self._scamp_connections,
+            IPTAG_TIME_OUT_WAIT_TIMES.TIMEOUT_2560_ms).run()
+        for timeline in self._bring_up_timeline:
+            chip_info = timeline.chip_info
             if chip_info is not None and chip_info.ethernet_ip_address:
                 self._udp_scamp_connections[chip_info.ethernet_ip_address] = \
-                    scamp_connection
+                    timeline.connection
 
         # Update the connection selector so that it can ask for processor ids
         self._scamp_connection_selector = MostDirectConnectionSelector(
@@ -685,7 +735,8 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     def get_cpu_infos(
             self, core_subsets: Optional[CoreSubsets] = None,
             states: Union[CPUState, Iterable[CPUState], None] = None,
-            include: bool = True) -> CPUInfos:
+            include: bool = True, *, app_id: Optional[int] = None
+            ) -> CPUInfos:
         # Get all the cores if the subsets are not given
         if core_subsets is None:
             core_subsets = CoreSubsets()
@@ -701,6 +752,11 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             else:
                 state_set = frozenset(states)
             if include:
+                if app_id is not None:
+                    core_subsets = self.__subsets_on_boards_in_states(
+                        core_subsets, app_id, state_set)
+                    if not core_subsets:
+                        return CPUInfos()
                 process = GetIncludeCPUInfoProcess(
                     self._scamp_connection_selector, state_set)
             else:
@@ -710,6 +766,35 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         cpu_info = process.get_cpu_info(core_subsets)
         return cpu_info
 
+    def __subsets_on_boards_in_states(
+            self, core_subsets: CoreSubsets, app_id: int,
+            states: FrozenSet[CPUState]) -> CoreSubsets:
+        """
+        Reduce the core subsets to those on boards which report having at
+        least one core of the application in one of the states.
+
+        The counts are done with one CountState per board (and state),
+        all in a single pipelined process.
+
+        :param core_subsets: The cores being asked about
+        :param app_id: The application the cores belong to
+        :param states: The states being looked for
+        :return: The core subsets on boards with matching cores
+        """
+        by_board: Dict[XY, List[CoreSubset]] = defaultdict(list)
+        for core_subset in core_subsets:
+            by_board[SpiNNManDataView.get_nearest_ethernet(
+                core_subset.x, core_subset.y)].append(core_subset)
+        process = GetNCoresInStateProcess(self._scamp_connection_selector)
+        counts = process.get_n_cores_in_states_by_chip(
+            by_board.keys(), app_id, states)
+        filtered = CoreSubsets()
+        for board_xy, subsets in by_board.items():
+            if counts.get(board_xy, 0) > 0:
+                for core_subset in subsets:
+                    filtered.add_core_subset(core_subset)
+        return filtered
+
     @overrides(Transceiver.get_clock_drift)
     def get_clock_drift(self, x: int, y: int) -> float:
         drift_fp = 1 << 17
@@ -718,6 +803,15 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         drift = struct.unpack("<i", struct.pack("<I", drift_b))[0]
         return drift / drift_fp
 
+    @overrides(Transceiver.read_system_variables)
+    def read_system_variables(
+            self, xys: Iterable[XY],
+            variables: Iterable[SystemVariableDefinition]
+            ) -> Dict[SystemVariableDefinition, NDArray]:
+        process = ReadSystemVariablesProcess(self._scamp_connection_selector)
+        _, columns = process.read_system_variables(xys, variables)
+        return columns
+
     def _get_sv_data(
             self, x: int, y: int,
             data_item: SystemVariableDefinition) -> Union[int, bytes]:
@@ -755,6 +849,13 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         addr = self.__get_user_register_address_from_core(p, user)
         return self.read_word(x, y, addr)
 
+    @overrides(Transceiver.read_user_many)
+    def read_user_many(
+            self, core_subsets: CoreSubsets, users: Collection[UserRegister]
+            ) -> Dict[XYP, Dict[UserRegister, int]]:
+        process = ReadUserProcess(self._scamp_connection_selector)
+        return process.read_users(core_subsets, users)
+
     @overrides(Transceiver.add_cpu_information_from_core)
     def add_cpu_information_from_core(
             self, cpu_infos: CPUInfos, x: int, y: int, p: int,
@@ -768,15 +869,24 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     def get_region_base_address(self, x: int, y: int, p: int) -> int:
         return self.read_user(x, y, p, UserRegister.USER_0)
 
-    @overrides(Transceiver.get_iobuf)
-    def get_iobuf(self, core_subsets: Optional[CoreSubsets] = None
-                  ) -> Iterable[IOBuffer]:
+    @overrides(Transceiver.get_region_base_addresses)
+    def get_region_base_addresses(
+            self, core_subsets: CoreSubsets) -> Dict[XYP, int]:
+        values = self.read_user_many(core_subsets, [UserRegister.USER_0])
+        return {xyp: users[UserRegister.USER_0]
+                for xyp, users in values.items()}
+
+    def __get_iobuf_size(self) -> int:
         # making the assumption that all chips have the same iobuf size.
         if self._iobuf_size is None:
             self._iobuf_size = cast(int, self._get_sv_data(
                 AbstractSCPRequest.DEFAULT_DEST_X_COORD,
                 AbstractSCPRequest.DEFAULT_DEST_Y_COORD,
                 SystemVariableDefinition.iobuf_size))
+        return self._iobuf_size
+
+    @staticmethod
+    def __iobuf_cores(core_subsets: Optional[CoreSubsets]) -> CoreSubsets:
         # Get all the cores if the subsets are not given
         # TODO is core_subsets ever None
         if core_subsets is None:
@@ -784,10 +894,50 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             for chip in SpiNNManDataView.get_machine().chips:
                 for p in chip.all_processor_ids:
                     core_subsets.add_processor(chip.x, chip.y, p)
+        return core_subsets
+
+    @overrides(Transceiver.get_iobuf)
+    def get_iobuf(self, core_subsets: Optional[CoreSubsets] = None
+                  ) -> Iterable[IOBuffer]:
+        iobuf_size = self.__get_iobuf_size()
+        core_subsets = self.__iobuf_cores(core_subsets)
 
         # read iobuf from machine
         process = ReadIOBufProcess(self._scamp_connection_selector)
-        return process.read_iobuf(self._iobuf_size, core_subsets)
+        return process.read_iobuf(iobuf_size, core_subsets)
+
+    @overrides(Transceiver.write_iobuf_to_files)
+    def write_iobuf_to_files(
+            self, filename: Callable[[int, int, int], str],
+            core_subsets: Optional[CoreSubsets] = None) -> List[str]:
+        iobuf_size = self.__get_iobuf_size()
+        core_subsets = self.__iobuf_cores(core_subsets)
+
+        # read iobuf from machine and write it out as it arrives
+        process = ReadIOBufProcess(self._scamp_connection_selector)
+        return process.write_iobuf(iobuf_size, core_subsets, filename)
+
+    @overrides(Transceiver.get_new_iobuf)
+    def get_new_iobuf(self, core_subsets: Optional[CoreSubsets] = None
+                      ) -> Iterable[IOBuffer]:
+        iobuf_size = self.__get_iobuf_size()
+        core_subsets = self.__iobuf_cores(core_subsets)
+
+        # read only the new iobuf text from machine
+        process = TailIOBufProcess(
+            self._scamp_connection_selector, self._iobuf_tails)
+        return process.read_new_iobuf(iobuf_size, core_subsets)
+
+    def __forget_iobuf_tails(self, core_subsets: CoreSubsets) -> None:
+        """
+        Forget how much of the IOBUF of cores has been read, so that the
+        next read starts at the beginning.
+
+        :param core_subsets: The cores to forget about
+        """
+        for subset in core_subsets:
+            for p in subset.processor_ids:
+                self._iobuf_tails.pop((subset.x, subset.y, p), None)
 
     @overrides(Transceiver.get_core_state_count)
     def get_core_state_count(
@@ -822,45 +972,208 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         if isinstance(executable, int):
             # No executable is 4 bytes long
             raise TypeError("executable may not be int")
+        # The cores start a new IOBUF, often at the same address
+        self.__forget_iobuf_tails(core_subsets)
         # Lock against other executables
         with self.__flood_execute_lock():
-            # Flood fill the system with the binary
-            n_bytes, chksum = self.write_memory(
-                0, 0, _EXECUTABLE_ADDRESS, executable, n_bytes=n_bytes,
-                get_sum=True)
-
-            # Execute the binary on the cores on 0, 0 if required
-            if core_subsets.is_chip(0, 0):
-                boot_subset = CoreSubsets()
-                boot_subset.add_core_subset(
-                    core_subsets.get_core_subset_for_chip(0, 0))
+            # Put the binary on the chips to copy it from
+            seeds = self.__executable_seeds()
+            n_bytes, chksum = self.__write_executable(
+                executable, n_bytes, seeds)
+
+            # Execute the binary on the cores of those chips if required
+            seed_subsets = CoreSubsets()
+            for x, y in seeds:
+                if core_subsets.is_chip(x, y):
+                    seed_subsets.add_core_subset(
+                        core_subsets.get_core_subset_for_chip(x, y))
+            if len(seed_subsets):
                 runner = ApplicationRunProcess(
                     self._scamp_connection_selector)
-                runner.run(app_id, boot_subset, wait)
+                runner.run(app_id, seed_subsets, wait)
 
+            # Flood fill the system with the binary
             copy_run = ApplicationCopyRunProcess(
-                self._scamp_connection_selector)
-            copy_run.run(n_bytes, app_id, core_subsets, chksum, wait)
+                self._scamp_connection_selector,
+                fan_out=get_config_int("Machine", "app_copy_run_fan_out"))
+            copy_run.run(n_bytes, app_id, core_subsets, chksum, wait, seeds)
+
+    @overrides(Transceiver.execute_flood_multi)
+    def execute_flood_multi(
+            self, executables: Sequence[
+                Tuple[CoreSubsets, Union[BinaryIO, bytes, str]]],
+            app_id: int, *, wait: bool = False) -> None:
+        if any(isinstance(executable, int) for _, executable in executables):
+            # No executable is 4 bytes long
+            raise TypeError("executable may not be int")
+        if not executables:
+            return
+        # The cores start a new IOBUF, often at the same address
+        for core_subsets, _ in executables:
+            self.__forget_iobuf_tails(core_subsets)
+        # Lock against other executables
+        with self.__flood_execute_lock():
+            seeds = self.__executable_seeds()
+            reuse = get_config_bool("Machine", "reuse_loaded_executable")
+            binaries: List[Tuple[bytes, CoreSubsets, List[XY]]] = list()
+            digests: List[bytes] = list()
+            for core_subsets, executable in executables:
+                data = self.__read_executable(executable, None)
+                digest = hashlib.sha256(data).digest()
+                if not binaries:
+                    # The first may already be on the chips
+                    to_write = [
+                        xy for xy in seeds
+                        if not reuse or self._executable_cache.get(
+                            xy, (b"",))[0] != digest]
+                elif digest == digests[-1]:
+                    # The same as the last, which is still there
+                    to_write = []
+                else:
+                    to_write = seeds
+                binaries.append((data, core_subsets, to_write))
+                digests.append(digest)
+
+            for x, y in seeds:
+                self.__invalidate_executable(
+                    x, y, _EXECUTABLE_ADDRESS, None)
+            copy_run = ApplicationCopyRunProcess(
+                self._scamp_connection_selector,
+                fan_out=get_config_int("Machine", "app_copy_run_fan_out"))
+            checksums = copy_run.run_pipelined(binaries, app_id, wait, seeds)
+            if reuse:
+                # Only the last executable is left on the chips
+                for xy in seeds:
+                    self._executable_cache[xy] = (
+                        digests[-1], len(binaries[-1][0]), checksums[-1])
+
+    def __executable_seeds(self) -> List[XY]:
+        """
+        Get the chips to write an executable to, from which it is copied to
+        the rest of the machine.
+
+        :return: Chip (0, 0), and if configured, each Ethernet chip with a
+            connection of its own
+        """
+        seeds: List[XY] = [(0, 0)]
+        if get_config_bool("Machine", "seed_executable_per_board"):
+            machine = SpiNNManDataView.get_machine()
+            for conn in self._scamp_connections:
+                xy = (conn.chip_x, conn.chip_y)
+                if (xy not in seeds and machine.is_chip_at(*xy) and
+                        machine[xy].ip_address is not None):
+                    seeds.append(xy)
+        return seeds
+
+    def __write_executable(
+            self, executable: Union[BinaryIO, bytes, str],
+            n_bytes: Optional[int], seeds: List[XY]) -> Tuple[int, int]:
+        """
+        Write an executable to the executable address of each of the given
+        chips at the same time, except where the same executable is known
+        to be there already.
+
+        :param executable: The executable, or the name of its file
+        :param n_bytes: The number of bytes of the executable, if known
+        :param seeds: The chips to write the executable to
+        :return: The number of bytes and the checksum of the executable
+        """
+        data = self.__read_executable(executable, n_bytes)
+        reuse = get_config_bool("Machine", "reuse_loaded_executable")
+        digest = hashlib.sha256(data).digest()
+        cached = [self._executable_cache.get(xy) for xy in seeds]
+        to_write = [
+            xy for xy, entry in zip(seeds, cached)
+            if not reuse or entry is None or entry[0] != digest]
+        if not to_write:
+            _, cached_n_bytes, cached_chksum = cast(
+                Tuple[bytes, int, int], cached[0])
+            return cached_n_bytes, cached_chksum
+
+        for x, y in to_write:
+            self.__invalidate_executable(x, y, _EXECUTABLE_ADDRESS, len(data))
+        process = WriteMemoryProcess(self._scamp_connection_selector)
+        chksum = process.write_memory_to_chips(
+            to_write, _EXECUTABLE_ADDRESS, data, get_sum=True)
+        if reuse:
+            for xy in to_write:
+                self._executable_cache[xy] = (digest, len(data), chksum)
+        return len(data), chksum
+
+    @staticmethod
+    def __read_executable(
+            executable: Union[BinaryIO, bytes, str],
+            n_bytes: Optional[int]) -> bytes:
+        """
+        Get the data of an executable.
+
+        :param executable: The executable, or the name of its file
+        :param n_bytes: The number of bytes of the executable, if known
+        :return: The data of the executable
+        """
+        if isinstance(executable, str):
+            with open(executable, "rb") as reader:
+                return reader.read() if n_bytes is None else reader.read(
+                    n_bytes)
+        if isinstance(executable, (bytes, bytearray)):
+            return bytes(executable[:n_bytes])
+        return executable.read() if n_bytes is None else executable.read(
+            n_bytes)
+
+    @overrides(ExtendableTransceiver._forget_loaded_executables)
+    def _forget_loaded_executables(
+            self, xys: Optional[Iterable[XY]] = None) -> None:
+        if xys is None:
+            self._executable_cache.clear()
+        else:
+            for xy in xys:
+                self._executable_cache.pop(xy, None)
+
+    def __invalidate_executable(
+            self, x: int, y: int, base_address: int,
+            n_bytes: Optional[int]) -> None:
+        """
+        Forget the executable known to be on a chip if a write might
+        overlap it.
+
+        :param x: The x-coordinate of the chip written to
+        :param y: The y-coordinate of the chip written to
+        :param base_address: The address written to
+        :param n_bytes: The number of bytes written, or `None` if not known
+        """
+        cached = self._executable_cache.get((x, y))
+        if cached is None:
+            return
+        if base_address >= _EXECUTABLE_ADDRESS + cached[1]:
+            return
+        if n_bytes is not None and (
+                base_address + n_bytes <= _EXECUTABLE_ADDRESS):
+            return
+        del self._executable_cache[x, y]
 
     def _power_on_machine(self) -> None:
         """
-        Power on the whole machine.
+        Power on the whole machine, waiting until the boards are up.
 
-        :return success of failure to power on machine
+        If the boards do not all answer in time, a warning is logged and
+        booting goes ahead anyway, relying on its own retries.
         """
-        self._power(PowerCommand.POWER_ON)
-        # Sleep for 5 seconds as the machine has just been powered on
-        time.sleep(BMP_POST_POWER_ON_SLEEP_TIME)
+        if self._power_manager is None:
+            raise NotImplementedError("can not power change without BMP")
+        self._power_manager.power_on()
+        self._machine_off = False
 
     def _power_off_machine(self) -> None:
         """
-        Power off the whole machine.
-
-        :return success or failure to power off the machine
+        Power off the whole machine, and wait before it may be powered on
+        again.
         """
-        self._power(PowerCommand.POWER_OFF)
+        if self._power_manager is None:
+            raise NotImplementedError("can not power change without BMP")
         logger.warning(_POWER_CYCLE_WARNING)
-        time.sleep(POWER_CYCLE_WAIT_TIME_IN_SECONDS)
+        self._power_manager.power_off()
+        self._machine_off = True
+        self._executable_cache.clear()
         logger.warning("Power cycle wait complete")
 
     def _bmp_call(self, req: AbstractSCPRequest[_AbstractSCPResponse],
@@ -889,22 +1202,6 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                     self._bmp_selector, n_retries=n_retries, timeout=timeout)
         return proc.execute(req)
 
-    def _power(self, power_command: PowerCommand) -> None:
-        """
-        Send a power request to the machine.
-
-        :param power_command: The power command to send
-        """
-        if self._bmp_connection is None:
-            raise NotImplementedError("can not power change without BMP")
-        timeout = (
-            BMP_POWER_ON_TIMEOUT
-            if power_command == PowerCommand.POWER_ON
-            else BMP_TIMEOUT)
-        self._bmp_call(SetPower(power_command, self._bmp_connection.boards),
-                       timeout=timeout, n_retries=0)
-        self._machine_off = power_command == PowerCommand.POWER_OFF
-
     @overrides(Transceiver.read_fpga_register)
     def read_fpga_register(
             self, fpga_num: int, register: int, board: int = 0) -> int:
@@ -930,6 +1227,12 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             data: Union[BinaryIO, bytes, int, str], *,
             n_bytes: Optional[int] = None, offset: int = 0, cpu: int = 0,
             get_sum: bool = False) -> Tuple[int, int]:
+        if isinstance(data, int):
+            self.__invalidate_executable(x, y, base_address, 4)
+        elif n_bytes is None and isinstance(data, (bytes, bytearray)):
+            self.__invalidate_executable(x, y, base_address, len(data))
+        else:
+            self.__invalidate_executable(x, y, base_address, n_bytes)
         process = WriteMemoryProcess(self._scamp_connection_selector)
         if isinstance(data, io.RawIOBase):
             assert n_bytes is not None
@@ -1002,6 +1305,12 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     def stop_application(self, app_id: int) -> None:
         if not self._machine_off:
             self._call(AppStop(app_id))
+            # SCAMP frees the routes of the application
+            for shadows in self._route_shadows.values():
+                shadows.pop(app_id, None)
+            # Which cores were stopped is not known, so start the IOBUF of
+            # every core again
+            self._iobuf_tails.clear()
         else:
             logger.warning(
                 "You are calling a app stop on a turned off machine. "
@@ -1041,68 +1350,88 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             error_states: FrozenSet[CPUState] = frozenset((
                 CPUState.RUN_TIME_EXCEPTION, CPUState.WATCHDOG)),
             counts_between_full_check: int = 100,
-            progress_bar: Optional[ProgressBar] = None) -> None:
+            progress_bar: Optional[ProgressBar] = None,
+            state_change_listener: Optional[
+                ConnectionListener[SDPMessage]] = None) -> None:
+        n_cores = len(all_core_subsets)
         processors_ready = 0
         max_processors_ready = 0
         timeout_time = None if timeout is None else time.time() + timeout
         tries = 0
         target_states = self.__state_set(cpu_states)
-        while (processors_ready < len(all_core_subsets) and
-               (timeout_time is None or time.time() < timeout_time)):
-
-            # Get the number of processors in the ready states
-            processors_ready = 0
-            for cpu_state in target_states:
-                processors_ready += self.get_core_state_count(
-                    app_id, cpu_state)
-            if progress_bar:
-                if processors_ready > max_processors_ready:
-                    progress_bar.update(
-                        processors_ready - max_processors_ready)
-                    max_processors_ready = processors_ready
-            # If the count is too small, check for error states
-            if processors_ready < len(all_core_subsets):
-                is_error = False
-                for cpu_state in error_states:
-                    error_cores = self.get_core_state_count(app_id, cpu_state)
-                    if error_cores > 0:
-                        is_error = True
-                if is_error:
-                    error_core_states = self.get_cpu_infos(
-                        all_core_subsets, error_states, True)
-                    if len(error_core_states) > 0:
-                        self.__log_where_is_info(error_core_states)
-                        raise SpiNNManCoresNotInStateException(
-                            timeout, target_states, error_core_states)
-
-                # If we haven't seen an error, increase the tries, and
-                # do a full check if required
-                tries += 1
-                if tries >= counts_between_full_check:
-                    cores_in_state = self.get_cpu_infos(
-                        all_core_subsets, target_states, include=True)
-                    # convert to a list of xyp values
-                    cores_in_state_xyps = list(cores_in_state)
-                    processors_ready = len(cores_in_state_xyps)
-                    tries = 0
-
-                    # iterate over the cores waiting to finish and see
-                    # which ones we're missing
-                    if get_config_bool("Machine", "report_waiting_logs"):
-                        for core_subset in all_core_subsets.core_subsets:
-                            for p in core_subset.processor_ids:
-                                if ((core_subset.x, core_subset.y, p) not in
-                                        cores_in_state_xyps):
-                                    logger.warning(
-                                        "waiting on {}:{}:{}",
-                                        core_subset.x, core_subset.y, p)
-
-                # If we're still not in the correct state, wait a bit
-                if processors_ready < len(all_core_subsets):
-                    time.sleep(time_between_polls)
+        all_states = target_states | error_states
+        machine = SpiNNManDataView.get_machine()
+        state_changed = Event()
+
+        def wake(message: SDPMessage) -> None:
+            # pylint: disable=unused-argument
+            state_changed.set()
+
+        if state_change_listener is not None:
+            state_change_listener.add_callback(wake)
+        try:
+            while (processors_ready < n_cores and
+                   (timeout_time is None or time.time() < timeout_time)):
+
+                # Count the target and error states in a single round
+                state_changed.clear()
+                process = GetNCoresInStateProcess(
+                    self._scamp_connection_selector)
+                counts = process.get_n_cores_in_states(
+                    machine.ethernet_connected_chips, app_id, all_states)
+                processors_ready = sum(
+                    counts[cpu_state] for cpu_state in target_states)
+                if progress_bar:
+                    if processors_ready > max_processors_ready:
+                        progress_bar.update(
+                            processors_ready - max_processors_ready)
+                        max_processors_ready = processors_ready
+                # If the count is too small, check for error states
+                if processors_ready < n_cores:
+                    if any(counts[cpu_state] > 0
+                           for cpu_state in error_states):
+                        error_core_states = self.get_cpu_infos(
+                            all_core_subsets, error_states, True,
+                            app_id=app_id)
+                        if len(error_core_states) > 0:
+                            self.__log_where_is_info(error_core_states)
+                            raise SpiNNManCoresNotInStateException(
+                                timeout, target_states, error_core_states)
+
+                    # If we haven't seen an error, increase the tries, and
+                    # do a full check if required
+                    tries += 1
+                    if tries >= counts_between_full_check:
+                        cores_in_state = self.get_cpu_infos(
+                            all_core_subsets, target_states, include=True)
+                        # convert to a list of xyp values
+                        cores_in_state_xyps = list(cores_in_state)
+                        processors_ready = len(cores_in_state_xyps)
+                        tries = 0
+
+                        # iterate over the cores waiting to finish and see
+                        # which ones we're missing
+                        if get_config_bool(
+                                "Machine", "report_waiting_logs"):
+                            for core_subset in all_core_subsets.core_subsets:
+                                for p in core_subset.processor_ids:
+                                    if ((core_subset.x, core_subset.y, p)
+                                            not in cores_in_state_xyps):
+                                        logger.warning(
+                                            "waiting on {}:{}:{}",
+                                            core_subset.x, core_subset.y, p)
+
+                    # If we're still not in the correct state, wait a bit,
+                    # or until a core says it has changed state
+                    if processors_ready < n_cores:
+                        state_changed.wait(_poll_interval(
+                            time_between_polls, processors_ready, n_cores))
+        finally:
+            if state_change_listener is not None:
+                state_change_listener.remove_callback(wake)
 
         # If we haven't reached the final state, do a final full check
-        if processors_ready < len(all_core_subsets):
+        if processors_ready < n_cores:
             cores_not_in_state = self.get_cpu_infos(
                 all_core_subsets, cpu_states, include=False)
 
@@ -1131,30 +1460,56 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
 
     @overrides(Transceiver.set_ip_tag)
     def set_ip_tag(self, ip_tag: IPTag, use_sender: bool = False) -> None:
-        # Check that the tag has a port assigned
-        if ip_tag.port is None:
-            raise SpinnmanInvalidParameterException(
-                "ip_tag.port", "None", "The tag port must have been set")
-
-        # Get the connections - if the tag specifies a connection, use that,
-        # otherwise apply the tag to all connections
-        connections = self.__get_connection_list(None, ip_tag.board_address)
-        if not connections:
-            raise SpinnmanInvalidParameterException(
-                "ip_tag", str(ip_tag),
-                "The given board address is not recognised")
-
-        for connection in connections:
-            # Convert the host string
-            host_string = ip_tag.ip_address
-            if host_string in ("localhost", ".", "0.0.0.0"):
-                host_string = connection.local_ip_address
-            ip_string = socket.gethostbyname(host_string)
-            ip_address = bytearray(socket.inet_aton(ip_string))
-
-            self._call(IPTagSet(
-                connection.chip_x, connection.chip_y, ip_address, ip_tag.port,
-                ip_tag.tag, strip=ip_tag.strip_sdp, use_sender=use_sender))
+        self.set_tags(ip_tags=[ip_tag], use_sender=use_sender)
+
+    @overrides(Transceiver.set_tags)
+    def set_tags(self, ip_tags: Iterable[IPTag] = (),
+                 reverse_ip_tags: Iterable[ReverseIPTag] = (),
+                 use_sender: bool = False) -> None:
+        # Check all the tags before setting any of them
+        ip_addresses: Dict[str, bytes] = dict()
+        ip_tags_to_set: List[Tuple[SCAMPConnection, bytes, IPTag]] = list()
+        for ip_tag in ip_tags:
+            # Check that the tag has a port assigned
+            if ip_tag.port is None:
+                raise SpinnmanInvalidParameterException(
+                    "ip_tag.port", "None", "The tag port must have been set")
+
+            # Get the connections - if the tag specifies a connection, use
+            # that, otherwise apply the tag to all connections
+            connections = self.__get_connection_list(
+                None, ip_tag.board_address)
+            if not connections:
+                raise SpinnmanInvalidParameterException(
+                    "ip_tag", str(ip_tag),
+                    "The given board address is not recognised")
+
+            for connection in connections:
+                # Convert the host string, looking up each host only once
+                host_string = ip_tag.ip_address
+                if host_string in ("localhost", ".", "0.0.0.0"):
+                    host_string = connection.local_ip_address
+                if host_string not in ip_addresses:
+                    ip_addresses[host_string] = socket.inet_aton(
+                        socket.gethostbyname(host_string))
+                ip_tags_to_set.append(
+                    (connection, ip_addresses[host_string], ip_tag))
+
+        reverse_ip_tags_to_set: List[
+            Tuple[SCAMPConnection, ReverseIPTag]] = list()
+        for reverse_ip_tag in reverse_ip_tags:
+            self.__check_reverse_ip_tag_port(reverse_ip_tag)
+            connections = self.__get_connection_list(
+                None, reverse_ip_tag.board_address)
+            if not connections:
+                raise SpinnmanInvalidParameterException(
+                    "reverse_ip_tag", str(reverse_ip_tag),
+                    "The given board address is not recognised")
+            reverse_ip_tags_to_set.extend(
+                (connection, reverse_ip_tag) for connection in connections)
+
+        process = SetTagsProcess(self._scamp_connection_selector)
+        process.set_tags(ip_tags_to_set, reverse_ip_tags_to_set, use_sender)
 
     def __get_connection_list(
             self, connection: Optional[SCAMPConnection] = None,
@@ -1180,8 +1535,8 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             return []
         return [connection]
 
-    @overrides(Transceiver.set_reverse_ip_tag)
-    def set_reverse_ip_tag(self, reverse_ip_tag: ReverseIPTag) -> None:
+    @staticmethod
+    def __check_reverse_ip_tag_port(reverse_ip_tag: ReverseIPTag) -> None:
         if reverse_ip_tag.port is None:
             raise SpinnmanInvalidParameterException(
                 "reverse_ip_tag.port", "None",
@@ -1195,37 +1550,29 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                 f" the SpiNNaker system ports ({SCP_SCAMP_PORT} and "
                 f"{UDP_BOOT_CONNECTION_DEFAULT_PORT})")
 
-        # Get the connections - if the tag specifies a connection, use that,
-        # otherwise apply the tag to all connections
-        connections = self.__get_connection_list(
-            None, reverse_ip_tag.board_address)
-        if not connections:
-            raise SpinnmanInvalidParameterException(
-                "reverse_ip_tag", str(reverse_ip_tag),
-                "The given board address is not recognised")
-
-        for connection in connections:
-            self._call(ReverseIPTagSet(
-                connection.chip_x, connection.chip_y,
-                reverse_ip_tag.destination_x, reverse_ip_tag.destination_y,
-                reverse_ip_tag.destination_p,
-                reverse_ip_tag.port, reverse_ip_tag.tag,
-                reverse_ip_tag.sdp_port))
+    @overrides(Transceiver.set_reverse_ip_tag)
+    def set_reverse_ip_tag(self, reverse_ip_tag: ReverseIPTag) -> None:
+        self.set_tags(reverse_ip_tags=[reverse_ip_tag])
 
     @overrides(Transceiver.clear_ip_tag)
     def clear_ip_tag(
             self, tag: int, board_address: Optional[str] = None) -> None:
-        for conn in self.__get_connection_list(board_address=board_address):
-            self._call(IPTagClear(conn.chip_x, conn.chip_y, tag))
+        self.clear_ip_tags([tag], board_address)
+
+    @overrides(Transceiver.clear_ip_tags)
+    def clear_ip_tags(
+            self, tags: Iterable[int],
+            board_address: Optional[str] = None) -> None:
+        connections = self.__get_connection_list(board_address=board_address)
+        process = SetTagsProcess(self._scamp_connection_selector)
+        process.clear_tags(
+            (conn, tag) for tag in tags for conn in connections)
 
     @overrides(Transceiver.get_tags)
     def get_tags(self, connection: Optional[SCAMPConnection] = None
                  ) -> Iterable[AbstractTag]:
-        all_tags = list()
-        for conn in self.__get_connection_list(connection):
-            process = GetTagsProcess(self._scamp_connection_selector)
-            all_tags.extend(process.get_tags(conn))
-        return all_tags
+        process = GetTagsProcess(self._scamp_connection_selector)
+        return process.get_tags_multi(self.__get_connection_list(connection))
 
     @overrides(Transceiver.malloc_sdram)
     def malloc_sdram(
@@ -1248,15 +1595,112 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
 
     @overrides(Transceiver.load_multicast_routes)
     def load_multicast_routes(
-            self, x: int, y: int, routes: Collection[MulticastRoutingEntry],
+            self, x: int, y: int,
+            routes: Union[Collection[MulticastRoutingEntry], NDArray],
             app_id: int) -> None:
+        table = self.__routing_array(routes)
+        # The table is staged where executables are loaded
+        self._forget_loaded_executables([(x, y)])
+        # Until the load works, what is on the chip is not known
+        previous = {(x, y): self._route_shadows.pop((x, y), None)}
         try:
             process = LoadMultiCastRoutesProcess(
                 self._scamp_connection_selector)
-            process.load_routes(x, y, routes, app_id)
+            process.load_routes(x, y, table, app_id)
         except Exception:
             logger.info(self._where_is_xy(x, y))
             raise
+        self.__shadow_routes({(x, y): table}, app_id, previous)
+
+    @overrides(Transceiver.load_multicast_routes_multi)
+    def load_multicast_routes_multi(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> None:
+        tables = {xy: self.__routing_array(r) for xy, r in routes.items()}
+        # The tables are staged where executables are loaded
+        self._forget_loaded_executables(tables)
+        # Until the load works, what is on the chips is not known
+        previous = {xy: self._route_shadows.pop(xy, None) for xy in tables}
+        process = LoadMultiCastRoutesProcess(
+            self._scamp_connection_selector)
+        process.load_routes_multi(tables, app_id)
+        self.__shadow_routes(tables, app_id, previous)
+
+    @overrides(Transceiver.update_multicast_routes)
+    def update_multicast_routes(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> List[XY]:
+        tables = {xy: self.__routing_array(r) for xy, r in routes.items()}
+        changed = [xy for xy, table in tables.items()
+                   if not self.__is_shadowed(xy, table, app_id)]
+        if not changed:
+            return changed
+
+        # Clearing removes the routes of all applications, so those of
+        # the other applications known to be on the chips are reloaded
+        unknown = [xy for xy in changed if xy not in self._route_shadows]
+        if unknown:
+            logger.warning(
+                "Clearing the routes of {} chips, such as {}, whose routes "
+                "were not loaded by this transceiver; any routes of other "
+                "applications on them will be lost", len(unknown),
+                unknown[:5])
+        to_load: Dict[int, Dict[XY, NDArray]] = defaultdict(dict)
+        for xy in changed:
+            for other_id, table in self._route_shadows.pop(xy, {}).items():
+                if other_id != app_id:
+                    to_load[other_id][xy] = table
+            to_load[app_id][xy] = tables[xy]
+        ClearRoutesProcess(self._scamp_connection_selector).clear_routes(
+            changed)
+        for xy in changed:
+            self._route_shadows[xy] = dict()
+        for load_id, load_tables in to_load.items():
+            self.load_multicast_routes_multi(
+                {xy: table for xy, table in load_tables.items()
+                 if len(table)}, load_id)
+        return changed
+
+    @staticmethod
+    def __routing_array(
+            routes: Union[Collection[MulticastRoutingEntry], NDArray]
+            ) -> NDArray:
+        if isinstance(routes, numpy.ndarray):
+            return routes.copy()
+        return routes_to_array(routes)
+
+    def __shadow_routes(
+            self, tables: Mapping[XY, NDArray], app_id: int,
+            previous: Mapping[XY, Optional[Dict[int, NDArray]]]) -> None:
+        """
+        Record routes that have been added to chips.
+
+        :param tables: The routes added to each chip
+        :param app_id: The application the routes were added for
+        :param previous: The routes known to be on each chip before
+        """
+        for xy, table in tables.items():
+            shadows = previous.get(xy) or dict()
+            self._route_shadows[xy] = shadows
+            if app_id in shadows:
+                table = numpy.concatenate((shadows[app_id], table))
+            shadows[app_id] = table
+
+    def __is_shadowed(self, xy: XY, table: NDArray, app_id: int) -> bool:
+        """
+        Whether the routes of an application on a chip are known to be
+        the given ones.
+        """
+        shadows = self._route_shadows.get(xy)
+        if shadows is None:
+            return False
+        shadow = shadows.get(app_id)
+        if shadow is None:
+            return len(table) == 0
+        missing, extra = routing_table_differences(table, shadow)
+        return len(missing) == 0 and len(extra) == 0
 
     @overrides(Transceiver.load_fixed_route)
     def load_fixed_route(self, x: int, y: int, fixed_route: RoutingEntry,
@@ -1293,19 +1737,57 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             logger.info(self._where_is_xy(x, y))
             raise
 
+    @overrides(Transceiver.get_multicast_routes_array)
+    def get_multicast_routes_array(
+            self, x: int, y: int, app_id: Optional[int] = None) -> NDArray:
+        try:
+            base_address = cast(int, self._get_sv_data(
+                x, y, SystemVariableDefinition.router_table_copy_address))
+            process = GetMultiCastRoutesProcess(
+                self._scamp_connection_selector, app_id)
+            return process.get_routes_array(x, y, base_address)
+        except Exception:
+            logger.info(self._where_is_xy(x, y))
+            raise
+
+    @overrides(Transceiver.verify_multicast_routes)
+    def verify_multicast_routes(
+            self, expected: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: Optional[int] = None,
+            full_read: bool = True) -> Dict[XY, Tuple[NDArray, NDArray]]:
+        expected_arrays = {
+            xy: (routes if isinstance(routes, numpy.ndarray)
+                 else routes_to_array(routes))
+            for xy, routes in expected.items()}
+        process = GetMultiCastRoutesProcess(
+            self._scamp_connection_selector, app_id)
+        actual = process.get_routes_arrays(
+            {xy: len(routes) for xy, routes in expected_arrays.items()},
+            full_read)
+        differences = dict()
+        for xy, routes in expected_arrays.items():
+            missing, extra = routing_table_differences(routes, actual[xy])
+            if len(missing) or len(extra):
+                differences[xy] = (missing, extra)
+        return differences
+
     @overrides(Transceiver.clear_multicast_routes)
     def clear_multicast_routes(self, xy: Optional[XY] = None) -> None:
         if xy is None:
+            chips = list(SpiNNManDataView.get_machine().chip_coordinates)
             process = ClearRoutesProcess(self._scamp_connection_selector)
-            process.clear_routes(
-                list(SpiNNManDataView.get_machine().chip_coordinates))
+            process.clear_routes(chips)
         else:
+            chips = [xy]
             x, y = xy
             try:
                 self._call(RouterClear(x, y))
             except Exception:
                 logger.info(self._where_is_xy(x, y))
                 raise
+        for chip in chips:
+            self._route_shadows[chip] = dict()
 
     @overrides(Transceiver.get_router_diagnostics)
     def get_router_diagnostics(self, x: int, y: int) -> RouterDiagnostics:
@@ -1317,6 +1799,16 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             logger.info(self._where_is_xy(x, y))
             raise
 
+    @overrides(Transceiver.get_router_diagnostics_all)
+    def get_router_diagnostics_all(
+            self, xys: Optional[Iterable[XY]] = None
+            ) -> Tuple[NDArray, NDArray, NDArray]:
+        if xys is None:
+            xys = SpiNNManDataView.get_machine().chip_coordinates
+        process = ReadRouterDiagnosticsProcess(
+            self._scamp_connection_selector)
+        return process.get_router_diagnostics_all(xys)
+
     @overrides(Transceiver.get_scamp_connection_selector)
     def get_scamp_connection_selector(self) -> MostDirectConnectionSelector:
         return self._scamp_connection_selector
@@ -1389,32 +1881,48 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
     def control_sync(self, do_sync: bool) -> None:
         self._call(DoSync(do_sync))
 
+    @staticmethod
+    def __update_provenance_and_exit_message(
+            x: int, y: int, p: int) -> SDPMessage:
+        cmd = SDP_RUNNING_MESSAGE_CODES.SDP_UPDATE_PROVENCE_REGION_AND_EXIT
+        port = SDP_PORTS.RUNNING_COMMAND_SDP_PORT
+        return SDPMessage(
+            SDPHeader(
+                flags=SDPFlag.REPLY_NOT_EXPECTED,
+                destination_port=port.value, destination_cpu=p,
+                destination_chip_x=x, destination_chip_y=y),
+            data=_ONE_WORD.pack(cmd.value))
+
     @overrides(Transceiver.update_provenance_and_exit)
     def update_provenance_and_exit(self, x: int, y: int, p: int) -> None:
         # Send these signals to make sure the application isn't stuck
-        self.send_sdp_message(SDPMessage(
-            sdp_header=SDPHeader(
-                flags=SDPFlag.REPLY_NOT_EXPECTED,
-                destination_port=SDP_PORTS.RUNNING_COMMAND_SDP_PORT.value,
-                destination_chip_x=x, destination_chip_y=y, destination_cpu=p),
-            data=_ONE_WORD.pack(SDP_RUNNING_MESSAGE_CODES
-                                .SDP_UPDATE_PROVENCE_REGION_AND_EXIT.value)))
+        self.send_sdp_message(
+            self.__update_provenance_and_exit_message(x, y, p))
 
     @overrides(Transceiver.send_chip_update_provenance_and_exit)
     def send_chip_update_provenance_and_exit(
             self, x: int, y: int, p: int) -> None:
-        cmd = SDP_RUNNING_MESSAGE_CODES.SDP_UPDATE_PROVENCE_REGION_AND_EXIT
-        port = SDP_PORTS.RUNNING_COMMAND_SDP_PORT
-
-        self.send_sdp_message(SDPMessage(
-            SDPHeader(
-                flags=SDPFlag.REPLY_NOT_EXPECTED,
-                destination_port=port.value, destination_cpu=p,
-                destination_chip_x=x, destination_chip_y=y),
-            data=_ONE_WORD.pack(cmd.value)))
+        self.send_sdp_message(
+            self.__update_provenance_and_exit_message(x, y, p))
+
+    @overrides(Transceiver.update_provenance_and_exit_multi)
+    def update_provenance_and_exit_multi(
+            self, core_subsets: CoreSubsets) -> None:
+        fan_out_sdp_messages(self._scamp_connections, (
+            self.__update_provenance_and_exit_message(
+                subset.x, subset.y, p)
+            for subset in core_subsets for p in subset.processor_ids))
+
+    @overrides(Transceiver.configure_routers)
+    def configure_routers(self, configuration: RouterConfiguration) -> None:
+        process = ConfigureRoutersProcess(self._scamp_connection_selector)
+        process.configure(configuration)
+        for xy in configuration.clears:
+            self._route_shadows[xy] = dict()
 
     @overrides(Transceiver.reset_routing)
     def reset_routing(self) -> None:
+        self._route_shadows.clear()
 
         # Sets user 2 to count non-local default routed packets
         filter_2 = DiagnosticFilter(
@@ -1452,10 +1960,11 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         machine = SpiNNManDataView().get_machine()
         self.clear_router_diagnostic_counters()
         self.clear_multicast_routes()
+        configuration = RouterConfiguration()
         for x, y in machine.chip_coordinates:
             for position, diagnostic_filter in custom_filters.items():
-                self.set_router_diagnostic_filter(
-                    x, y, position, diagnostic_filter)
+                configuration.add_filter(x, y, position, diagnostic_filter)
+        self.configure_routers(configuration)
 
     def __str__(self) -> str:
         addr = self._scamp_connections[0].remote_ip_address
@@ -0,0 +1,148 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from typing import Sequence
+from spinn_utilities.log import FormatAdapter
+from spinnman.constants import (
+    BMP_POST_POWER_ON_SLEEP_TIME, BMP_POWER_ON_TIMEOUT, BMP_TIMEOUT,
+    POWER_CYCLE_WAIT_TIME_IN_SECONDS)
+from spinnman.exceptions import (
+    SpinnmanGenericProcessException, SpinnmanTimeoutException)
+from spinnman.messages.scp.abstract_messages import BMPOKResponse
+from spinnman.messages.scp.enums import PowerCommand
+from spinnman.messages.scp.impl import SetPower
+from spinnman.processes import (
+    ConnectionSelector, ReadFPGARegistersProcess, SendSingleCommandProcess)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The FPGAs on each board
+_FPGA_NUMS = (0, 1, 2)
+#: The version register in the top-level bank of the FPGA design
+_FPGA_VERSION_REGISTER = 0x40000
+#: The wait before asking the FPGAs if they are up again
+_FPGA_POLL_FIRST_DELAY = 0.05
+#: The longest wait between asking the FPGAs if they are up
+_FPGA_POLL_MAX_DELAY = 0.4
+
+
+class BMPPowerManager(object):
+    """
+    Turns the boards of a BMP on and off.
+
+    After power on, the FPGAs of every board are polled until they all
+    answer, rather than waiting a fixed time.  After power off, the
+    recommended time before the boards may be powered on again is always
+    waited for, as nothing stops another process powering them on.
+    """
+    __slots__ = (
+        "_boards",
+        "_power_cycle_wait",
+        "_power_on_wait",
+        "_selector")
+
+    def __init__(self, connection_selector: ConnectionSelector,
+                 boards: Sequence[int],
+                 power_cycle_wait: float = POWER_CYCLE_WAIT_TIME_IN_SECONDS,
+                 power_on_wait: float = BMP_POST_POWER_ON_SLEEP_TIME):
+        """
+        :param connection_selector: Selects the connection to the BMP
+        :param boards: The boards controlled by the BMP
+        :param power_cycle_wait:
+            The time, in seconds, to wait after powering off the boards
+        :param power_on_wait:
+            The longest time, in seconds, to wait for the FPGAs of the
+            boards to answer after powering them on
+        """
+        self._selector = connection_selector
+        self._boards = list(boards)
+        self._power_cycle_wait = power_cycle_wait
+        self._power_on_wait = power_on_wait
+
+    def __set_power(self, power_command: PowerCommand,
+                    timeout: float) -> None:
+        process: SendSingleCommandProcess[BMPOKResponse] = \
+            SendSingleCommandProcess(
+                self._selector, n_retries=0, timeout=timeout)
+        process.execute(SetPower(power_command, self._boards))
+
+    def power_off(self) -> None:
+        """
+        Turn off all the boards of the BMP, and wait for the time
+        recommended before they are powered on again.
+
+        :raise SpinnmanIOException:
+            If there is an error communicating with the BMP
+        :raise SpinnmanGenericProcessException:
+            If the BMP did not turn the boards off
+        """
+        self.__set_power(PowerCommand.POWER_OFF, BMP_TIMEOUT)
+        time.sleep(self._power_cycle_wait)
+
+    def power_on(self) -> bool:
+        """
+        Turn on all the boards of the BMP, and wait for them to be up.
+
+        :returns: Whether the FPGAs of all the boards answered in time
+        :raise SpinnmanIOException:
+            If there is an error communicating with the BMP
+        :raise SpinnmanGenericProcessException:
+            If the BMP did not turn the boards on
+        """
+        start = time.monotonic()
+        self.__set_power(PowerCommand.POWER_ON, BMP_POWER_ON_TIMEOUT)
+        ready = self.wait_for_boards()
+        if ready:
+            logger.info("Boards powered on and ready in {:.3f}s",
+                        time.monotonic() - start)
+        else:
+            logger.warning(
+                "Not all FPGAs answered within {}s of power on; continuing "
+                "anyway", self._power_on_wait)
+        return ready
+
+    def wait_for_boards(self) -> bool:
+        """
+        Wait for the FPGAs of all the boards of the BMP to answer, asking
+        again with increasing delays.
+
+        :returns: Whether they all answered in time
+        :raise SpinnmanIOException:
+            If there is an error communicating with the BMP
+        """
+        end_time = time.monotonic() + self._power_on_wait
+        delay = _FPGA_POLL_FIRST_DELAY
+        waiting = list(self._boards)
+        while True:
+            try:
+                process = ReadFPGARegistersProcess(
+                    self._selector, n_retries=0, timeout=BMP_TIMEOUT)
+                values = process.read_fpga_registers(
+                    waiting, _FPGA_NUMS, _FPGA_VERSION_REGISTER,
+                    allow_failures=True)
+                waiting = [
+                    board for board in waiting
+                    if any((board, fpga_num) not in values
+                           for fpga_num in _FPGA_NUMS)]
+            except (SpinnmanGenericProcessException,
+                    SpinnmanTimeoutException):
+                pass
+            if not waiting:
+                return True
+            if time.monotonic() >= end_time:
+                return False
+            time.sleep(min(delay, max(end_time - time.monotonic(), 0)))
+            delay = min(delay * 2, _FPGA_POLL_MAX_DELAY)
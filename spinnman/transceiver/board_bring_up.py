@@ -0,0 +1,233 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import time
+from typing import List, Optional, Sequence
+from spinn_utilities.log import FormatAdapter
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.constants import IPTAG_TIME_OUT_WAIT_TIMES
+from spinnman.exceptions import (
+    SpinnmanException, SpinnmanGenericProcessException, SpinnmanIOException,
+    SpinnmanTimeoutException, SpinnmanUnexpectedResponseCodeException)
+from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
+from spinnman.messages.scp.impl import GetChipInfo, IPTagSetTTO
+from spinnman.messages.scp.impl.get_chip_info_response import (
+    GetChipInfoResponse)
+from spinnman.messages.scp.impl.iptag_get_info_response import (
+    IPTagGetInfoResponse)
+from spinnman.model import ChipSummaryInfo
+from spinnman.processes import (
+    ConnectionSelector, FixedConnectionSelector, GetVersionProcess,
+    SendSingleCommandProcess)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_CONNECTION_CHECK_RETRIES = 3
+#: The most boards to talk to at the same time
+_MAX_BOARD_THREADS = 32
+#: The longest time to wait for SCAMP to answer on a board
+_VERSION_WAIT_TIME = 2.0
+#: The wait before asking SCAMP for its version again
+_VERSION_POLL_FIRST_DELAY = 0.05
+#: The longest wait between asking SCAMP for its version
+_VERSION_POLL_MAX_DELAY = 0.4
+#: The time to wait for each reply when asking SCAMP for its version
+_VERSION_POLL_TIMEOUT = 0.25
+
+
+def wait_for_scamp(
+        connection_selector: ConnectionSelector,
+        sleep_first: bool = False) -> bool:
+    """
+    Wait for SCAMP to answer with its own chip coordinates, by asking for
+    its version at increasing intervals until it does or the time that
+    SCAMP is expected to take to start has passed.
+
+    :param connection_selector: Selects the connection to ask over
+    :param sleep_first:
+        Whether to wait before asking the first time, such as when SCAMP
+        has only just been sent the boot messages
+    :return: Whether SCAMP answered in time
+    """
+    end_time = time.monotonic() + _VERSION_WAIT_TIME
+    delay = _VERSION_POLL_FIRST_DELAY
+    if sleep_first:
+        time.sleep(delay)
+    while True:
+        try:
+            process = GetVersionProcess(
+                connection_selector, n_retries=0,
+                timeout=_VERSION_POLL_TIMEOUT)
+            version_info = process.get_version(
+                AbstractSCPRequest.DEFAULT_DEST_X_COORD,
+                AbstractSCPRequest.DEFAULT_DEST_Y_COORD, 0)
+            if (version_info.x, version_info.y) != (
+                    AbstractSCPRequest.DEFAULT_DEST_X_COORD,
+                    AbstractSCPRequest.DEFAULT_DEST_Y_COORD):
+                return True
+        except SpinnmanException:
+            pass
+        if time.monotonic() >= end_time:
+            return False
+        time.sleep(min(delay, max(end_time - time.monotonic(), 0)))
+        delay = min(delay * 2, _VERSION_POLL_MAX_DELAY)
+
+
+def check_connection(
+        connection: SCAMPConnection) -> Optional[ChipSummaryInfo]:
+    """
+    Check that the given connection to the given chip works.
+
+    A chip that is there but does not yet have its Ethernet up is asked
+    again a few times; a chip that does not answer at all is not, as the
+    request has already been retried.
+
+    :param connection: the connection to check
+    :return: The chip information if a valid response is received with
+        Ethernet available, `None` otherwise
+    """
+    chip_x, chip_y = connection.chip_x, connection.chip_y
+    connection_selector = FixedConnectionSelector(connection)
+    for _ in range(_CONNECTION_CHECK_RETRIES):
+        try:
+            sender: SendSingleCommandProcess[GetChipInfoResponse] = \
+                SendSingleCommandProcess(connection_selector)
+            chip_info = sender.execute(
+                GetChipInfo(chip_x, chip_y)).chip_info
+            if not chip_info.is_ethernet_available:
+                time.sleep(0.1)
+            else:
+                return chip_info
+        except SpinnmanGenericProcessException as e:
+            if isinstance(e.exception, SpinnmanTimeoutException):
+                break
+        except SpinnmanUnexpectedResponseCodeException:
+            pass
+        except (SpinnmanTimeoutException, SpinnmanIOException):
+            break
+    return None
+
+
+def check_connections(
+        connections: Sequence[SCAMPConnection]
+        ) -> List[Optional[ChipSummaryInfo]]:
+    """
+    Check that the given connections work, all at the same time.
+
+    :param connections: the connections to check
+    :return: The result of :py:func:`check_connection` for each connection
+    """
+    if not connections:
+        return []
+    with ThreadPoolExecutor(max_workers=min(
+            len(connections), _MAX_BOARD_THREADS)) as executor:
+        return list(executor.map(check_connection, connections))
+
+
+@dataclass
+class BoardBringUpTimeline:
+    """
+    When each step of bringing up a board finished, in seconds from the
+    start of the bring-up; a step that did not succeed has no time.
+    """
+    #: The connection to the board
+    connection: SCAMPConnection
+    #: When SCAMP on the board answered with its own coordinates
+    version_ready: Optional[float] = None
+    #: When the IP tag timeout of the board was set
+    tto_set: Optional[float] = None
+    #: When the connection to the board was checked
+    checked: Optional[float] = None
+    #: The information of the Ethernet chip of the board, if checked
+    chip_info: Optional[ChipSummaryInfo] = None
+
+    def __str__(self) -> str:
+        def step(value: Optional[float]) -> str:
+            return "failed" if value is None else f"{value:.3f}s"
+        return (
+            f"{self.connection.remote_ip_address} "
+            f"({self.connection.chip_x}, {self.connection.chip_y}): "
+            f"version {step(self.version_ready)}, "
+            f"tto {step(self.tto_set)}, check {step(self.checked)}")
+
+
+class BoardBringUp(object):
+    """
+    Brings up the boards of a machine after it has been booted, doing
+    many boards at the same time, each over its own connection.
+
+    For each board, this waits for SCAMP to answer, sets the IP tag
+    timeout and checks the connection, recording when each step finished.
+    """
+    __slots__ = (
+        "_connections",
+        "_tto")
+
+    def __init__(
+            self, connections: Sequence[SCAMPConnection],
+            tto: IPTAG_TIME_OUT_WAIT_TIMES = (
+                IPTAG_TIME_OUT_WAIT_TIMES.TIMEOUT_2560_ms)):
+        """
+        :param connections: The connections to the boards to bring up
+        :param tto: The IP tag timeout to set on each board
+        """
+        self._connections = list(connections)
+        self._tto = tto
+
+    def run(self) -> List[BoardBringUpTimeline]:
+        """
+        Bring up all the boards.
+
+        :returns: The timeline of each board, in the order of connections
+        :raise SpinnmanIOException:
+            If there is an error communicating with a board
+        :raise SpinnmanGenericProcessException:
+            If the IP tag timeout of a board could not be set
+        """
+        if not self._connections:
+            return []
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(
+                len(self._connections), _MAX_BOARD_THREADS)) as executor:
+            futures = [
+                executor.submit(self.__bring_up, connection, start)
+                for connection in self._connections]
+            timelines = [future.result() for future in futures]
+        for timeline in timelines:
+            logger.debug("Board bring-up: {}", timeline)
+        logger.info("Brought up {} boards in {:.3f}s",
+                    len(timelines), time.monotonic() - start)
+        return timelines
+
+    def __bring_up(self, connection: SCAMPConnection,
+                   start: float) -> BoardBringUpTimeline:
+        timeline = BoardBringUpTimeline(connection)
+        selector = FixedConnectionSelector(connection)
+
+        if wait_for_scamp(selector):
+            timeline.version_ready = time.monotonic() - start
+
+        tto: SendSingleCommandProcess[IPTagGetInfoResponse] = \
+            SendSingleCommandProcess(selector)
+        tto.execute(IPTagSetTTO(
+            connection.chip_x, connection.chip_y, self._tto))
+        timeline.tto_set = time.monotonic() - start
+
+        timeline.chip_info = check_connection(connection)
+        if timeline.chip_info is not None:
+            timeline.checked = time.monotonic() - start
+        return timeline
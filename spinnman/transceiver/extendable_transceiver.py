@@ -13,11 +13,12 @@
 # limitations under the License.
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 from threading import Condition, RLock
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod)
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.coords import XY
 from spinnman.connections.udp_packet_connections import BMPConnection
 from spinnman.processes import ConnectionSelector, FixedConnectionSelector
 from spinnman.transceiver.transceiver import Transceiver
@@ -63,3 +64,14 @@ class ExtendableTransceiver(Transceiver, metaclass=AbstractBase):
         Returns the scamp selector
         """
         raise NotImplementedError("This method is abstract")
+
+    @abstractmethod
+    def _forget_loaded_executables(
+            self, xys: Optional[Iterable[XY]] = None) -> None:
+        """
+        Forget any executable known to be loaded on chips, as their memory
+        where executables are loaded may have been written over.
+
+        :param xys: The chips to forget about, or `None` for all chips
+        """
+        raise NotImplementedError("This method is abstract")
@@ -12,31 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import struct
 from typing import (
-    BinaryIO, Collection, Dict, FrozenSet, Iterable,
-    List, Optional, Set, Tuple, Union)
+    BinaryIO, Callable, Collection, Dict, FrozenSet, Iterable,
+    List, Mapping, Optional, Sequence, Set, Tuple, Union)
+from numpy.typing import NDArray
 from spinn_utilities.overrides import overrides
 from spinn_utilities.progress_bar import ProgressBar
-from spinn_utilities.typing.coords import XY
+from spinn_utilities.typing.coords import XY, XYP
 from spinn_machine import (
     CoreSubsets, Machine, MulticastRoutingEntry, RoutingEntry)
 from spinn_machine.tags import AbstractTag, IPTag, ReverseIPTag
 from spinnman.data import SpiNNManDataView
+from spinnman.connections import ConnectionListener
 from spinnman.connections.abstract_classes import Connection
 from spinnman.connections.udp_packet_connections import BMPConnection
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
 from spinnman.connections.udp_packet_connections import (
     SCAMPConnection, SDPConnection)
 from spinnman.processes import ConnectionSelector, FixedConnectionSelector
 from spinnman.messages.scp.enums import Signal
 from spinnman.messages.sdp import SDPMessage
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
 from spinnman.model import (
-    CPUInfos, DiagnosticFilter, IOBuffer, RouterDiagnostics,
-    VersionInfo)
+    CPUInfos, DiagnosticFilter, IOBuffer, RouterConfiguration,
+    RouterDiagnostics, VersionInfo)
 from spinnman.model.enums import CPUState, UserRegister
 from spinnman.transceiver.transceiver import Transceiver
 from spinnman.transceiver.extendable_transceiver import ExtendableTransceiver
 from spinnman.processes import MostDirectConnectionSelector
 
+_ONE_BYTE = struct.Struct("B")
+
 
 class MockableTransceiver(ExtendableTransceiver):
     """
@@ -75,17 +82,31 @@ class MockableTransceiver(ExtendableTransceiver):
     def get_cpu_infos(
             self, core_subsets: Optional[CoreSubsets] = None,
             states: Union[CPUState, Iterable[CPUState], None] = None,
-            include: bool = True) -> CPUInfos:
+            include: bool = True, *, app_id: Optional[int] = None
+            ) -> CPUInfos:
         raise NotImplementedError("Needs to be mocked")
 
     @overrides(Transceiver.get_clock_drift)
     def get_clock_drift(self, x: int, y: int) -> float:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.read_system_variables)
+    def read_system_variables(
+            self, xys: Iterable[XY],
+            variables: Iterable[SystemVariableDefinition]
+            ) -> Dict[SystemVariableDefinition, NDArray]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.read_user)
     def read_user(self, x: int, y: int, p: int, user: UserRegister) -> int:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.read_user_many)
+    def read_user_many(
+            self, core_subsets: CoreSubsets, users: Collection[UserRegister]
+            ) -> Dict[XYP, Dict[UserRegister, int]]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.add_cpu_information_from_core)
     def add_cpu_information_from_core(
             self, cpu_infos: CPUInfos, x: int, y: int, p: int,
@@ -96,11 +117,27 @@ class MockableTransceiver(ExtendableTransceiver):
     def get_region_base_address(self, x: int, y: int, p: int) -> int:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.get_region_base_addresses)
+    def get_region_base_addresses(
+            self, core_subsets: CoreSubsets) -> Dict[XYP, int]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.get_iobuf)
     def get_iobuf(self, core_subsets: Optional[CoreSubsets] = None
                   ) -> Iterable[IOBuffer]:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.write_iobuf_to_files)
+    def write_iobuf_to_files(
+            self, filename: Callable[[int, int, int], str],
+            core_subsets: Optional[CoreSubsets] = None) -> List[str]:
+        raise NotImplementedError("Needs to be mocked")
+
+    @overrides(Transceiver.get_new_iobuf)
+    def get_new_iobuf(self, core_subsets: Optional[CoreSubsets] = None
+                      ) -> Iterable[IOBuffer]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.get_core_state_count)
     def get_core_state_count(
             self, app_id: int, state: CPUState,
@@ -114,6 +151,13 @@ class MockableTransceiver(ExtendableTransceiver):
             n_bytes: Optional[int] = None, wait: bool = False) -> None:
         pass
 
+    @overrides(Transceiver.execute_flood_multi)
+    def execute_flood_multi(
+            self, executables: Sequence[
+                Tuple[CoreSubsets, Union[BinaryIO, bytes, str]]],
+            app_id: int, *, wait: bool = False) -> None:
+        pass
+
     @overrides(Transceiver.read_fpga_register)
     def read_fpga_register(
             self, fpga_num: int, register: int, board: int = 0) -> int:
@@ -169,7 +213,9 @@ class MockableTransceiver(ExtendableTransceiver):
             error_states: FrozenSet[CPUState] = frozenset((
                 CPUState.RUN_TIME_EXCEPTION, CPUState.WATCHDOG)),
             counts_between_full_check: int = 100,
-            progress_bar: Optional[ProgressBar] = None) -> None:
+            progress_bar: Optional[ProgressBar] = None,
+            state_change_listener: Optional[
+                ConnectionListener[SDPMessage]] = None) -> None:
         pass
 
     @overrides(Transceiver.send_signal)
@@ -184,11 +230,23 @@ class MockableTransceiver(ExtendableTransceiver):
     def set_reverse_ip_tag(self, reverse_ip_tag: ReverseIPTag) -> None:
         pass
 
+    @overrides(Transceiver.set_tags)
+    def set_tags(self, ip_tags: Iterable[IPTag] = (),
+                 reverse_ip_tags: Iterable[ReverseIPTag] = (),
+                 use_sender: bool = False) -> None:
+        pass
+
     @overrides(Transceiver.clear_ip_tag)
     def clear_ip_tag(
             self, tag: int, board_address: Optional[str] = None) -> None:
         pass
 
+    @overrides(Transceiver.clear_ip_tags)
+    def clear_ip_tags(
+            self, tags: Iterable[int],
+            board_address: Optional[str] = None) -> None:
+        pass
+
     @overrides(Transceiver.get_tags)
     def get_tags(self, connection: Optional[SCAMPConnection] = None
                  ) -> Iterable[AbstractTag]:
@@ -201,10 +259,25 @@ class MockableTransceiver(ExtendableTransceiver):
 
     @overrides(Transceiver.load_multicast_routes)
     def load_multicast_routes(
-            self, x: int, y: int, routes: Collection[MulticastRoutingEntry],
+            self, x: int, y: int,
+            routes: Union[Collection[MulticastRoutingEntry], NDArray],
+            app_id: int) -> None:
+        pass
+
+    @overrides(Transceiver.load_multicast_routes_multi)
+    def load_multicast_routes_multi(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
             app_id: int) -> None:
         pass
 
+    @overrides(Transceiver.update_multicast_routes)
+    def update_multicast_routes(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> List[XY]:
+        return list(routes)
+
     @overrides(Transceiver.load_fixed_route)
     def load_fixed_route(self, x: int, y: int, fixed_route: RoutingEntry,
                          app_id: int) -> None:
@@ -220,6 +293,19 @@ class MockableTransceiver(ExtendableTransceiver):
             app_id: Optional[int] = None) -> List[MulticastRoutingEntry]:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.get_multicast_routes_array)
+    def get_multicast_routes_array(
+            self, x: int, y: int, app_id: Optional[int] = None) -> NDArray:
+        raise NotImplementedError("Needs to be mocked")
+
+    @overrides(Transceiver.verify_multicast_routes)
+    def verify_multicast_routes(
+            self, expected: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: Optional[int] = None,
+            full_read: bool = True) -> Dict[XY, Tuple[NDArray, NDArray]]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.clear_multicast_routes)
     def clear_multicast_routes(self, xy: Optional[XY] = None) -> None:
         pass
@@ -228,6 +314,12 @@ class MockableTransceiver(ExtendableTransceiver):
     def get_router_diagnostics(self, x: int, y: int) -> RouterDiagnostics:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.get_router_diagnostics_all)
+    def get_router_diagnostics_all(
+            self, xys: Optional[Iterable[XY]] = None
+            ) -> Tuple[NDArray, NDArray, NDArray]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.get_scamp_connection_selector)
     def get_scamp_connection_selector(self) -> MostDirectConnectionSelector:
         raise NotImplementedError("Needs to be mocked")
@@ -243,6 +335,22 @@ class MockableTransceiver(ExtendableTransceiver):
             self, xy: Optional[XY] = None) -> None:
         pass
 
+    @overrides(Transceiver.configure_routers)
+    def configure_routers(self, configuration: RouterConfiguration) -> None:
+        # Make the changes one at a time so they can be mocked individually
+        for xy in configuration.clears:
+            self.clear_multicast_routes(xy)
+        for x, y, position, diagnostic_filter in configuration.filters:
+            self.set_router_diagnostic_filter(
+                x, y, position, diagnostic_filter)
+        for x, y, fixed_route, app_id in configuration.fixed_routes:
+            self.load_fixed_route(x, y, fixed_route, app_id)
+        for x, y, watch_dog in configuration.watch_dogs:
+            self.write_memory(
+                x, y, SYSTEM_VARIABLE_BASE_ADDRESS +
+                SystemVariableDefinition.software_watchdog_count.offset,
+                _ONE_BYTE.pack(watch_dog))
+
     @overrides(Transceiver.close)
     def close(self) -> None:
         pass
@@ -260,6 +368,11 @@ class MockableTransceiver(ExtendableTransceiver):
             self, x: int, y: int, p: int) -> None:
         pass
 
+    @overrides(Transceiver.update_provenance_and_exit_multi)
+    def update_provenance_and_exit_multi(
+            self, core_subsets: CoreSubsets) -> None:
+        pass
+
     @property
     @overrides(ExtendableTransceiver.bmp_selector)
     def bmp_selector(self) -> Optional[FixedConnectionSelector[BMPConnection]]:
@@ -270,6 +383,11 @@ class MockableTransceiver(ExtendableTransceiver):
     def scamp_connection_selector(self) -> ConnectionSelector:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(ExtendableTransceiver._forget_loaded_executables)
+    def _forget_loaded_executables(
+            self, xys: Optional[Iterable[XY]] = None) -> None:
+        pass
+
     @overrides(ExtendableTransceiver.ensure_board_is_ready)
     def ensure_board_is_ready(self) -> None:
         pass
@@ -0,0 +1,73 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Dict, Iterable, List, Sequence
+from spinn_utilities.typing.coords import XY
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.data import SpiNNManDataView
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.sdp import SDPMessage
+
+#: The number of messages sent to a board before pausing
+SDP_FAN_OUT_BURST = 8
+#: The pause, in seconds, after each board has been sent a burst
+SDP_FAN_OUT_PAUSE = 0.0005
+
+
+def fan_out_sdp_messages(
+        connections: Sequence[SCAMPConnection],
+        messages: Iterable[SDPMessage]) -> None:
+    """
+    Send messages that expect no reply to their chips, each through the
+    connection to the board of its chip.
+
+    The boards are sent a burst of messages each in turn, with a short
+    pause after each round of bursts, so that no board is sent more at
+    once than its Ethernet chip can pass on.
+
+    :param connections: The connections to the boards
+    :param messages: The messages to send
+    :raise SpinnmanInvalidParameterException:
+        If there are messages to send but no connections to send them with
+    """
+    to_send = list(messages)
+    if not to_send:
+        return
+    if not connections:
+        raise SpinnmanInvalidParameterException(
+            "connections", connections,
+            f"There are no connections to send {len(to_send)} messages with")
+    by_chip: Dict[XY, SCAMPConnection] = {
+        (conn.chip_x, conn.chip_y): conn for conn in connections}
+    lead = by_chip.get((0, 0), connections[0])
+    queues: Dict[SCAMPConnection, List[SDPMessage]] = dict()
+    for message in to_send:
+        header = message.sdp_header
+        xy = (header.destination_chip_x, header.destination_chip_y)
+        conn = by_chip.get(xy)
+        if conn is None and SpiNNManDataView.has_machine():
+            conn = by_chip.get(SpiNNManDataView.get_nearest_ethernet(*xy))
+        queues.setdefault(conn or lead, list()).append(message)
+
+    start = 0
+    while queues:
+        for conn, queue in list(queues.items()):
+            for message in queue[start:start + SDP_FAN_OUT_BURST]:
+                conn.send_sdp_message(message)
+            if len(queue) <= start + SDP_FAN_OUT_BURST:
+                del queues[conn]
+        start += SDP_FAN_OUT_BURST
+        if queues:
+            time.sleep(SDP_FAN_OUT_PAUSE)
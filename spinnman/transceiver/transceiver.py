@@ -13,22 +13,25 @@
 # limitations under the License.
 
 from typing import (
-    BinaryIO, Collection, Dict, FrozenSet, Iterable,
-    List, Optional, Set, Tuple, Union)
+    BinaryIO, Callable, Collection, Dict, FrozenSet, Iterable,
+    List, Mapping, Optional, Sequence, Set, Tuple, Union)
+from numpy.typing import NDArray
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.progress_bar import ProgressBar
-from spinn_utilities.typing.coords import XY
+from spinn_utilities.typing.coords import XY, XYP
 from spinn_machine import (
     CoreSubsets, Machine, MulticastRoutingEntry, RoutingEntry)
 from spinn_machine.tags import AbstractTag, IPTag, ReverseIPTag
+from spinnman.connections import ConnectionListener
 from spinnman.connections.abstract_classes import Connection
 from spinnman.connections.udp_packet_connections import (
     SCAMPConnection, SDPConnection)
 from spinnman.messages.scp.enums import Signal
 from spinnman.messages.sdp import SDPMessage
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
 from spinnman.model import (
-    CPUInfos, DiagnosticFilter, IOBuffer, RouterDiagnostics,
-    VersionInfo)
+    CPUInfos, DiagnosticFilter, IOBuffer, RouterConfiguration,
+    RouterDiagnostics, VersionInfo)
 from spinnman.model.enums import CPUState, UserRegister
 from spinnman.processes import MostDirectConnectionSelector
 
@@ -144,7 +147,8 @@ class Transceiver(object):
     def get_cpu_infos(
             self, core_subsets: Optional[CoreSubsets] = None,
             states: Union[CPUState, Iterable[CPUState], None] = None,
-            include: bool = True) -> CPUInfos:
+            include: bool = True, *, app_id: Optional[int] = None
+            ) -> CPUInfos:
         """
         Get information about the processors on the board.
 
@@ -157,6 +161,12 @@ class Transceiver(object):
             If `True` includes only infos in the requested state(s).
             If `False` includes only infos *not* in the requested state(s).
             Ignored if states is `None`.
+        :param app_id:
+            The application the cores belong to.
+            If given together with `states` and `include` is `True`,
+            the number of cores in the states is counted first and only
+            the cores on boards where some are found are read.
+            This makes finding a few cores among many much faster.
         :return: The CPU information for the selected cores and States, or
             all cores/states  if core_subsets/states is not specified
         :raise SpinnmanIOException:
@@ -185,6 +195,33 @@ class Transceiver(object):
         # used by drift_report
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def read_system_variables(
+            self, xys: Iterable[XY],
+            variables: Iterable[SystemVariableDefinition]
+            ) -> Dict[SystemVariableDefinition, NDArray]:
+        """
+        Read system variables of many chips together.
+
+        Only the spans of the system variable block that cover the given
+        variables are read, and all the chips are read at the same time.
+
+        :param xys: The coordinates of the chips to read
+        :param variables: The variables to read
+        :returns:
+            A column of values for each variable, in the same order as the
+            chips.  Byte array variables have a row of bytes for each chip.
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def read_user(self, x: int, y: int, p: int, user: UserRegister) -> int:
         """
@@ -216,6 +253,30 @@ class Transceiver(object):
         #    to .update_transaction_id_from_machine
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def read_user_many(
+            self, core_subsets: CoreSubsets, users: Collection[UserRegister]
+            ) -> Dict[XYP, Dict[UserRegister, int]]:
+        """
+        Get the contents of user registers of many processors.
+
+        The registers of each processor are read together, as are those of
+        processors on the same chip where they fit in a single message.
+
+        :param core_subsets: The processors to read the registers of
+        :param users: The user numbers to read on each processor
+        :returns: The current values, by processor and then by user number
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If x, y, p does not identify a valid processor
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def add_cpu_information_from_core(
             self, cpu_infos: CPUInfos, x: int, y: int, p: int,
@@ -263,6 +324,26 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def get_region_base_addresses(
+            self, core_subsets: CoreSubsets) -> Dict[XYP, int]:
+        """
+        Gets the base addresses of the Region Tables of many processors.
+
+        :param core_subsets: The processors to get the addresses of
+        :return: The address of the Region table for each processor
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If x, y, p is not a valid processor
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def get_iobuf(self, core_subsets: Optional[CoreSubsets] = None
                   ) -> Iterable[IOBuffer]:
@@ -288,6 +369,69 @@ class Transceiver(object):
         # Used by IOBufExtractor
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def write_iobuf_to_files(
+            self, filename: Callable[[int, int, int], str],
+            core_subsets: Optional[CoreSubsets] = None) -> List[str]:
+        """
+        Write the contents of the IOBUF buffer for a number of processors to
+        a file per processor.
+
+        Each file is written as soon as the processor's buffer has been
+        read, while the reading of the other buffers continues, so not all
+        the buffers are held in memory at once.
+
+        :param filename:
+            Gets the name of the file to write given x, y and p of a core
+        :param core_subsets:
+            A set of chips and cores from which to get the buffers. If not
+            specified, the buffers from all of the cores on all of the chips
+            on the board are obtained.
+        :return: The names of the files written
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If chip_and_cores contains invalid items
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
+    @abstractmethod
+    def get_new_iobuf(self, core_subsets: Optional[CoreSubsets] = None
+                      ) -> Iterable[IOBuffer]:
+        """
+        Get the IOBUF text written by a number of processors since the
+        previous call to this method for each of them.
+
+        The first call for a core returns all of its IOBUF; after that only
+        the newly written text is read from the machine.  The positions
+        reached are forgotten when the machine is booted, when the core is
+        loaded with :py:meth:`execute_flood` or
+        :py:meth:`execute_flood_multi`, when any application is stopped,
+        and when the start of the IOBUF of the core moves.
+
+        :param core_subsets:
+            A set of chips and cores from which to get the buffers. If not
+            specified, the buffers from all of the cores on all of the chips
+            on the board are obtained.
+        :return: An iterable of the buffers with new text, which may not be
+            in the order of core_subsets; cores with no new text are omitted
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If chip_and_cores contains invalid items
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def get_core_state_count(
             self, app_id: int, state: CPUState,
@@ -360,6 +504,39 @@ class Transceiver(object):
         # run_system_application._load_application
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def execute_flood_multi(
+            self, executables: Sequence[
+                Tuple[CoreSubsets, Union[BinaryIO, bytes, str]]],
+            app_id: int, *, wait: bool = False) -> None:
+        """
+        Start many executables running on multiple places on the board.
+        This is the same as calling :py:meth:`execute_flood` for each, but
+        the copying of each executable over the machine is overlapped with
+        that of the next.
+
+        :param executables:
+            For each executable, which cores on which chips to start it on,
+            and the executable itself, as for :py:meth:`execute_flood`
+        :param app_id:
+            The ID of the application with which to associate the
+            executables
+        :param wait:
+            True if the processors should enter a "wait" state on loading
+        :raise SpinnmanIOException:
+            * If there is an error communicating with the board
+            * If there is an error reading an executable
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If one of the specified cores is not valid
+            * If `app_id` is an invalid application ID
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def read_fpga_register(
             self, fpga_num: int, register: int, board: int = 0) -> int:
@@ -483,6 +660,9 @@ class Transceiver(object):
             description: Optional[str] = None) -> None:
         """ Write to the user *N* "register" for each of the given processors
 
+        Registers that are next to each other on the same processor are
+        written together.
+
         :param values:
             List of (x, y, p, register, value) to write
         :param description:
@@ -583,7 +763,9 @@ class Transceiver(object):
             error_states: FrozenSet[CPUState] = frozenset((
                 CPUState.RUN_TIME_EXCEPTION, CPUState.WATCHDOG)),
             counts_between_full_check: int = 100,
-            progress_bar: Optional[ProgressBar] = None) -> None:
+            progress_bar: Optional[ProgressBar] = None,
+            state_change_listener: Optional[
+                ConnectionListener[SDPMessage]] = None) -> None:
         """
         Waits for the specified cores running the given application to be
         in some target state or states. Handles failures.
@@ -597,7 +779,9 @@ class Transceiver(object):
         :param timeout:
             The amount of time to wait in seconds for the cores to reach one
             of the states
-        :param time_between_polls: Time between checking the state
+        :param time_between_polls:
+            The longest time between checking the state; the time between
+            checks gets shorter as the cores approach the target states
         :param error_states:
             Set of states that the application can be in that indicate an
             error, and so should raise an exception
@@ -605,6 +789,10 @@ class Transceiver(object):
             The number of times to use the count signal before instead using
             the full CPU state check
         :param progress_bar: Possible progress bar to update.
+        :param state_change_listener:
+            Optional listener of a connection to which the cores send SDP
+            messages when they change state; the wait between checks is
+            cut short when one arrives
         :raise SpinnmanTimeoutException:
             If a timeout is specified and exceeded.
         """
@@ -681,6 +869,43 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def set_tags(self, ip_tags: Iterable[IPTag] = (),
+                 reverse_ip_tags: Iterable[ReverseIPTag] = (),
+                 use_sender: bool = False) -> None:
+        """
+        Set up many IP tags and reverse IP tags together.
+
+        All the tags are checked before any are set, each host is looked up
+        only once, and the tags of all the boards are then set in one go.
+
+        :param ip_tags: The IP tags to set up.
+
+            .. note::
+                `board_address` can be `None`, in which case, the tag will be
+                assigned to all boards.
+        :param reverse_ip_tags: The reverse IP tags to set up.
+
+            .. note::
+                `board_address` can be `None`, in which case, the tag will be
+                assigned to all boards.
+        :param use_sender:
+            Optionally use the sender host and port instead of
+            the given host and port in the IP tags
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If the tag fields are incorrect
+            * If a packet is received that has invalid parameters
+            * If the UDP port of a reverse IP tag is one that is already used
+                by SpiNNaker for system functions
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def clear_ip_tag(
             self, tag: int, board_address: Optional[str] = None) -> None:
@@ -705,6 +930,29 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def clear_ip_tags(
+            self, tags: Iterable[int],
+            board_address: Optional[str] = None) -> None:
+        """
+        Clear the setting of many IP tags together.
+
+        :param tags: The tag IDs
+        :param board_address:
+            Board address where the tags should be cleared.
+            If not specified, the tags are cleared on all boards
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If a tag is not a valid tag
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def get_tags(self, connection: Optional[SCAMPConnection] = None
                  ) -> Iterable[AbstractTag]:
@@ -761,7 +1009,8 @@ class Transceiver(object):
 
     @abstractmethod
     def load_multicast_routes(
-            self, x: int, y: int, routes: Collection[MulticastRoutingEntry],
+            self, x: int, y: int,
+            routes: Union[Collection[MulticastRoutingEntry], NDArray],
             app_id: int) -> None:
         """
         Load a set of multicast routes on to a chip.
@@ -771,7 +1020,8 @@ class Transceiver(object):
         :param y:
             The y-coordinate of the chip onto which to load the routes
         :param routes:
-            An iterable of multicast routes to load
+            An iterable of multicast routes to load, or an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
         :param app_id: The ID of the application with which to associate
             the routes.  If not specified, defaults to 0.
         :raise SpinnmanIOException:
@@ -786,6 +1036,78 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def load_multicast_routes_multi(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> None:
+        """
+        Load sets of multicast routes on to several chips at once.
+
+        Each step of loading is done for all the chips together, so this
+        is much faster than calling :py:meth:`load_multicast_routes` for
+        each chip in turn.
+
+        :param routes:
+            The multicast routes to load for each (x, y) chip, each as an
+            iterable of routes or an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :param app_id: The ID of the application with which to associate
+            the routes.
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If any of the routes are invalid
+            * If a packet is received that has invalid parameters
+            * If any chip does not have space for its routes
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
+    @abstractmethod
+    def update_multicast_routes(
+            self, routes: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: int) -> List[XY]:
+        """
+        Make the multicast routes of an application on several chips the
+        given ones, only loading the chips where they have changed.
+
+        The routes last loaded on each chip by this transceiver are
+        remembered, and chips where these match the given routes are not
+        touched. Other chips are cleared and reloaded, including the
+        remembered routes of any other applications. What is remembered
+        is forgotten when the machine is booted or the routing is reset.
+
+        .. warning::
+            A chip with nothing remembered, such as one whose routes were
+            loaded before this transceiver was created or by another tool,
+            is always cleared, and the routes of any other applications on
+            it are lost. A warning is logged when this happens.
+
+        :param routes:
+            The multicast routes for each (x, y) chip, each as an
+            iterable of routes or an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :param app_id: The ID of the application with which to associate
+            the routes.
+        :return: The chips that were reloaded
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If any of the routes are invalid
+            * If a packet is received that has invalid parameters
+            * If any chip does not have space for its routes
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def load_fixed_route(self, x: int, y: int, fixed_route: RoutingEntry,
                          app_id: int) -> None:
@@ -854,6 +1176,73 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def get_multicast_routes_array(
+            self, x: int, y: int, app_id: Optional[int] = None) -> NDArray:
+        """
+        Get the current multicast routes set up on a chip as an array.
+
+        :param x:
+            The x-coordinate of the chip from which to get the routes
+        :param y:
+            The y-coordinate of the chip from which to get the routes
+        :param app_id:
+            The ID of the application to filter the routes for. If
+            not specified, will return all routes
+        :return:
+            The routes as an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
+    @abstractmethod
+    def verify_multicast_routes(
+            self, expected: Mapping[
+                XY, Union[Collection[MulticastRoutingEntry], NDArray]],
+            app_id: Optional[int] = None,
+            full_read: bool = True) -> Dict[XY, Tuple[NDArray, NDArray]]:
+        """
+        Check that the multicast routes on several chips are as expected.
+
+        The tables of all the chips are read together, so this is much
+        faster than calling :py:meth:`get_multicast_routes` for each chip.
+        Entries are compared in the order they were loaded.
+
+        :param expected:
+            The multicast routes expected on each (x, y) chip, each as an
+            iterable of routes or an array with
+            :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :param app_id:
+            The ID of the application to check the routes of. If
+            not specified, all routes are checked
+        :param full_read:
+            Whether to read the whole of each table. If False, reading a
+            table stops at the first unused entry after the expected
+            number of entries have been seen, which is faster but misses
+            any entries after a gap in the table
+        :return:
+            For each chip that differs, the expected entries that were not
+            found and the entries found that were not expected, as arrays
+            with :py:data:`~spinnman.model.ROUTING_ENTRY_DTYPE`
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def clear_multicast_routes(self, xy: Optional[XY] = None) -> None:
         """
@@ -894,6 +1283,36 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def get_router_diagnostics_all(
+            self, xys: Optional[Iterable[XY]] = None
+            ) -> Tuple[NDArray, NDArray, NDArray]:
+        """
+        Get router diagnostic information from several chips at once.
+
+        :param xys:
+            The coordinates of the chips to read, or `None` for all chips
+            in the machine
+        :return:
+            The x and y coordinates of the chips, and an array with a row
+            of 32-bit register values for each chip. The row has the 16
+            counters, indexed by
+            :py:class:`~spinnman.constants.ROUTER_REGISTER_REGISTERS`,
+            then the control register
+            (:py:const:`~spinnman.constants.ROUTER_DIAGNOSTICS_CONTROL_COLUMN`)
+            and the error status
+            (:py:const:`~spinnman.constants.ROUTER_DIAGNOSTICS_ERROR_COLUMN`).
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def get_scamp_connection_selector(self) -> MostDirectConnectionSelector:
         """
@@ -992,6 +1411,42 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def update_provenance_and_exit_multi(
+            self, core_subsets: CoreSubsets) -> None:
+        """
+        Sends a command to update provenance and exit to many cores, with
+        the commands for different boards sent through their own
+        connections at the same time.
+
+        :param core_subsets: The cores to send the command to
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidParameterException:
+            If there are cores to send to but no connections to the boards
+        """
+        raise NotImplementedError("abstractmethod")
+
+    @abstractmethod
+    def configure_routers(self, configuration: RouterConfiguration) -> None:
+        """
+        Make a planned set of changes to the routers of many chips, sending
+        all the changes together rather than one chip at a time.
+
+        :param configuration:
+            The clears, diagnostic filters, fixed routes and watch dog
+            values to set
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def reset_routing(self) -> None:
         """
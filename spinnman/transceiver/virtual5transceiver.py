@@ -16,7 +16,7 @@
 from typing import Dict, Iterable, Optional, Union
 from spinn_utilities.overrides import overrides
 from spinn_machine import CoreSubsets, Machine, virtual_machine
-from spinnman.constants import N_RETRIES
+from spinnman.constants import N_RETRIES, SCP_TIMEOUT
 from spinnman.exceptions import SpinnmanIOException
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.spinnaker_boot import SystemVariableDefinition
@@ -61,10 +61,11 @@ class Virtual5Transceiver(Version5Transceiver):
             self, chip_x: int = AbstractSCPRequest.DEFAULT_DEST_X_COORD,
             chip_y: int = AbstractSCPRequest.DEFAULT_DEST_Y_COORD,
             connection_selector: Optional[ConnectionSelector] = None,
-            n_retries: int = N_RETRIES) -> VersionInfo:
+            n_retries: int = N_RETRIES,
+            timeout: float = SCP_TIMEOUT) -> VersionInfo:
         try:
             return super()._get_scamp_version(
-                chip_x, chip_y, connection_selector, n_retries)
+                chip_x, chip_y, connection_selector, n_retries, timeout)
         except SpinnmanIOException:
             version = VersionInfo(
                 b'@\x00\x07\x08\xff\x00\x00\x00\x00\x00\x80\x00\x02\x00\x00\n'
@@ -83,9 +84,11 @@ class Virtual5Transceiver(Version5Transceiver):
     def get_cpu_infos(
             self, core_subsets: Optional[CoreSubsets] = None,
             states: Union[CPUState, Iterable[CPUState], None] = None,
-            include: bool = True) -> CPUInfos:
+            include: bool = True, *, app_id: Optional[int] = None
+            ) -> CPUInfos:
         try:
-            return super().get_cpu_infos(core_subsets, states, include)
+            return super().get_cpu_infos(
+                core_subsets, states, include, app_id=app_id)
         except SpinnmanIOException:
             # return an empty
             return CPUInfos()
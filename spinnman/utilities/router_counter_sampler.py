@@ -0,0 +1,179 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from threading import Event, Lock, Thread
+import time
+from typing import Iterable, List, Optional, Tuple
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.coords import XY
+from spinnman.processes import (
+    ConnectionSelector, ReadRouterDiagnosticsProcess)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_N_COUNTERS = 16
+#: A counter that falls from at least this value to below
+#: :py:data:`_WRAP_TO` is taken to have wrapped rather than been cleared
+_WRAP_FROM = 3 << 30
+_WRAP_TO = 1 << 30
+
+
+class RouterCounterSampler(Thread):
+    """
+    Thread that reads the router diagnostic counters of some chips at
+    regular intervals, keeping the most recent changes in a ring buffer.
+
+    Each sample reads one packet of counters per chip, all pipelined, so the
+    load on the machine is bounded by the number of chips and the interval.
+
+    A counter that falls is taken to have wrapped only if it falls from
+    near the top of its range to near the bottom; otherwise the counters of
+    that chip are taken to have been cleared (as by
+    :py:meth:`~spinnman.transceiver.Transceiver.clear_router_diagnostic_counters`)
+    during the period, and their changes are taken to be their new values.
+    """
+
+    def __init__(self, connection_selector: ConnectionSelector,
+                 xys: Iterable[XY], interval: float = 1.0,
+                 n_samples: int = 60):
+        """
+        :param connection_selector:
+            How to talk to the chips, usually that of the transceiver
+        :param xys: The coordinates of the chips to sample
+        :param interval: The time between samples in seconds
+        :param n_samples: The number of changes to keep for each chip
+        """
+        super().__init__(name="Router counter sampler")
+        self.daemon = True
+        self.__connection_selector = connection_selector
+        self.__xys: List[XY] = list(xys)
+        self.__interval = interval
+        self.__n_samples = n_samples
+        self.__done = Event()
+        self.__lock = Lock()
+
+        # The change in each counter of each chip over each sample period
+        self.__deltas = numpy.zeros(
+            (n_samples, len(self.__xys), _N_COUNTERS), dtype=numpy.uint32)
+        # The length of each sample period in seconds
+        self.__periods = numpy.zeros(n_samples, dtype=numpy.float64)
+        # The number of samples taken, of which the last n_samples are kept
+        self.__next = 0
+        self.__last_counters: Optional[NDArray] = None
+        self.__last_time = 0.0
+
+    @property
+    def xys(self) -> List[XY]:
+        """
+        The coordinates of the chips sampled, in the order of the rows of
+        the results.
+        """
+        return list(self.__xys)
+
+    def sample(self) -> None:
+        """
+        Take one sample now.
+        """
+        process = ReadRouterDiagnosticsProcess(self.__connection_selector)
+        counters = process.get_router_counters_all(self.__xys)
+        now = time.monotonic()
+        with self.__lock:
+            if self.__last_counters is not None:
+                index = self.__next % self.__n_samples
+                self.__deltas[index] = self.__changes(
+                    self.__last_counters, counters)
+                self.__periods[index] = now - self.__last_time
+                self.__next += 1
+            self.__last_counters = counters
+            self.__last_time = now
+
+    @staticmethod
+    def __changes(last: NDArray, counters: NDArray) -> NDArray:
+        # Counters wrap, which unsigned subtraction handles
+        changes = counters - last
+        # Any other fall means the counters of the chip were cleared, so
+        # only what has been counted since is known
+        cleared = ((counters < last) &
+                   ~((last >= _WRAP_FROM) & (counters < _WRAP_TO))).any(
+                       axis=1)
+        changes[cleared] = counters[cleared]
+        return changes
+
+    def run(self) -> None:
+        """
+        Implements the sampling thread.
+        """
+        while not self.__done.is_set():
+            try:
+                self.sample()
+            except Exception:  # pylint: disable=broad-except
+                if not self.__done.is_set():
+                    logger.warning("problem when sampling router counters",
+                                   exc_info=True)
+            self.__done.wait(self.__interval)
+
+    def deltas(self) -> Tuple[NDArray, NDArray]:
+        """
+        The changes kept so far, oldest first.
+
+        :returns:
+            The change in each counter, as an array of samples by chips by
+            counters indexed by
+            :py:class:`~spinnman.constants.ROUTER_REGISTER_REGISTERS`,
+            and the length in seconds of each sample period
+        """
+        with self.__lock:
+            n = min(self.__next, self.__n_samples)
+            order = (numpy.arange(self.__next - n, self.__next) %
+                     self.__n_samples)
+            return self.__deltas[order], self.__periods[order]
+
+    def rates(self) -> NDArray:
+        """
+        The mean rate of change of each counter over the changes kept.
+
+        :returns:
+            The counts per second as an array of chips by counters;
+            zero if no changes are kept yet
+        """
+        deltas, periods = self.deltas()
+        total = periods.sum()
+        if total <= 0:
+            return numpy.zeros((len(self.__xys), _N_COUNTERS))
+        return deltas.sum(axis=0, dtype=numpy.float64) / total
+
+    def peaks(self) -> NDArray:
+        """
+        The highest rate of change of each counter in any sample period
+        kept.
+
+        :returns:
+            The counts per second as an array of chips by counters;
+            zero if no changes are kept yet
+        """
+        deltas, periods = self.deltas()
+        if not len(periods):
+            return numpy.zeros((len(self.__xys), _N_COUNTERS))
+        return (deltas / periods[:, None, None]).max(axis=0)
+
+    def close(self) -> None:
+        """
+        Stops the sampling, waiting for any sample in progress to finish.
+        """
+        self.__done.set()
+        if self.is_alive():
+            self.join()
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import socket
+from typing import Optional
+import numpy
 from spinnman.model import BMPConnectionData
 from spinnman.messages.scp.impl import IPTagSet
 from spinnman.messages.sdp import SDPMessage, SDPHeader, SDPFlag
@@ -56,6 +58,25 @@ def get_vcpu_address(p: int) -> int:
     return CPU_INFO_OFFSET + (CPU_INFO_BYTES * p)
 
 
+def get_data_checksum(
+        data: bytes, offset: int = 0, n_bytes: Optional[int] = None) -> int:
+    """
+    Get the checksum that SCAMP uses to check copies of data, which is the
+    sum of the 32-bit words of the data.
+
+    :param data: The data to get the checksum of
+    :param offset: Where in the data to start
+    :param n_bytes: How much of the data to use; by default the rest of it
+    :returns: The checksum, as an unsigned 32-bit value
+    """
+    if n_bytes is None:
+        n_bytes = len(data) - offset
+    words = numpy.frombuffer(
+        data, dtype=numpy.uint8, count=n_bytes, offset=offset).view(
+            numpy.uint32)
+    return int(numpy.sum(words, dtype=numpy.uint32))
+
+
 def send_port_trigger_message(
         connection: UDPConnection, board_address: str) -> None:
     """
@@ -0,0 +1,90 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+import numpy
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+from spinnman.config_setup import unittest_setup
+from spinnman.model import (
+    ROUTING_ENTRY_DTYPE, array_to_routes, decode_routing_table,
+    encode_routing_table, routes_to_array, routing_table_differences)
+
+
+class TestRoutingTableArray(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_routes_round_trip(self) -> None:
+        routes = [
+            MulticastRoutingEntry(0x100, 0xFF00, RoutingEntry(
+                processor_ids=[1, 17], link_ids=[0, 5])),
+            MulticastRoutingEntry(0x200, 0xFFFF, RoutingEntry(
+                processor_ids=[], link_ids=[3]))]
+        table = routes_to_array(routes, app_id=7)
+        self.assertEqual(ROUTING_ENTRY_DTYPE, table.dtype)
+        self.assertEqual([0x100, 0x200], table["key"].tolist())
+        self.assertEqual([7, 7], table["app_id"].tolist())
+        self.assertEqual(
+            [route.spinnaker_route for route in routes],
+            table["route"].tolist())
+
+        back = array_to_routes(table)
+        self.assertEqual([(r.key, r.mask, r.spinnaker_route) for r in routes],
+                         [(r.key, r.mask, r.spinnaker_route) for r in back])
+
+    def test_encode(self) -> None:
+        table = numpy.zeros(2, dtype=ROUTING_ENTRY_DTYPE)
+        table["key"] = [1, 2]
+        table["mask"] = [3, 4]
+        table["route"] = [5, 6]
+        data = encode_routing_table(table)
+        # Matches the layout written entry by entry
+        self.assertEqual(
+            struct.pack("<H2xIII", 0, 5, 1, 3) +
+            struct.pack("<H2xIII", 1, 6, 2, 4) + b"\xFF" * 16, data)
+
+    def test_decode(self) -> None:
+        data = (
+            struct.pack("<HBxIII", 0, 1, 5, 1, 3) +
+            struct.pack("<HBxIII", 0, 0, 0xFF000000, 0, 0) +
+            struct.pack("<HBxIII", 0, 2, 6, 2, 4))
+        table = decode_routing_table(data)
+        self.assertEqual([1, 2], table["key"].tolist())
+        self.assertEqual([3, 4], table["mask"].tolist())
+        self.assertEqual([5, 6], table["route"].tolist())
+        self.assertEqual([1, 2], table["app_id"].tolist())
+
+        table = decode_routing_table(data, app_id=2)
+        self.assertEqual([2], table["key"].tolist())
+
+    def test_differences(self) -> None:
+        expected = numpy.zeros(4, dtype=ROUTING_ENTRY_DTYPE)
+        expected["key"] = [1, 2, 3, 4]
+        expected["route"] = 5
+        actual = expected[:3].copy()
+        actual["app_id"] = 9
+        missing, extra = routing_table_differences(expected, expected)
+        self.assertEqual((0, 0), (len(missing), len(extra)))
+
+        actual["route"][1] = 6
+        missing, extra = routing_table_differences(expected, actual)
+        self.assertEqual([2, 4], missing["key"].tolist())
+        self.assertEqual([2], extra["key"].tolist())
+        self.assertEqual([6], extra["route"].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import struct
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+from spinn_utilities.overrides import overrides
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.exceptions import SpinnmanTimeoutException
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+
+_SDP_HEADER = struct.Struct("<2x8B")
+_SCP_HEADER = struct.Struct("<2H")
+_THREE_WORDS = struct.Struct("<3I")
+_RESPONSE_HEADER = struct.Struct("<2x8B2H")
+
+#: A handler for a command; given x, y, cpu and the argument bytes,
+#: returns the result and the response data
+Handler = Callable[[int, int, int, bytes], Tuple[SCPResult, bytes]]
+
+
+class MockMemoryConnection(SCAMPConnection):
+    """
+    A connection that answers SCP requests from memory held in the host
+    rather than from a board.
+
+    Reads and writes of memory are handled directly; other commands are
+    passed to any handler registered for them.  Requests to unreachable
+    chips are refused.
+    """
+
+    def __init__(self, chip_x: int = 0, chip_y: int = 0):
+        super().__init__(chip_x, chip_y)
+        self.memory: Dict[Tuple[int, int], Dict[int, int]] = dict()
+        self.handlers: Dict[SCPCommand, Handler] = dict()
+        self.requests: List[Tuple[SCPCommand, int, int, int]] = list()
+        self.unreachable: Set[Tuple[int, int]] = set()
+        self.__responses: Deque[bytes] = deque()
+
+    def set_memory(self, x: int, y: int, address: int, data: bytes) -> None:
+        """
+        Put some data in the memory of a chip.
+        """
+        chip_memory = self.memory.setdefault((x, y), dict())
+        for i, byte in enumerate(data):
+            chip_memory[address + i] = byte
+
+    def get_memory(self, x: int, y: int, address: int, size: int) -> bytes:
+        """
+        Get some data from the memory of a chip; unset bytes are 0.
+        """
+        chip_memory = self.memory.get((x, y), dict())
+        return bytes(chip_memory.get(address + i, 0) for i in range(size))
+
+    def n_requests(self, command: SCPCommand) -> int:
+        """
+        The number of requests received with the given command.
+        """
+        return sum(1 for request in self.requests if request[0] == command)
+
+    def __handle(self, command: SCPCommand, x: int, y: int, cpu: int,
+                 args: bytes) -> Tuple[SCPResult, bytes]:
+        if (x, y) in self.unreachable:
+            return SCPResult.RC_ROUTE, b""
+        if command == SCPCommand.CMD_READ:
+            address, size, _ = _THREE_WORDS.unpack_from(args)
+            return SCPResult.RC_OK, self.get_memory(x, y, address, size)
+        if command == SCPCommand.CMD_WRITE:
+            address, size, _ = _THREE_WORDS.unpack_from(args)
+            self.set_memory(
+                x, y, address, args[_THREE_WORDS.size:][:size])
+            return SCPResult.RC_OK, b""
+        return self.handlers[command](x, y, cpu, args)
+
+    @overrides(SCAMPConnection.send)
+    def send(self, data: bytes) -> None:
+        (flags, tag, dest_port_cpu, src_port_cpu, dest_y, dest_x,
+         src_y, src_x) = _SDP_HEADER.unpack_from(data)
+        command_value, sequence = _SCP_HEADER.unpack_from(
+            data, _SDP_HEADER.size)
+        command = SCPCommand(command_value)
+        cpu = dest_port_cpu & 0x1F
+        self.requests.append((command, dest_x, dest_y, cpu))
+        result, response_data = self.__handle(
+            command, dest_x, dest_y, cpu,
+            data[_SDP_HEADER.size + _SCP_HEADER.size:])
+        self.__responses.append(_RESPONSE_HEADER.pack(
+            flags, tag, src_port_cpu, dest_port_cpu, src_y, src_x,
+            dest_y, dest_x, result.value, sequence) + response_data)
+
+    @overrides(SCAMPConnection.receive_scp_response)
+    def receive_scp_response(self, timeout: Optional[float] = 1.0) -> Tuple[
+            SCPResult, int, bytes, int]:
+        if not self.__responses:
+            raise SpinnmanTimeoutException("receive", timeout)
+        data = self.__responses.popleft()
+        result, sequence = _SCP_HEADER.unpack_from(data, 10)
+        return SCPResult(result), sequence, data, 2
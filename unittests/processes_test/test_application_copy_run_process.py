@@ -0,0 +1,161 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.typing.coords import XY
+from spinn_machine import CoreSubset, CoreSubsets, Machine, virtual_machine
+from spinnman.config_setup import unittest_setup
+from spinnman.data.spinnman_data_writer import SpiNNManDataWriter
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import (
+    ApplicationCopyRunProcess, RoundRobinConnectionSelector)
+from spinnman.processes.application_copy_run_process import (
+    plan_copy_rounds)
+from spinnman.utilities.utility_functions import get_data_checksum
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class TestApplicationCopyRunProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+
+    def _check_plan(self, machine: Machine, fan_out: int,
+                    off_board_fan_out: int,
+                    seeds: Optional[List[XY]] = None) -> int:
+        rounds = plan_copy_rounds(
+            machine, fan_out, off_board_fan_out, seeds)
+        done = set(seeds or [(machine.boot_chip.x, machine.boot_chip.y)])
+        for copy_round in rounds:
+            sources: List[XY] = list()
+            off_board: Counter = Counter()
+            for chip, link_id in copy_round:
+                link = chip.router.get_link(link_id)
+                assert link is not None
+                source = machine[link.destination_x, link.destination_y]
+                # Only copy from a chip done in an earlier round
+                self.assertIn((source.x, source.y), done)
+                sources.append((source.x, source.y))
+                if (source.nearest_ethernet_x, source.nearest_ethernet_y) != (
+                        chip.nearest_ethernet_x, chip.nearest_ethernet_y):
+                    off_board[
+                        source.nearest_ethernet_x,
+                        source.nearest_ethernet_y] += 1
+            self.assertLessEqual(max(Counter(sources).values()), fan_out)
+            if off_board:
+                self.assertLessEqual(
+                    max(off_board.values()), off_board_fan_out)
+            done.update((chip.x, chip.y) for chip, _ in copy_round)
+        self.assertEqual(
+            {(chip.x, chip.y) for chip in machine.chips}, done)
+        return len(rounds)
+
+    def test_plan_one_board(self) -> None:
+        machine = virtual_machine(8, 8)
+        # Each chip that has the binary can give it to one more each round
+        self.assertLessEqual(self._check_plan(machine, 1, 1), 9)
+        # Without limits, the furthest chip is 7 links away
+        self.assertEqual(7, self._check_plan(machine, 6, 6))
+
+    def test_plan_many_boards(self) -> None:
+        machine = virtual_machine(48, 48)
+        self.assertLessEqual(self._check_plan(machine, 1, 1), 40)
+        self.assertLessEqual(self._check_plan(machine, 2, 1), 33)
+
+    def test_plan_seeded(self) -> None:
+        machine = virtual_machine(48, 48)
+        seeds = [(chip.x, chip.y) for chip in machine.ethernet_connected_chips]
+        # Each board is done from its own Ethernet chip
+        self.assertLessEqual(self._check_plan(machine, 1, 1, seeds), 9)
+        self.assertLessEqual(self._check_plan(machine, 2, 1, seeds), 8)
+
+    def test_run(self) -> None:
+        machine = virtual_machine(8, 8)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connection = MockMemoryConnection()
+        copies: Dict[Tuple[int, int], List[int]] = dict()
+
+        def copy_run(x: int, y: int, p: int,
+                     args: bytes) -> Tuple[SCPResult, bytes]:
+            arg1, size, mask = struct.unpack_from("<3I", args)
+            copies.setdefault((x, y), list()).append(arg1 & 0x7)
+            self.assertEqual(1024, size)
+            self.assertEqual(30, mask >> 24)
+            return SCPResult.RC_OK, b""
+
+        connection.handlers[SCPCommand.CMD_APP_COPY_RUN] = copy_run
+        process = ApplicationCopyRunProcess(
+            RoundRobinConnectionSelector([connection]), fan_out=2)
+        process.run(1024, 30, CoreSubsets([CoreSubset(1, 1, [1, 2])]),
+                    0, False)
+
+        # Every chip but the boot chip is copied to once
+        self.assertEqual(machine.n_chips - 1, len(copies))
+        for (x, y), links in copies.items():
+            self.assertEqual(1, len(links))
+            self.assertIsNotNone(machine[x, y].router.get_link(links[0]))
+        connection.close()
+
+    def test_run_pipelined(self) -> None:
+        machine = virtual_machine(8, 8)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connection = MockMemoryConnection()
+        binaries = [bytes([i]) * (1024 + 256 * i) for i in range(1, 4)]
+        received: Dict[XY, List[int]] = dict()
+
+        def copy_run(x: int, y: int, p: int,
+                     args: bytes) -> Tuple[SCPResult, bytes]:
+            arg1, size, _ = struct.unpack_from("<3I", args)
+            link = machine[x, y].router.get_link(arg1 & 0x7)
+            assert link is not None
+            # The chip copied from must still have the binary being copied
+            data = connection.get_memory(
+                link.destination_x, link.destination_y, 0x67800000, size)
+            self.assertEqual(
+                get_data_checksum(data) & 0x1FFFFFFF, arg1 >> 3)
+            connection.set_memory(x, y, 0x67800000, data)
+            received.setdefault((x, y), list()).append(data[0])
+            return SCPResult.RC_OK, b""
+
+        def run(x: int, y: int, p: int,
+                args: bytes) -> Tuple[SCPResult, bytes]:
+            data = connection.get_memory(x, y, 0x67800000, 1)
+            received.setdefault((x, y), list()).append(data[0])
+            return SCPResult.RC_OK, b""
+
+        connection.handlers[SCPCommand.CMD_APP_COPY_RUN] = copy_run
+        connection.handlers[SCPCommand.CMD_AR] = run
+        process = ApplicationCopyRunProcess(
+            RoundRobinConnectionSelector([connection]), fan_out=2)
+        checksums = process.run_pipelined(
+            [(data, CoreSubsets([CoreSubset(0, 0, [1])]), [(0, 0)])
+             for data in binaries], 30, False)
+
+        self.assertEqual(
+            [get_data_checksum(data) for data in binaries], checksums)
+        # Every chip gets each binary in turn
+        self.assertEqual(machine.n_chips, len(received))
+        for xy, got in received.items():
+            self.assertEqual([1, 2, 3], got, xy)
+        connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
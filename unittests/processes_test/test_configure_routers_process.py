@@ -0,0 +1,89 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import List, Tuple
+from spinn_machine import RoutingEntry
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import (
+    ROUTER_REGISTER_BASE_ADDRESS, ROUTER_FILTER_CONTROLS_OFFSET,
+    SYSTEM_VARIABLE_BASE_ADDRESS)
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.model import DiagnosticFilter, RouterConfiguration
+from spinnman.processes import (
+    ConfigureRoutersProcess, RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class TestConfigureRoutersProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.router_commands: List[Tuple[int, int, int]] = list()
+        self.connection.handlers[SCPCommand.CMD_RTR] = self._router
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _router(self, x: int, y: int, cpu: int,
+                args: bytes) -> Tuple[SCPResult, bytes]:
+        arg1, = struct.unpack_from("<I", args)
+        self.router_commands.append((x, y, arg1 & 0xFF))
+        return SCPResult.RC_OK, b""
+
+    def test_configure(self) -> None:
+        configuration = RouterConfiguration()
+        diagnostic_filter = DiagnosticFilter(
+            False, False, [], [], [], [], [], [])
+        for x in range(3):
+            configuration.add_filter(x, 0, 14, diagnostic_filter)
+            configuration.add_watch_dog(x, 0, 7)
+        configuration.add_fixed_route(
+            1, 0, RoutingEntry(processor_ids=[], link_ids=[2]))
+        configuration.add_clear(2, 0)
+        self.assertEqual(8, len(configuration))
+
+        process = ConfigureRoutersProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        process.configure(configuration)
+
+        # The clear is done first
+        self.assertEqual(
+            [SCPCommand.CMD_RTR] + [SCPCommand.CMD_WRITE] * 3,
+            [request[0] for request in self.connection.requests[:4]])
+        self.assertEqual(2, len(self.router_commands))
+        for x in range(3):
+            self.assertEqual(
+                struct.pack("<I", diagnostic_filter.filter_word),
+                self.connection.get_memory(
+                    x, 0, ROUTER_REGISTER_BASE_ADDRESS +
+                    ROUTER_FILTER_CONTROLS_OFFSET + 14 * 4, 4))
+            self.assertEqual(b"\x07", self.connection.get_memory(
+                x, 0, SYSTEM_VARIABLE_BASE_ADDRESS +
+                SystemVariableDefinition.software_watchdog_count.offset, 1))
+
+    def test_bad_filter_position(self) -> None:
+        configuration = RouterConfiguration()
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            configuration.add_filter(0, 0, 16, DiagnosticFilter(
+                False, False, [], [], [], [], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
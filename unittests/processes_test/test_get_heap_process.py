@@ -0,0 +1,92 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import List, Tuple
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.messages.scp.enums import SCPCommand
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.processes import GetHeapProcess, RoundRobinConnectionSelector
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_HEAP = 0x60000000
+_USED = 0xFFFF0000
+
+
+class TestGetHeapProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _heap(self, x: int, y: int, sizes: List[Tuple[int, int]]) -> None:
+        """
+        Lay out a heap of blocks of the given (size, free) on a chip.
+        """
+        pointer = SystemVariableDefinition.sdram_heap_address
+        self.connection.set_memory(
+            x, y, SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
+            struct.pack("<I", _HEAP))
+        first = _HEAP + 20
+        address = first
+        for size, free in sizes:
+            next_address = address + 8 + size
+            self.connection.set_memory(
+                x, y, address, struct.pack("<II", next_address, free))
+            address = next_address
+        self.connection.set_memory(x, y, address, struct.pack("<II", 0, 0))
+        self.connection.set_memory(
+            x, y, _HEAP, struct.pack("<IIII", first, first, address, 0))
+
+    def test_get_heaps(self) -> None:
+        self._heap(0, 0, [(16, _USED | 0x1203), (1000, 0), (8, 0)])
+        self._heap(1, 0, [(4000, 0)])
+        self._heap(0, 1, [])
+        process = GetHeapProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        heaps = process.get_heaps([(0, 0), (1, 0), (0, 1)])
+
+        blocks = heaps[0, 0]
+        self.assertEqual([16, 1000, 8], [block.size for block in blocks])
+        self.assertFalse(blocks[0].is_free)
+        self.assertEqual(0x12, blocks[0].app_id)
+        self.assertEqual(3, blocks[0].tag)
+        self.assertTrue(blocks[1].is_free)
+        self.assertEqual([4000], [block.size for block in heaps[1, 0]])
+        self.assertEqual([], heaps[0, 1])
+
+        # Heap address and heap pointers for each chip, then two reads
+        # for (0, 0) as the first two headers are read together, as are
+        # the last two, two for (1, 0) and one for the empty heap
+        self.assertEqual(3 + 3 + 2 + 2 + 1,
+                         self.connection.n_requests(SCPCommand.CMD_READ))
+
+    def test_get_heap(self) -> None:
+        self._heap(2, 2, [(8, 0), (8, _USED)])
+        process = GetHeapProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        blocks = process.get_heap((2, 2))
+        self.assertEqual([8, 8], [block.size for block in blocks])
+        self.assertEqual(
+            [True, False], [block.is_free for block in blocks])
+
+
+if __name__ == '__main__':
+    unittest.main()
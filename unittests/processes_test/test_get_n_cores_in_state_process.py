@@ -0,0 +1,80 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import Dict, Tuple
+from spinn_utilities.typing.coords import XY
+from spinnman.config_setup import unittest_setup
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.model.enums import CPUState
+from spinnman.processes import (
+    GetNCoresInStateProcess, RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class TestGetNCoresInStateProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.connection.handlers[SCPCommand.CMD_COUNT] = self._count
+        # The cores of app 30 in each state on each chip
+        self.counts: Dict[XY, Dict[CPUState, int]] = {
+            (0, 0): {CPUState.RUNNING: 3, CPUState.READY: 1},
+            (4, 8): {CPUState.RUNNING: 2},
+            (8, 4): {CPUState.RUN_TIME_EXCEPTION: 1}}
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _count(self, x: int, y: int, cpu: int,
+               args: bytes) -> Tuple[SCPResult, bytes]:
+        app_id, state = struct.unpack_from("<II", args)
+        count = 0
+        if app_id == 30:
+            count = self.counts.get((x, y), {}).get(CPUState(state), 0)
+        return SCPResult.RC_OK, struct.pack("<I", count)
+
+    def _process(self) -> GetNCoresInStateProcess:
+        return GetNCoresInStateProcess(
+            RoundRobinConnectionSelector([self.connection]))
+
+    def test_get_n_cores_in_states_by_chip(self) -> None:
+        counts = self._process().get_n_cores_in_states_by_chip(
+            [(0, 0), (4, 8), (8, 4)], 30,
+            [CPUState.RUNNING, CPUState.READY])
+        self.assertEqual({(0, 0): 4, (4, 8): 2, (8, 4): 0}, counts)
+        # One request per chip and state
+        self.assertEqual(6, self.connection.n_requests(SCPCommand.CMD_COUNT))
+
+    def test_get_n_cores_in_states(self) -> None:
+        counts = self._process().get_n_cores_in_states(
+            [(0, 0), (4, 8), (8, 4)], 30,
+            [CPUState.RUNNING, CPUState.RUN_TIME_EXCEPTION,
+             CPUState.WATCHDOG])
+        self.assertEqual({
+            CPUState.RUNNING: 5, CPUState.RUN_TIME_EXCEPTION: 1,
+            CPUState.WATCHDOG: 0}, counts)
+        self.assertEqual(9, self.connection.n_requests(SCPCommand.CMD_COUNT))
+
+    def test_other_app(self) -> None:
+        counts = self._process().get_n_cores_in_states(
+            [(0, 0)], 31, [CPUState.RUNNING])
+        self.assertEqual({CPUState.RUNNING: 0}, counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
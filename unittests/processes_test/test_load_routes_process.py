@@ -0,0 +1,196 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import Dict, List, Tuple
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.model import routes_to_array
+from spinnman.processes import (
+    GetMultiCastRoutesProcess, LoadMultiCastRoutesProcess,
+    RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_TABLE_ADDRESS = 0x67800000
+
+
+class TestLoadRoutesProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.connection.handlers[SCPCommand.CMD_ALLOC] = self._alloc
+        self.connection.handlers[SCPCommand.CMD_RTR] = self._init
+        self.inits: Dict[Tuple[int, int], Tuple[int, int, int]] = dict()
+        self.n_free = 1024
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _alloc(self, x: int, y: int, cpu: int,
+               args: bytes) -> Tuple[SCPResult, bytes]:
+        _, n_entries = struct.unpack_from("<II", args)
+        if n_entries > self.n_free:
+            return SCPResult.RC_OK, struct.pack("<I", 0)
+        return SCPResult.RC_OK, struct.pack("<I", 1 + x * 100 + y)
+
+    def _init(self, x: int, y: int, cpu: int,
+              args: bytes) -> Tuple[SCPResult, bytes]:
+        n_app, table_address, base_address = struct.unpack_from("<III", args)
+        self.inits[x, y] = (n_app >> 16, table_address, base_address)
+        return SCPResult.RC_OK, b""
+
+    def _routes(self, n: int) -> List[MulticastRoutingEntry]:
+        return [
+            MulticastRoutingEntry(i << 8, 0xFFFFFF00, RoutingEntry(
+                processor_ids=[i % 16 + 1], link_ids=[]))
+            for i in range(n)]
+
+    def test_load_routes_multi(self) -> None:
+        routes = {(0, 0): self._routes(3), (1, 0): self._routes(40)}
+        process = LoadMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        process.load_routes_multi(routes, 30)
+
+        self.assertEqual({
+            (0, 0): (3, _TABLE_ADDRESS, 1),
+            (1, 0): (40, _TABLE_ADDRESS, 101)}, self.inits)
+
+        # The table and end marker are written for each chip
+        table = self.connection.get_memory(1, 0, _TABLE_ADDRESS, 41 * 16)
+        self.assertEqual(
+            (39, 39 << 8, 0xFFFFFF00),
+            struct.unpack_from("<H6xII", table, 39 * 16))
+        self.assertEqual(b"\xFF" * 16, table[40 * 16:])
+
+        # Each step is done for all chips before the next is started
+        commands = [request[0] for request in self.connection.requests]
+        self.assertEqual(
+            [SCPCommand.CMD_WRITE] * 4 + [SCPCommand.CMD_ALLOC] * 2 +
+            [SCPCommand.CMD_RTR] * 2, commands)
+
+    def test_load_and_get_array(self) -> None:
+        # Unused entries in the table are marked by the route
+        self.connection.set_memory(0, 0, _TABLE_ADDRESS, b"\xFF" * 16384)
+        table = routes_to_array(self._routes(20))
+        process = LoadMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        process.load_routes(0, 0, table, 30)
+        self.assertEqual((20, _TABLE_ADDRESS, 1), self.inits[0, 0])
+
+        # Read back the loaded table from where it was written
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        read = get_process.get_routes_array(0, 0, _TABLE_ADDRESS)
+        for field in ("key", "mask", "route"):
+            self.assertEqual(table[field].tolist(), read[field].tolist())
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        routes = get_process.get_routes(0, 0, _TABLE_ADDRESS)
+        self.assertEqual(table["key"].tolist(), [r.key for r in routes])
+
+    def test_get_routes_arrays(self) -> None:
+        pointer = SystemVariableDefinition.router_table_copy_address
+        for xy in [(0, 0), (1, 0)]:
+            self.connection.set_memory(
+                *xy, _TABLE_ADDRESS, b"\xFF" * 16384)
+            self.connection.set_memory(
+                *xy, SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
+                struct.pack("<I", _TABLE_ADDRESS))
+        process = LoadMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        process.load_routes_multi(
+            {(0, 0): self._routes(3), (1, 0): self._routes(40)}, 30)
+        # A gap then a stray entry on (1, 0) in the last block read
+        self.connection.set_memory(
+            1, 0, _TABLE_ADDRESS + 45 * 16,
+            struct.pack("<HBxIII", 0, 30, 1, 2, 3))
+
+        n_reads = self.connection.n_requests(SCPCommand.CMD_READ)
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        tables = get_process.get_routes_arrays(
+            {(0, 0): 3, (1, 0): 40}, full_read=False)
+        self.assertEqual(3, len(tables[0, 0]))
+        # The stray entry is within the reads up to the end of the table
+        self.assertEqual(41, len(tables[1, 0]))
+
+        # Table addresses, then one read for (0, 0) and three for (1, 0)
+        self.assertEqual(
+            2 + 1 + 3,
+            self.connection.n_requests(SCPCommand.CMD_READ) - n_reads)
+
+    def test_get_routes_arrays_of_app(self) -> None:
+        pointer = SystemVariableDefinition.router_table_copy_address
+        table = bytearray(b"\xFF" * 16384)
+        # Entries of another application fill the first read
+        for index in range(15):
+            struct.pack_into("<HBxIII", table, index * 16, 0, 31, 1, index, 3)
+        for index in range(16, 26):
+            struct.pack_into("<HBxIII", table, index * 16, 0, 30, 1, index, 3)
+        self.connection.set_memory(0, 0, _TABLE_ADDRESS, bytes(table))
+        self.connection.set_memory(
+            0, 0, SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
+            struct.pack("<I", _TABLE_ADDRESS))
+
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]), 30)
+        tables = get_process.get_routes_arrays({(0, 0): 10}, full_read=False)
+        self.assertEqual(list(range(16, 26)), tables[0, 0]["key"].tolist())
+
+    def test_get_routes_arrays_after_gap(self) -> None:
+        pointer = SystemVariableDefinition.router_table_copy_address
+        table = bytearray(b"\xFF" * 16384)
+        for index in range(3):
+            struct.pack_into("<HBxIII", table, index * 16, 0, 30, 1, index, 3)
+        # A stray entry well after the end of the entries loaded
+        struct.pack_into("<HBxIII", table, 500 * 16, 0, 30, 1, 500, 3)
+        self.connection.set_memory(0, 0, _TABLE_ADDRESS, bytes(table))
+        self.connection.set_memory(
+            0, 0, SYSTEM_VARIABLE_BASE_ADDRESS + pointer.offset,
+            struct.pack("<I", _TABLE_ADDRESS))
+
+        # The whole table is read by default, so the stray entry is found
+        n_reads = self.connection.n_requests(SCPCommand.CMD_READ)
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        tables = get_process.get_routes_arrays({(0, 0): 3})
+        self.assertEqual([0, 1, 2, 500], tables[0, 0]["key"].tolist())
+        self.assertEqual(
+            1 + 64, self.connection.n_requests(SCPCommand.CMD_READ) - n_reads)
+
+        # Stopping at the end of the entries loaded misses it
+        get_process = GetMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        tables = get_process.get_routes_arrays({(0, 0): 3}, full_read=False)
+        self.assertEqual([0, 1, 2], tables[0, 0]["key"].tolist())
+
+    def test_no_space(self) -> None:
+        self.n_free = 10
+        routes = {(0, 0): self._routes(3), (1, 0): self._routes(40)}
+        process = LoadMultiCastRoutesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.load_routes_multi(routes, 30)
+        self.assertEqual(0, self.connection.n_requests(SCPCommand.CMD_RTR))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+import tempfile
+import unittest
+from spinn_machine import CoreSubsets
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import CPU_IOBUF_ADDRESS_OFFSET
+from spinnman.processes import ReadIOBufProcess, RoundRobinConnectionSelector
+from spinnman.utilities.utility_functions import get_vcpu_address
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_HEADER = struct.Struct("<I8xI")
+
+
+class TestReadIOBufProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.core_subsets = CoreSubsets()
+        # Core 1 has two blocks, the first larger than one read
+        self._iobuf_address(1, 0x60000000)
+        self._block(0x60000000, 0x60001000, b"a" * 600)
+        self._block(0x60001000, 0, b"b" * 10)
+        # Core 2 has one block
+        self._iobuf_address(2, 0x60002000)
+        self._block(0x60002000, 0, b"core two")
+        # Core 3 has no IOBUF
+        self._iobuf_address(3, 0)
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _iobuf_address(self, p: int, address: int) -> None:
+        self.core_subsets.add_processor(0, 0, p)
+        self.connection.set_memory(
+            0, 0, get_vcpu_address(p) + CPU_IOBUF_ADDRESS_OFFSET,
+            struct.pack("<I", address))
+
+    def _block(self, address: int, next_address: int, text: bytes) -> None:
+        self.connection.set_memory(
+            0, 0, address, _HEADER.pack(next_address, len(text)) + text)
+
+    def _process(self) -> ReadIOBufProcess:
+        return ReadIOBufProcess(
+            RoundRobinConnectionSelector([self.connection]))
+
+    def test_read_iobuf(self) -> None:
+        iobufs = {
+            (iobuf.x, iobuf.y, iobuf.p): iobuf.iobuf
+            for iobuf in self._process().read_iobuf(1000, self.core_subsets)}
+        self.assertEqual({
+            (0, 0, 1): "a" * 600 + "b" * 10,
+            (0, 0, 2): "core two",
+            (0, 0, 3): ""}, iobufs)
+
+    def test_streams_completed_cores(self) -> None:
+        # The single block cores complete before the two block one
+        iobufs = self._process().read_iobuf(1000, self.core_subsets)
+        self.assertEqual(
+            {(0, 0, 2), (0, 0, 3)},
+            {(iobuf.x, iobuf.y, iobuf.p) for _, iobuf in zip(
+                range(2), iobufs)})
+
+    def test_write_iobuf(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            filenames = self._process().write_iobuf(
+                1000, self.core_subsets,
+                lambda x, y, p: os.path.join(folder, f"{x}_{y}_{p}.txt"))
+            self.assertEqual(3, len(filenames))
+            with open(os.path.join(folder, "0_0_1.txt"), "rb") as f:
+                self.assertEqual(b"a" * 600 + b"b" * 10, f.read())
+            with open(os.path.join(folder, "0_0_2.txt"), "rb") as f:
+                self.assertEqual(b"core two", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
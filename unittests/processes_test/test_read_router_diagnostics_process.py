@@ -0,0 +1,75 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import (
+    ROUTER_DIAGNOSTICS_CONTROL_COLUMN, ROUTER_DIAGNOSTICS_ERROR_COLUMN,
+    ROUTER_REGISTER_REGISTERS)
+from spinnman.processes import (
+    ReadRouterDiagnosticsProcess, RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class TestReadRouterDiagnosticsProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _router(self, x: int, y: int, base: int) -> None:
+        self.connection.set_memory(
+            x, y, 0xe1000000, struct.pack("<I", base + 100))
+        self.connection.set_memory(
+            x, y, 0xe1000014, struct.pack("<I", base + 200))
+        self.connection.set_memory(
+            x, y, 0xe1000300,
+            struct.pack("<16I", *range(base, base + 16)))
+
+    def test_get_router_diagnostics_all(self) -> None:
+        self._router(0, 0, 1000)
+        self._router(3, 2, 2000)
+        process = ReadRouterDiagnosticsProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        xs, ys, diagnostics = process.get_router_diagnostics_all(
+            [(0, 0), (3, 2)])
+        self.assertEqual([0, 3], xs.tolist())
+        self.assertEqual([0, 2], ys.tolist())
+        self.assertEqual((2, 18), diagnostics.shape)
+        dump_mc = ROUTER_REGISTER_REGISTERS.DUMP_MC.value
+        self.assertEqual(
+            [1000 + dump_mc, 2000 + dump_mc],
+            diagnostics[:, dump_mc].tolist())
+        self.assertEqual(
+            [1100, 2100],
+            diagnostics[:, ROUTER_DIAGNOSTICS_CONTROL_COLUMN].tolist())
+        self.assertEqual(
+            [1200, 2200],
+            diagnostics[:, ROUTER_DIAGNOSTICS_ERROR_COLUMN].tolist())
+
+        # The same as reading each chip on its own
+        single = ReadRouterDiagnosticsProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        self.assertEqual(
+            list(single.get_router_diagnostics(3, 2).registers),
+            diagnostics[1, :16].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
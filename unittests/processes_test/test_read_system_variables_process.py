@@ -0,0 +1,81 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.exceptions import SpinnmanGenericProcessException
+from spinnman.messages.scp.enums import SCPCommand
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.processes import (
+    ReadSystemVariablesProcess, RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_DRIFT = SystemVariableDefinition.clock_drift
+_X_SIZE = SystemVariableDefinition.x_size
+_IP = SystemVariableDefinition.ethernet_ip_address
+
+
+class TestReadSystemVariablesProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.xys = [(x, 0) for x in range(4)]
+        for x, y in self.xys:
+            self.connection.set_memory(
+                x, y, SYSTEM_VARIABLE_BASE_ADDRESS + _DRIFT.offset,
+                struct.pack("<i", -x))
+            self.connection.set_memory(
+                x, y, SYSTEM_VARIABLE_BASE_ADDRESS + _X_SIZE.offset,
+                bytes([8]))
+            self.connection.set_memory(
+                x, y, SYSTEM_VARIABLE_BASE_ADDRESS + _IP.offset,
+                bytes([10, 0, x, 0]))
+        self.process = ReadSystemVariablesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def test_read(self) -> None:
+        read, columns = self.process.read_system_variables(
+            self.xys, [_IP, _DRIFT, _X_SIZE])
+        self.assertTrue(read.all())
+        self.assertEqual(
+            [-x for x in range(4)], list(columns[_DRIFT].view("<i4")))
+        self.assertEqual([8, 8, 8, 8], list(columns[_X_SIZE]))
+        self.assertEqual((4, 4), columns[_IP].shape)
+        self.assertEqual([10, 0, 3, 0], list(columns[_IP][3]))
+
+        # All the variables fit in one read on each chip
+        self.assertEqual(4, self.connection.n_requests(SCPCommand.CMD_READ))
+
+    def test_unreachable(self) -> None:
+        self.connection.unreachable.add((2, 0))
+        read, columns = self.process.read_system_variables(
+            self.xys, [_IP], allow_failures=True)
+        self.assertEqual([True, True, False, True], list(read))
+        self.assertEqual([10, 0, 1, 0], list(columns[_IP][1]))
+
+        process = ReadSystemVariablesProcess(
+            RoundRobinConnectionSelector([self.connection]))
+        with self.assertRaises(SpinnmanGenericProcessException):
+            process.read_system_variables(self.xys, [_IP])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import List, Tuple
+from spinn_machine.tags import IPTag, ReverseIPTag
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.config_setup import unittest_setup
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import (
+    SetTagsProcess, RoundRobinConnectionSelector)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_SET = 1
+_CLEAR = 3
+
+
+class TestSetTagsProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connections: List[SCAMPConnection] = [
+            MockMemoryConnection(0, 0), MockMemoryConnection(4, 8)]
+        self.commands: List[Tuple[int, int, int, int, int]] = list()
+        for connection in self.connections:
+            assert isinstance(connection, MockMemoryConnection)
+            connection.handlers[SCPCommand.CMD_IPTAG] = self._iptag
+        self.process = SetTagsProcess(
+            RoundRobinConnectionSelector(self.connections))
+
+    def tearDown(self) -> None:
+        for connection in self.connections:
+            connection.close()
+
+    def _iptag(self, x: int, y: int, cpu: int,
+               args: bytes) -> Tuple[SCPResult, bytes]:
+        arg1, arg2 = struct.unpack_from("<II", args)
+        self.commands.append(
+            (x, y, (arg1 >> 16) & 0xF, arg1 & 0xFF, arg2 & 0xFFFF))
+        return SCPResult.RC_OK, b""
+
+    def test_set_tags(self) -> None:
+        ip_tag = IPTag("127.0.0.1", 0, 0, 1, "127.0.0.1", 17893)
+        reverse_ip_tag = ReverseIPTag("127.0.0.1", 2, 12345, 0, 0, 1)
+        self.process.set_tags(
+            [(connection, bytes([127, 0, 0, 1]), ip_tag)
+             for connection in self.connections],
+            [(connection, reverse_ip_tag)
+             for connection in self.connections])
+        self.assertCountEqual([
+            (0, 0, _SET, 1, 17893), (4, 8, _SET, 1, 17893),
+            (0, 0, _SET, 2, 12345), (4, 8, _SET, 2, 12345)],
+            self.commands)
+
+    def test_clear_tags(self) -> None:
+        self.process.clear_tags(
+            (connection, tag)
+            for connection in self.connections for tag in (3, 4))
+        self.assertCountEqual([
+            (0, 0, _CLEAR, 3, 0), (4, 8, _CLEAR, 3, 0),
+            (0, 0, _CLEAR, 4, 0), (4, 8, _CLEAR, 4, 0)], self.commands)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import Dict, List
+from spinn_utilities.typing.coords import XYP
+from spinn_machine import CoreSubsets
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import CPU_IOBUF_ADDRESS_OFFSET
+from spinnman.processes import RoundRobinConnectionSelector, TailIOBufProcess
+from spinnman.processes.tail_iobuf_process import IOBufTail
+from spinnman.utilities.utility_functions import get_vcpu_address
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_HEADER = struct.Struct("<I8xI")
+_BLOCK_A = 0x60000000
+_BLOCK_B = 0x60001000
+
+
+class TestTailIOBufProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.connection.set_memory(
+            0, 0, get_vcpu_address(1) + CPU_IOBUF_ADDRESS_OFFSET,
+            struct.pack("<I", _BLOCK_A))
+        self.tails: Dict[XYP, IOBufTail] = dict()
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _block(self, address: int, next_address: int, text: bytes) -> None:
+        self.connection.set_memory(
+            0, 0, address, _HEADER.pack(next_address, len(text)) + text)
+
+    def _read(self) -> List[str]:
+        core_subsets = CoreSubsets()
+        core_subsets.add_processor(0, 0, 1)
+        process = TailIOBufProcess(
+            RoundRobinConnectionSelector([self.connection]), self.tails)
+        return [iobuf.iobuf for iobuf in process.read_new_iobuf(
+            100, core_subsets)]
+
+    def test_only_new_text(self) -> None:
+        self._block(_BLOCK_A, 0, b"hello")
+        self.assertEqual(["hello"], self._read())
+        self.assertEqual([], self._read())
+
+        self._block(_BLOCK_A, 0, b"hello world")
+        self.assertEqual([" world"], self._read())
+
+        self._block(_BLOCK_A, _BLOCK_B, b"hello world")
+        self._block(_BLOCK_B, 0, b"!" * 300)
+        self.assertEqual(["!" * 300], self._read())
+        self.assertEqual(IOBufTail(_BLOCK_A, _BLOCK_B, 300),
+                         self.tails[0, 0, 1])
+
+    def test_reloaded_core(self) -> None:
+        self._block(_BLOCK_A, 0, b"first")
+        self.assertEqual(["first"], self._read())
+
+        self.connection.set_memory(
+            0, 0, get_vcpu_address(1) + CPU_IOBUF_ADDRESS_OFFSET,
+            struct.pack("<I", _BLOCK_B))
+        self._block(_BLOCK_B, 0, b"second")
+        self.assertEqual(["second"], self._read())
+
+
+if __name__ == '__main__':
+    unittest.main()
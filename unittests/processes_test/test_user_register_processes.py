@@ -0,0 +1,86 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinn_machine import CoreSubsets
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import CPU_USER_OFFSET, CPU_USER_START_ADDRESS
+from spinnman.messages.scp.enums import SCPCommand
+from spinnman.model.enums import UserRegister
+from spinnman.processes import (
+    ReadUserProcess, RoundRobinConnectionSelector, SetMemoryProcess)
+from spinnman.utilities.utility_functions import get_vcpu_address
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+def _user_address(p: int, user: int) -> int:
+    return get_vcpu_address(p) + CPU_USER_START_ADDRESS + (
+        CPU_USER_OFFSET * user)
+
+
+class TestUserRegisterProcesses(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.selector = RoundRobinConnectionSelector([self.connection])
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def test_read_users(self) -> None:
+        core_subsets = CoreSubsets()
+        for x in range(2):
+            for p in range(1, 6):
+                core_subsets.add_processor(x, 0, p)
+                self.connection.set_memory(
+                    x, 0, _user_address(p, 0), struct.pack(
+                        "<4I", *(x * 1000 + p * 10 + user
+                                 for user in range(4))))
+
+        process = ReadUserProcess(self.selector)
+        values = process.read_users(
+            core_subsets, [UserRegister.USER_2, UserRegister.USER_1])
+        for x in range(2):
+            for p in range(1, 6):
+                self.assertEqual(
+                    {UserRegister.USER_1: x * 1000 + p * 10 + 1,
+                     UserRegister.USER_2: x * 1000 + p * 10 + 2},
+                    values[x, 0, p])
+
+        # Two adjacent cores fit in each read, so three reads per chip
+        self.assertEqual(6, self.connection.n_requests(SCPCommand.CMD_READ))
+
+    def test_set_values(self) -> None:
+        values = [
+            (x, 0, _user_address(p, user), x * 1000 + p * 10 + user)
+            for x in range(2) for p in (1, 2) for user in range(4)]
+        values.append((0, 0, _user_address(1, 0), 7))
+        process = SetMemoryProcess(self.selector)
+        process.set_values(values, "Writing")
+
+        # Each core has its four registers written together
+        self.assertEqual(4, self.connection.n_requests(SCPCommand.CMD_WRITE))
+        self.assertEqual(
+            struct.pack("<4I", 7, 11, 12, 13),
+            self.connection.get_memory(0, 0, _user_address(1, 0), 16))
+        self.assertEqual(
+            struct.pack("<4I", 1020, 1021, 1022, 1023),
+            self.connection.get_memory(1, 0, _user_address(2, 0), 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
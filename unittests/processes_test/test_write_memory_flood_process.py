@@ -0,0 +1,130 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import Dict, List, Set, Tuple
+from spinnman.config_setup import unittest_setup
+from spinnman.extended import WriteMemoryFloodProcess
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.extended.write_memory_flood_process import (
+    FLOOD_WINDOW_MAX, FLOOD_WINDOW_START, MAX_FLOOD_BYTES)
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import RoundRobinConnectionSelector
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class _FloodFiller(object):
+    """
+    A SCAMP that records the flood fills it is sent, and can be busy for
+    the first attempt at some blocks.
+    """
+
+    def __init__(self, busy_blocks: Set[int]):
+        self.connection = MockMemoryConnection()
+        self.busy_blocks = set(busy_blocks)
+        self.started: List[int] = list()
+        self.ended: List[int] = list()
+        self.blocks: Dict[int, Dict[int, Tuple[int, bytes]]] = dict()
+        self.in_flight: List[int] = list()
+        self.connection.handlers[SCPCommand.CMD_NNP] = self._nnp
+        self.connection.handlers[SCPCommand.CMD_FFD] = self._data
+
+    def _nnp(self, x: int, y: int, cpu: int,
+             args: bytes) -> Tuple[SCPResult, bytes]:
+        key, = struct.unpack_from("<I", args)
+        if key >> 24 == 6:
+            self.started.append((key >> 16) & 0xFF)
+        else:
+            self.ended.append(key & 0xFF)
+        return SCPResult.RC_OK, b""
+
+    def _data(self, x: int, y: int, cpu: int,
+              args: bytes) -> Tuple[SCPResult, bytes]:
+        arg1, arg2, address = struct.unpack_from("<3I", args)
+        block_no = arg2 >> 16
+        if block_no in self.busy_blocks:
+            self.busy_blocks.remove(block_no)
+            return SCPResult.RC_P2P_BUSY, b""
+        size = (((arg2 >> 8) & 0xFF) + 1) * 4
+        self.blocks.setdefault(arg1 & 0xFF, dict())[block_no] = (
+            address, args[12:12 + size])
+        return SCPResult.RC_OK, b""
+
+
+class TestWriteMemoryFloodProcess(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_floods_together(self) -> None:
+        scamp = _FloodFiller(set())
+        process = WriteMemoryFloodProcess(
+            RoundRobinConnectionSelector([scamp.connection]))
+        datas = {1: bytes(range(256)) * 20, 2: b"\1\2\3\4" * 100,
+                 3: b"\5\6\7\x08"}
+        process.write_memory_floods([
+            (nn_id, 0x60000000 + 0x10000 * nn_id, data)
+            for nn_id, data in datas.items()])
+
+        self.assertEqual([1, 2, 3], scamp.started)
+        self.assertEqual([1, 2, 3], scamp.ended)
+        for nn_id, data in datas.items():
+            blocks = scamp.blocks[nn_id]
+            self.assertEqual(
+                data, b"".join(blocks[i][1] for i in range(len(blocks))))
+            for block_no, (address, _) in blocks.items():
+                self.assertEqual(
+                    0x60000000 + 0x10000 * nn_id + 256 * block_no, address)
+        # Every packet was answered, so the window grew
+        self.assertGreater(process.window, FLOOD_WINDOW_START)
+        self.assertLessEqual(process.window, FLOOD_WINDOW_MAX)
+        scamp.connection.close()
+
+    def test_window_shrinks_when_busy(self) -> None:
+        scamp = _FloodFiller({5})
+        process = WriteMemoryFloodProcess(
+            RoundRobinConnectionSelector([scamp.connection]))
+        data = bytes(range(256)) * 7
+        process.write_memory_floods([(4, 0x60000000, data)])
+        self.assertEqual(data, b"".join(
+            scamp.blocks[4][i][1] for i in range(7)))
+        # Windows of 3 then 4 are clean, then a resend halves the window
+        self.assertEqual(2, process.window)
+        scamp.connection.close()
+
+    def test_flood_too_big(self) -> None:
+        scamp = _FloodFiller(set())
+        process = WriteMemoryFloodProcess(
+            RoundRobinConnectionSelector([scamp.connection]))
+        # The biggest flood fits, with its blocks numbered in 8 bits
+        data = bytes(range(256)) * (MAX_FLOOD_BYTES // 256)
+        process.write_memory_floods([(4, 0x60000000, data)])
+        self.assertEqual(255, len(scamp.blocks[4]))
+        self.assertEqual(data, b"".join(
+            scamp.blocks[4][i][1] for i in range(255)))
+
+        # One more byte is refused before anything is sent
+        n_requests = len(scamp.connection.requests)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.write_memory_floods([
+                (1, 0x60000000, b"\1\2\3\4"),
+                (2, 0x60000000, bytes(MAX_FLOOD_BYTES + 1))])
+        self.assertEqual(n_requests, len(scamp.connection.requests))
+        scamp.connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
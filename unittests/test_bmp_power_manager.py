@@ -0,0 +1,94 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import time
+import unittest
+from typing import Dict, List, Tuple
+from spinnman.config_setup import unittest_setup
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import FixedConnectionSelector
+from spinnman.transceiver.bmp_power_manager import BMPPowerManager
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+
+class _BMP(object):
+    """
+    A BMP whose FPGAs on each board only answer after a number of reads.
+    """
+
+    def __init__(self, n_not_ready: Dict[int, int]):
+        self.connection = MockMemoryConnection()
+        self.n_not_ready = dict(n_not_ready)
+        self.power: List[int] = list()
+        self.connection.handlers[SCPCommand.CMD_BMP_POWER] = self._power
+        self.connection.handlers[SCPCommand.CMD_LINK_READ] = self._read
+
+    def _power(self, x: int, y: int, cpu: int,
+               args: bytes) -> Tuple[SCPResult, bytes]:
+        arg1, = struct.unpack_from("<I", args)
+        self.power.append(arg1 & 0x1)
+        return SCPResult.RC_OK, b""
+
+    def _read(self, x: int, y: int, cpu: int,
+              args: bytes) -> Tuple[SCPResult, bytes]:
+        if self.n_not_ready.get(cpu, 0) > 0:
+            self.n_not_ready[cpu] -= 1
+            return SCPResult.RC_ARG, b""
+        return SCPResult.RC_OK, struct.pack("<I", 0x1234)
+
+
+class TestBMPPowerManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_power_on_waits_for_fpgas(self) -> None:
+        # Board 1 needs two rounds of reads of its three FPGAs
+        bmp = _BMP({1: 4})
+        manager = BMPPowerManager(
+            FixedConnectionSelector(bmp.connection), [0, 1])
+        self.assertTrue(manager.power_on())
+        self.assertEqual([1], bmp.power)
+        # 6 reads in the first round, then 3 a round for board 1 only
+        self.assertEqual(
+            6 + 3 + 3, bmp.connection.n_requests(SCPCommand.CMD_LINK_READ))
+        bmp.connection.close()
+
+    def test_power_on_fpgas_not_answering(self) -> None:
+        bmp = _BMP({0: 1000})
+        manager = BMPPowerManager(
+            FixedConnectionSelector(bmp.connection), [0],
+            power_on_wait=0.2)
+        start = time.monotonic()
+        self.assertFalse(manager.power_on())
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual([1], bmp.power)
+        bmp.connection.close()
+
+    def test_power_off_waits(self) -> None:
+        bmp = _BMP({})
+        manager = BMPPowerManager(
+            FixedConnectionSelector(bmp.connection), [0],
+            power_cycle_wait=0.2)
+        start = time.monotonic()
+        manager.power_off()
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual([0], bmp.power)
+        bmp.connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
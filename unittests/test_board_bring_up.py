@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from typing import List, Tuple
+from spinnman.config_setup import unittest_setup
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import FixedConnectionSelector
+from spinnman.transceiver.board_bring_up import (
+    BoardBringUp, check_connections, wait_for_scamp)
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_VERSION = struct.Struct("<BBBBHHI")
+
+
+class _Board(object):
+    """
+    The SCAMP of a board, which starts answering with its coordinates
+    after a number of requests for its version.
+    """
+
+    def __init__(self, x: int, y: int, ip: Tuple[int, int, int, int],
+                 n_not_ready: int):
+        self.connection = MockMemoryConnection(x, y)
+        self.x = x
+        self.y = y
+        self.ip = ip
+        self.n_not_ready = n_not_ready
+        self.tto: List[int] = list()
+        self.connection.handlers[SCPCommand.CMD_VER] = self._version
+        self.connection.handlers[SCPCommand.CMD_IPTAG] = self._iptag
+        self.connection.handlers[SCPCommand.CMD_INFO] = self._info
+
+    def _version(self, x: int, y: int, cpu: int,
+                 args: bytes) -> Tuple[SCPResult, bytes]:
+        if self.n_not_ready > 0:
+            self.n_not_ready -= 1
+            x, y = 255, 255
+        else:
+            x, y = self.x, self.y
+        return SCPResult.RC_OK, _VERSION.pack(
+            0, 0, y, x, 0, 0xFFFF, 0) + b"SC&MP/SpiNNaker\x004.0.0\x00"
+
+    def _iptag(self, x: int, y: int, cpu: int,
+               args: bytes) -> Tuple[SCPResult, bytes]:
+        arg1, = struct.unpack_from("<I", args)
+        self.tto.append(arg1 & 0xFF)
+        return SCPResult.RC_OK, bytes([arg1 & 0xFF, 0, 4, 0])
+
+    def _info(self, x: int, y: int, cpu: int,
+              args: bytes) -> Tuple[SCPResult, bytes]:
+        return SCPResult.RC_OK, (
+            struct.pack("<3I", (1 << 25) | 18, 0, 0) + bytes(18) +
+            bytes([self.y, self.x]) + bytes(self.ip))
+
+
+class TestBoardBringUp(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_bring_up(self) -> None:
+        boards = [_Board(0, 0, (10, 0, 0, 1), 0),
+                  _Board(4, 8, (10, 0, 0, 2), 2)]
+        timelines = BoardBringUp(
+            [board.connection for board in boards]).run()
+        self.assertEqual(2, len(timelines))
+        for board, timeline in zip(boards, timelines):
+            self.assertIs(board.connection, timeline.connection)
+            self.assertEqual(1, len(board.tto))
+            assert timeline.version_ready is not None
+            assert timeline.tto_set is not None
+            assert timeline.checked is not None
+            self.assertLessEqual(timeline.version_ready, timeline.tto_set)
+            self.assertLessEqual(timeline.tto_set, timeline.checked)
+            assert timeline.chip_info is not None
+            self.assertEqual(
+                ".".join(str(i) for i in board.ip),
+                timeline.chip_info.ethernet_ip_address)
+
+        # The board that was slow to answer took longer
+        first, second = timelines
+        assert first.version_ready is not None
+        assert second.version_ready is not None
+        self.assertLess(first.version_ready, second.version_ready)
+        self.assertEqual(
+            3, boards[1].connection.n_requests(SCPCommand.CMD_VER))
+        for board in boards:
+            board.connection.close()
+
+    def test_wait_for_scamp(self) -> None:
+        board = _Board(0, 0, (10, 0, 0, 1), 3)
+        self.assertTrue(wait_for_scamp(
+            FixedConnectionSelector(board.connection), sleep_first=True))
+        self.assertEqual(4, board.connection.n_requests(SCPCommand.CMD_VER))
+        board.connection.close()
+
+    def test_check_connections(self) -> None:
+        boards = [_Board(x, 0, (10, 0, 0, x + 1), 0) for x in range(3)]
+        boards[1].connection.unreachable.add((1, 0))
+        chip_infos = check_connections(
+            [board.connection for board in boards])
+        self.assertIsNone(chip_infos[1])
+        for index in (0, 2):
+            chip_info = chip_infos[index]
+            assert chip_info is not None
+            self.assertEqual(
+                f"10.0.0.{index + 1}", chip_info.ethernet_ip_address)
+        for board in boards:
+            board.connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
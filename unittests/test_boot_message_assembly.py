@@ -12,10 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import unittest
+from typing import List
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
 import spinnman.messages.spinnaker_boot.spinnaker_boot_message as boot_msg
 from spinnman.config_setup import unittest_setup
-from spinnman.messages.spinnaker_boot import SpinnakerBootOpCode
+from spinnman.connections.udp_packet_connections import BootConnection
+from spinnman.messages.spinnaker_boot import (
+    SpinnakerBootMessages, SpinnakerBootOpCode, SystemVariableDefinition)
+
+
+class _RecordingBootConnection(BootConnection):
+    __slots__ = ("sent", )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: List[float] = list()
+
+    @overrides(BootConnection.send)
+    def send(self, data: bytes) -> None:
+        self.sent.append(time.monotonic())
 
 
 class TestSpiNNakerBootMessage(unittest.TestCase):
@@ -31,6 +49,38 @@ class TestSpiNNakerBootMessage(unittest.TestCase):
         self.assertEqual(msg.operand_2, 0)
         self.assertEqual(msg.operand_3, 0)
 
+    def test_boot_messages(self) -> None:
+        set_config("Machine", "version", "5")
+        messages1 = list(SpinnakerBootMessages(
+            {SystemVariableDefinition.led_0: 1}).messages)
+        messages2 = list(SpinnakerBootMessages(
+            {SystemVariableDefinition.led_0: 2}).messages)
+        self.assertEqual(len(messages1), len(messages2))
+        self.assertEqual(
+            SpinnakerBootOpCode.FLOOD_FILL_START, messages1[0].opcode)
+        self.assertEqual(len(messages1) - 3, messages1[0].operand_3)
+
+        # Only the block holding the boot values is different
+        self.assertNotEqual(
+            messages1[1].bytestring, messages2[1].bytestring)
+        for message1, message2 in zip(messages1[2:-1], messages2[2:-1]):
+            self.assertIs(message1, message2)
+
+    def test_send_boot_messages(self) -> None:
+        connection = _RecordingBootConnection()
+        message = boot_msg.SpinnakerBootMessage(
+            SpinnakerBootOpCode.HELLO, 0, 0, 0)
+        start = time.monotonic()
+        connection.send_boot_messages([message] * 5, packet_delay=0.02)
+        end = time.monotonic()
+        self.assertEqual(5, len(connection.sent))
+        for before, after in zip(connection.sent, connection.sent[1:]):
+            self.assertGreaterEqual(after - before, 0.015)
+
+        # No wait after the last message
+        self.assertLess(end - start, 0.02 * 5)
+        connection.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import unittest
 import struct
+from typing import Callable, List, Tuple
 
 from spinn_utilities.config_holder import set_config
 
+from spinn_machine import (
+    CoreSubset, CoreSubsets, MulticastRoutingEntry, RoutingEntry,
+    virtual_machine)
 from spinn_machine.version.version_strings import VersionStrings
 
 from spinnman.config_setup import unittest_setup
@@ -25,12 +30,27 @@ from spinnman.data.spinnman_data_writer import SpiNNManDataWriter
 from spinnman.transceiver import (
     create_transceiver_from_connections, create_transceiver_from_hostname,
     MockableTransceiver)
+from spinnman.transceiver.base_transceiver import _poll_interval
+from spinnman.transceiver.bmp_power_manager import BMPPowerManager
+from spinnman.transceiver.sdp_fan_out import fan_out_sdp_messages
+from spinnman.processes import FixedConnectionSelector
 from spinnman.extended.extended_transceiver import ExtendedTransceiver
 from spinnman import constants
+from spinnman.exceptions import (
+    SpinnmanException, SpinnmanInvalidParameterException)
+from spinnman.model.enums import CPUState
+from spinnman.utilities.utility_functions import get_vcpu_address
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
 from spinnman.messages.spinnaker_boot.system_variable_boot_values import (
     SystemVariableDefinition)
+from spinnman.connections import ConnectionListener
 from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.sdp import SDPFlag, SDPHeader, SDPMessage
 from spinnman.board_test_configuration import BoardTestConfiguration
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_BASE_LOGGER = "spinnman.transceiver.base_transceiver"
 
 
 class MockExtendedTransceiver(MockableTransceiver, ExtendedTransceiver):
@@ -40,6 +60,44 @@ class MockExtendedTransceiver(MockableTransceiver, ExtendedTransceiver):
         return None
 
 
+class SDPRecordingConnection(MockMemoryConnection):
+    """
+    A connection that records the SDP messages sent through it.
+    """
+
+    def __init__(self, chip_x: int = 0, chip_y: int = 0):
+        super().__init__(chip_x, chip_y)
+        self.sdp_messages: List[SDPMessage] = list()
+
+    def send_sdp_message(self, sdp_message: SDPMessage) -> None:
+        self.sdp_messages.append(sdp_message)
+
+
+class RecordingListener(ConnectionListener[SDPMessage]):
+    """
+    A listener, never started, that records the callbacks added to it.
+    """
+
+    def __init__(self, connection: SCAMPConnection):
+        super().__init__(connection)  # type: ignore[arg-type]
+        self.callbacks: List[Callable[[SDPMessage], None]] = list()
+
+    def add_callback(self, callback: Callable[[SDPMessage], None]) -> None:
+        self.callbacks.append(callback)
+
+    def remove_callback(
+            self, callback: Callable[[SDPMessage], None]) -> None:
+        self.callbacks.remove(callback)
+
+    def receive(self) -> None:
+        """
+        Pretend that a message has arrived.
+        """
+        message = SDPMessage(SDPHeader(SDPFlag.REPLY_NOT_EXPECTED))
+        for callback in list(self.callbacks):
+            callback(message)
+
+
 class TestTransceiver(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -113,6 +171,391 @@ class TestTransceiver(unittest.TestCase):
                 assert written_memory[write_item][3] == expected_data
                 write_item += 1
 
+    def test_update_multicast_routes(self) -> None:
+        set_config("Machine", "version", "5")
+        connection = MockMemoryConnection()
+        allocs: List[Tuple[int, int, int]] = list()
+
+        def alloc(x: int, y: int, p: int,
+                  args: bytes) -> Tuple[SCPResult, bytes]:
+            app_alloc, n_entries = struct.unpack_from("<II", args)
+            allocs.append((x, y, app_alloc >> 8))
+            return SCPResult.RC_OK, struct.pack("<I", 1)
+
+        connection.handlers[SCPCommand.CMD_ALLOC] = alloc
+        connection.handlers[SCPCommand.CMD_RTR] = (
+            lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        trans = create_transceiver_from_connections([connection])
+
+        def routes(n: int, route: int = 1) -> List[MulticastRoutingEntry]:
+            return [MulticastRoutingEntry(
+                key, 0xFFFFFFFF, RoutingEntry(spinnaker_route=route))
+                for key in range(n)]
+
+        trans.load_multicast_routes_multi(
+            {(0, 0): routes(3), (1, 0): routes(5)}, 30)
+        n_requests = len(connection.requests)
+
+        # Nothing has changed so nothing is sent
+        self.assertEqual([], trans.update_multicast_routes(
+            {(0, 0): routes(3), (1, 0): routes(5)}, 30))
+        self.assertEqual(n_requests, len(connection.requests))
+
+        # Only the changed chip is reloaded
+        allocs.clear()
+        self.assertEqual([(1, 0)], trans.update_multicast_routes(
+            {(0, 0): routes(3), (1, 0): routes(5, route=2)}, 30))
+        self.assertEqual([(1, 0, 30)], allocs)
+
+        # Other applications on a reloaded chip are reloaded too
+        trans.load_multicast_routes(0, 0, routes(2), 31)
+        allocs.clear()
+        self.assertEqual([(0, 0)], trans.update_multicast_routes(
+            {(0, 0): routes(4)}, 30))
+        self.assertCountEqual([(0, 0, 30), (0, 0, 31)], allocs)
+
+        # An unknown chip is always loaded, with a warning that other
+        # routes on it are lost; a cleared one is known empty
+        with self.assertLogs(_BASE_LOGGER, "WARNING") as logs:
+            self.assertEqual([(2, 0)], trans.update_multicast_routes(
+                {(2, 0): routes(1)}, 30))
+        self.assertIn("1 chips, such as [(2, 0)]", logs.output[0])
+        trans.clear_multicast_routes((2, 0))
+        self.assertEqual([], trans.update_multicast_routes(
+            {(2, 0): []}, 30))
+        with self.assertNoLogs(_BASE_LOGGER, "WARNING"):
+            self.assertEqual([(2, 0)], trans.update_multicast_routes(
+                {(2, 0): routes(2)}, 30))
+
+        # Stopping an application frees its routes
+        connection.handlers[SCPCommand.CMD_NNP] = (
+            lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        trans.stop_application(30)
+        self.assertEqual([(1, 0)], trans.update_multicast_routes(
+            {(1, 0): routes(5, route=2)}, 30))
+
+        # A chip that failed to load is no longer known
+        connection.handlers[SCPCommand.CMD_ALLOC] = (
+            lambda x, y, p, args: (SCPResult.RC_OK, struct.pack("<I", 0)))
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            trans.load_multicast_routes(1, 0, routes(2), 30)
+        connection.handlers[SCPCommand.CMD_ALLOC] = alloc
+        self.assertEqual([(1, 0)], trans.update_multicast_routes(
+            {(1, 0): routes(5, route=2)}, 30))
+        trans.close()
+
+    def test_execute_flood_reuses_executable(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        connection = MockMemoryConnection()
+        for command in (SCPCommand.CMD_AR, SCPCommand.CMD_APP_COPY_RUN):
+            connection.handlers[command] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        trans = create_transceiver_from_connections([connection])
+        core_subsets = CoreSubsets([CoreSubset(0, 0, [1, 2])])
+        executable = bytes(range(256)) * 10
+
+        def n_writes() -> int:
+            return connection.n_requests(SCPCommand.CMD_WRITE)
+
+        trans.execute_flood(core_subsets, executable, 30)
+        n_first = n_writes()
+        self.assertGreater(n_first, 0)
+        self.assertEqual(executable, connection.get_memory(
+            0, 0, 0x67800000, len(executable)))
+
+        # The same executable is not sent again
+        trans.execute_flood(core_subsets, executable, 31)
+        self.assertEqual(n_first, n_writes())
+
+        # A write over the executable means it must be sent again
+        trans.write_memory(0, 0, 0x67800100, b"\0\0\0\0")
+        n_before = n_writes()
+        trans.execute_flood(core_subsets, executable, 32)
+        self.assertEqual(n_before + n_first, n_writes())
+
+        # A different executable is sent
+        trans.execute_flood(core_subsets, executable[:-4], 33)
+        self.assertEqual(n_before + 2 * n_first, n_writes())
+        trans.close()
+
+    def test_execute_flood_after_routes_loaded(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        connection = MockMemoryConnection()
+        for command in (SCPCommand.CMD_AR, SCPCommand.CMD_APP_COPY_RUN,
+                        SCPCommand.CMD_RTR):
+            connection.handlers[command] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        connection.handlers[SCPCommand.CMD_ALLOC] = (
+            lambda x, y, p, args: (SCPResult.RC_OK, struct.pack("<I", 1)))
+        trans = create_transceiver_from_connections([connection])
+        core_subsets = CoreSubsets([CoreSubset(0, 0, [1])])
+        executable = bytes(range(256)) * 10
+        trans.execute_flood(core_subsets, executable, 30)
+
+        # The routing table is staged where the executable was
+        trans.load_multicast_routes(0, 0, [MulticastRoutingEntry(
+            0x100, 0xFFFFFF00, RoutingEntry(
+                processor_ids=[1], link_ids=[]))], 30)
+        n_writes = connection.n_requests(SCPCommand.CMD_WRITE)
+        trans.execute_flood(core_subsets, executable, 30)
+        self.assertGreater(
+            connection.n_requests(SCPCommand.CMD_WRITE), n_writes)
+        self.assertEqual(executable, connection.get_memory(
+            0, 0, 0x67800000, len(executable)))
+        trans.close()
+
+    def test_get_new_iobuf_after_reload(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        connection = MockMemoryConnection()
+        for command in (SCPCommand.CMD_AR, SCPCommand.CMD_APP_COPY_RUN,
+                        SCPCommand.CMD_NNP):
+            connection.handlers[command] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        trans = create_transceiver_from_connections([connection])
+        core_subsets = CoreSubsets([CoreSubset(0, 0, [1])])
+        connection.set_memory(
+            0, 0, get_vcpu_address(1) + constants.CPU_IOBUF_ADDRESS_OFFSET,
+            struct.pack("<I", 0x60000000))
+
+        def iobuf(text: bytes) -> List[str]:
+            connection.set_memory(
+                0, 0, 0x60000000, struct.pack("<I8xI", 0, len(text)) + text)
+            return [buf.iobuf for buf in trans.get_new_iobuf(core_subsets)]
+
+        self.assertEqual(["first run"], iobuf(b"first run"))
+        # The reloaded core writes its IOBUF at the same address
+        trans.execute_flood(core_subsets, bytes(1024), 30)
+        self.assertEqual(["second"], iobuf(b"second"))
+        trans.stop_application(30)
+        self.assertEqual(["third run"], iobuf(b"third run"))
+        trans.close()
+
+    def test_get_cpu_infos_of_app(self) -> None:
+        set_config("Machine", "version", "5")
+        machine = virtual_machine(12, 12)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connections = [
+            MockMemoryConnection(chip.x, chip.y)
+            for chip in machine.ethernet_connected_chips]
+        # Only the first board has cores of the application running
+        running = {(0, 0): 2}
+        for connection in connections:
+            connection.handlers[SCPCommand.CMD_COUNT] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, struct.pack(
+                    "<I", running.get((x, y), 0))))
+        trans = create_transceiver_from_connections(list(connections))
+        core_subsets = CoreSubsets([
+            CoreSubset(chip.x, chip.y, [1]) for chip in machine.chips])
+
+        trans.get_cpu_infos(core_subsets, CPUState.RUNNING, app_id=30)
+        # Each board is counted once, and only the first one is read
+        for connection in connections:
+            self.assertEqual(
+                1, connection.n_requests(SCPCommand.CMD_COUNT))
+            n_reads = connection.n_requests(SCPCommand.CMD_READ)
+            if (connection.chip_x, connection.chip_y) == (0, 0):
+                self.assertGreater(n_reads, 0)
+            else:
+                self.assertEqual(0, n_reads)
+
+        # Nothing is read when no board has a core in the state
+        running.clear()
+        n_reads = sum(connection.n_requests(SCPCommand.CMD_READ)
+                      for connection in connections)
+        self.assertEqual(0, len(trans.get_cpu_infos(
+            core_subsets, CPUState.RUNNING, app_id=30)))
+        self.assertEqual(n_reads, sum(
+            connection.n_requests(SCPCommand.CMD_READ)
+            for connection in connections))
+        trans.close()
+
+    def test_execute_flood_seeds_each_board(self) -> None:
+        set_config("Machine", "version", "5")
+        set_config("Machine", "seed_executable_per_board", "True")
+        machine = virtual_machine(12, 12)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connections = [
+            MockMemoryConnection(chip.x, chip.y)
+            for chip in machine.ethernet_connected_chips]
+        copied: List[Tuple[int, int]] = list()
+        for connection in connections:
+            connection.handlers[SCPCommand.CMD_AR] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, b""))
+
+            def copy_run(x: int, y: int, p: int,
+                         args: bytes) -> Tuple[SCPResult, bytes]:
+                copied.append((x, y))
+                return SCPResult.RC_OK, b""
+            connection.handlers[SCPCommand.CMD_APP_COPY_RUN] = copy_run
+        trans = create_transceiver_from_connections(list(connections))
+        executable = bytes(range(256)) * 10
+        core_subsets = CoreSubsets([
+            CoreSubset(connection.chip_x, connection.chip_y, [1])
+            for connection in connections])
+        trans.execute_flood(core_subsets, executable, 30)
+
+        # Each board has the executable written to its Ethernet chip over
+        # its own connection, and then runs it there
+        for connection in connections:
+            x, y = connection.chip_x, connection.chip_y
+            self.assertEqual(executable, connection.get_memory(
+                x, y, 0x67800000, len(executable)))
+            self.assertEqual(1, connection.n_requests(SCPCommand.CMD_AR))
+        # Everything else is copied to
+        self.assertCountEqual(
+            [(chip.x, chip.y) for chip in machine.chips
+             if chip.ip_address is None], copied)
+        trans.close()
+
+    def test_execute_flood_multi(self) -> None:
+        set_config("Machine", "version", "5")
+        machine = virtual_machine(8, 8)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connection = MockMemoryConnection()
+        for command in (SCPCommand.CMD_AR, SCPCommand.CMD_APP_COPY_RUN):
+            connection.handlers[command] = (
+                lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        trans = create_transceiver_from_connections([connection])
+        core_subsets = CoreSubsets([CoreSubset(0, 0, [1])])
+        first = bytes(range(256)) * 10
+        last = bytes(range(256)) * 4
+        trans.execute_flood_multi(
+            [(core_subsets, first), (core_subsets, last)], 30)
+        n_writes = connection.n_requests(SCPCommand.CMD_WRITE)
+
+        # Each executable is copied to every other chip
+        self.assertEqual(
+            2 * (machine.n_chips - 1),
+            connection.n_requests(SCPCommand.CMD_APP_COPY_RUN))
+        self.assertEqual(2, connection.n_requests(SCPCommand.CMD_AR))
+        self.assertEqual(last, connection.get_memory(
+            0, 0, 0x67800000, len(last)))
+
+        # Only the last is left to reuse
+        trans.execute_flood(core_subsets, last, 31)
+        self.assertEqual(
+            n_writes, connection.n_requests(SCPCommand.CMD_WRITE))
+        trans.execute_flood(core_subsets, first, 32)
+        self.assertLess(
+            n_writes, connection.n_requests(SCPCommand.CMD_WRITE))
+        trans.close()
+
+    def test_update_provenance_and_exit_multi(self) -> None:
+        set_config("Machine", "version", "5")
+        machine = virtual_machine(12, 12)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        connections = [
+            SDPRecordingConnection(chip.x, chip.y)
+            for chip in machine.ethernet_connected_chips]
+        trans = create_transceiver_from_connections(list(connections))
+        core_subsets = CoreSubsets([
+            CoreSubset(chip.x, chip.y, range(1, 17))
+            for chip in machine.chips])
+        trans.update_provenance_and_exit_multi(core_subsets)
+
+        # Each core is sent one message, through its own board
+        sent = list()
+        for connection in connections:
+            for message in connection.sdp_messages:
+                header = message.sdp_header
+                x, y = header.destination_chip_x, header.destination_chip_y
+                self.assertEqual(
+                    (connection.chip_x, connection.chip_y),
+                    (machine[x, y].nearest_ethernet_x,
+                     machine[x, y].nearest_ethernet_y))
+                sent.append((x, y, header.destination_cpu))
+        self.assertCountEqual(
+            [(chip.x, chip.y, p) for chip in machine.chips
+             for p in range(1, 17)], sent)
+        trans.close()
+
+    def test_fan_out_nothing_or_nowhere(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        connection = SDPRecordingConnection()
+        trans = create_transceiver_from_connections([connection])
+        trans.update_provenance_and_exit_multi(CoreSubsets())
+        self.assertEqual([], connection.sdp_messages)
+        trans.close()
+
+        # Nothing to send needs no connections
+        fan_out_sdp_messages([], [])
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            fan_out_sdp_messages([], [SDPMessage(SDPHeader(
+                SDPFlag.REPLY_NOT_EXPECTED, destination_cpu=1))])
+
+    def test_power_on_boards_not_answering(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        bmp = MockMemoryConnection()
+        bmp.handlers[SCPCommand.CMD_BMP_POWER] = (
+            lambda x, y, p, args: (SCPResult.RC_OK, b""))
+        bmp.handlers[SCPCommand.CMD_LINK_READ] = (
+            lambda x, y, p, args: (SCPResult.RC_ARG, b""))
+        trans = create_transceiver_from_connections([MockMemoryConnection()])
+        trans._power_manager = BMPPowerManager(  # type: ignore[attr-defined]
+            FixedConnectionSelector(bmp), [0], power_on_wait=0.2)
+        # The boot goes ahead, with only a warning, as before the wait
+        trans._power_on_machine()  # type: ignore[attr-defined]
+        self.assertEqual(1, bmp.n_requests(SCPCommand.CMD_BMP_POWER))
+        trans.close()
+        bmp.close()
+
+    def test_poll_interval(self) -> None:
+        # The wait shrinks as cores reach the target, down to a floor
+        self.assertAlmostEqual(1.0, _poll_interval(1.0, 0, 10))
+        self.assertAlmostEqual(0.5, _poll_interval(1.0, 5, 10))
+        self.assertAlmostEqual(0.2, _poll_interval(1.0, 8, 10))
+        self.assertAlmostEqual(0.1, _poll_interval(1.0, 10, 10))
+        self.assertAlmostEqual(0.1, _poll_interval(1.0, 12, 10))
+        # Nothing to wait for
+        self.assertAlmostEqual(1.0, _poll_interval(1.0, 0, 0))
+
+    def test_wait_for_cores_woken_by_listener(self) -> None:
+        set_config("Machine", "version", "5")
+        SpiNNManDataWriter.mock().set_machine(virtual_machine(8, 8))
+        connection = MockMemoryConnection()
+        listener = RecordingListener(connection)
+        n_counts = [0]
+
+        def count(x: int, y: int, p: int,
+                  args: bytes) -> Tuple[SCPResult, bytes]:
+            _app_id, state = struct.unpack_from("<II", args)
+            if CPUState(state) != CPUState.READY:
+                return SCPResult.RC_OK, struct.pack("<I", 0)
+            n_counts[0] += 1
+            if n_counts[0] == 1:
+                # A core reports it has changed state while still counting
+                self.assertEqual(1, len(listener.callbacks))
+                listener.receive()
+                return SCPResult.RC_OK, struct.pack("<I", 0)
+            return SCPResult.RC_OK, struct.pack("<I", 2)
+        connection.handlers[SCPCommand.CMD_COUNT] = count
+        trans = create_transceiver_from_connections([connection])
+        core_subsets = CoreSubsets([CoreSubset(0, 0, [1, 2])])
+
+        # The wait is cut short by the message rather than the poll time
+        start = time.time()
+        trans.wait_for_cores_to_be_in_state(
+            core_subsets, 30, CPUState.READY, time_between_polls=60,
+            state_change_listener=listener)
+        self.assertLess(time.time() - start, 30)
+        self.assertEqual(2, n_counts[0])
+        self.assertEqual([], listener.callbacks)
+
+        # The callback is removed even if the count fails
+        connection.handlers[SCPCommand.CMD_COUNT] = (
+            lambda x, y, p, args: (SCPResult.RC_ARG, b""))
+        with self.assertRaises(SpinnmanException):
+            trans.wait_for_cores_to_be_in_state(
+                core_subsets, 30, CPUState.READY,
+                state_change_listener=listener)
+        self.assertEqual([], listener.callbacks)
+        trans.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,116 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import time
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import ROUTER_REGISTER_REGISTERS
+from spinnman.processes import RoundRobinConnectionSelector
+from spinnman.utilities.router_counter_sampler import RouterCounterSampler
+from unittests.processes_test.mock_memory_connection import (
+    MockMemoryConnection)
+
+_DUMP_MC = ROUTER_REGISTER_REGISTERS.DUMP_MC.value
+
+
+class TestRouterCounterSampler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.connection = MockMemoryConnection()
+        self.dumped = {(0, 0): 0, (1, 0): 0xFFFFFFF0}
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def _set_counters(self) -> None:
+        for (x, y), dumped in self.dumped.items():
+            counters = [0] * 16
+            counters[_DUMP_MC] = dumped
+            self.connection.set_memory(
+                x, y, 0xe1000300, struct.pack("<16I", *counters))
+
+    def test_samples(self) -> None:
+        sampler = RouterCounterSampler(
+            RoundRobinConnectionSelector([self.connection]),
+            [(0, 0), (1, 0)], n_samples=2)
+        self.assertEqual((2, 16), sampler.rates().shape)
+        self.assertEqual(0, sampler.peaks().max())
+
+        self._set_counters()
+        sampler.sample()
+        for increase in (10, 20, 40):
+            for xy in self.dumped:
+                self.dumped[xy] = (self.dumped[xy] + increase) & 0xFFFFFFFF
+            self._set_counters()
+            time.sleep(0.01)
+            sampler.sample()
+
+        # Only the last two changes are kept, and wrapping is handled
+        deltas, periods = sampler.deltas()
+        self.assertEqual(
+            [[20, 20], [40, 40]], deltas[:, :, _DUMP_MC].tolist())
+        self.assertEqual(2, len(periods))
+        rates = sampler.rates()
+        peaks = sampler.peaks()
+        self.assertEqual(rates[0, _DUMP_MC], rates[1, _DUMP_MC])
+        self.assertAlmostEqual(
+            60 / periods.sum(), rates[0, _DUMP_MC])
+        self.assertGreater(peaks[0, _DUMP_MC], rates[0, _DUMP_MC] * 0.99)
+        self.assertEqual(0, rates[0, 0])
+
+    def test_cleared(self) -> None:
+        sampler = RouterCounterSampler(
+            RoundRobinConnectionSelector([self.connection]),
+            [(0, 0), (1, 0)])
+        self.dumped = {(0, 0): 1000, (1, 0): 0xFFFFFFF0}
+        self._set_counters()
+        sampler.sample()
+
+        # The first chip is cleared and counts 5 more, while the second
+        # wraps
+        self.dumped = {(0, 0): 5, (1, 0): 0x10}
+        self._set_counters()
+        sampler.sample()
+        deltas, _ = sampler.deltas()
+        self.assertEqual([[5, 0x20]], deltas[:, :, _DUMP_MC].tolist())
+
+        # A counter that falls from near the top to the middle of its range
+        # was cleared too
+        self.dumped = {(0, 0): 0xFFFFFFF0, (1, 0): 0x20}
+        self._set_counters()
+        sampler.sample()
+        self.dumped = {(0, 0): 0x80000000, (1, 0): 0x30}
+        self._set_counters()
+        sampler.sample()
+        deltas, _ = sampler.deltas()
+        self.assertEqual(
+            [0x80000000, 0x10], deltas[-1, :, _DUMP_MC].tolist())
+
+    def test_thread(self) -> None:
+        self._set_counters()
+        sampler = RouterCounterSampler(
+            RoundRobinConnectionSelector([self.connection]),
+            [(0, 0)], interval=0.01)
+        sampler.start()
+        time.sleep(0.1)
+        sampler.close()
+        self.assertFalse(sampler.is_alive())
+        deltas, _ = sampler.deltas()
+        self.assertGreater(len(deltas), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()